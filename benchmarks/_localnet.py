@@ -0,0 +1,51 @@
+"""Shared setup for benchmarks that talk to a network (LocalNet by default)."""
+import math
+from pathlib import Path
+
+import algokit_utils
+from dotenv import load_dotenv
+
+# Opcode budget granted to every app call in a group
+APP_CALL_BUDGET = 700
+
+
+def algorand_and_sender() -> tuple[algokit_utils.AlgorandClient, str]:
+    """AlgorandClient from ALGOD_* env vars plus the DEPLOYER account address"""
+    load_dotenv()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+    return algorand, deployer.address
+
+
+def app_client(
+    algorand: algokit_utils.AlgorandClient, app_spec: Path, app_id: int, sender: str
+) -> algokit_utils.AppClient:
+    """Untyped client for an app, built from its compiled `*.arc56.json`"""
+    return algokit_utils.AppClient(
+        algokit_utils.AppClientParams(
+            algorand=algorand,
+            app_spec=algokit_utils.Arc56Contract.from_json(app_spec.read_text()),
+            app_id=app_id,
+            default_sender=sender,
+        )
+    )
+
+
+def simulate_group(composer: algokit_utils.TransactionComposer) -> dict:
+    """Simulate a group with a generous budget and return algod's group result"""
+    result = composer.simulate(
+        allow_unnamed_resources=True,
+        skip_signatures=True,
+        extra_opcode_budget=APP_CALL_BUDGET * 16 * 10,
+    )
+    return result.simulate_response["txn-groups"][0]
+
+
+def budget_consumed(composer: algokit_utils.TransactionComposer) -> int:
+    """Opcode budget the group consumes, measured by simulating it"""
+    return simulate_group(composer)["app-budget-consumed"]
+
+
+def app_calls_needed(budget: int) -> int:
+    """App calls a group must contain to pool at least `budget` opcodes"""
+    return max(1, math.ceil(budget / APP_CALL_BUDGET))
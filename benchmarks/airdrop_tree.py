@@ -0,0 +1,51 @@
+"""Time and peak memory of building an airdrop Merkle tree and all its proofs.
+
+Entries are generated on the fly and never held in a list, so peak memory
+reflects the builder's chunking rather than the recipient count.
+
+Run with ``python -m benchmarks.airdrop_tree [entries] [work_dir]``.
+"""
+import random
+import resource
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from algosdk import encoding
+
+from smart_contracts.offchain.airdrop import AirdropEntry, build_tree, verify_proof, write_proofs
+
+DEFAULT_ENTRIES = 1_000_000
+
+
+def synthetic_entries(count: int) -> Iterator[AirdropEntry]:
+    rng = random.Random(0)
+    for _ in range(count):
+        yield AirdropEntry(encoding.encode_address(rng.randbytes(32)), rng.randrange(1, 10**9))
+
+
+def main(count: int = DEFAULT_ENTRIES, work_dir: Path | None = None) -> None:
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = work_dir or Path(scratch)
+
+        start = time.perf_counter()
+        tree = build_tree(synthetic_entries(count), directory / "tree")
+        built = time.perf_counter()
+        written = write_proofs(tree, synthetic_entries(count), directory / "proofs.jsonl")
+        proved = time.perf_counter()
+
+        last = count - 1
+        entry = next(e for i, e in enumerate(synthetic_entries(count)) if i == last)
+        assert verify_proof(tree.root, last, entry.address, entry.amount, tree.proof(last))
+
+        peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{count:,} leaves, depth {tree.depth}, root {tree.root.hex()}")
+        print(f"tree:   {built - start:.2f}s")
+        print(f"proofs: {proved - built:.2f}s ({written:,} written)")
+        print(f"peak RSS: {peak_mib:,.0f} MiB")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]), *map(Path, sys.argv[2:3]))
@@ -0,0 +1,45 @@
+"""Opcode budget of `EmotionFactory.create_emotions` against group size.
+
+Each batch is simulated (nothing is created) with a generous extra
+budget, then the measured cost is turned into the app calls a real group
+needs. The group must also provide one inner transaction slot per ASA,
+16 per app call.
+
+Run with ``python -m benchmarks.create_emotions <EmotionFactory app_id>``.
+"""
+import sys
+
+from benchmarks._localnet import algorand_and_sender, app_calls_needed, simulate_group
+from smart_contracts.offchain.emotions import (
+    MAX_GROUP_SIZE,
+    MAX_INNER_PER_APP_CALL,
+    MIN_FEE,
+    build_create_emotions_group,
+)
+
+BATCH_SIZES = (1, 2, 4, 8, 16, 32, 44)
+
+
+def main(app_id: int) -> None:
+    algorand, sender = algorand_and_sender()
+
+    print(f"{'emotions':>8} | {'ops':>6} | {'ops/emotion':>11} | {'group size':>10} | {'fee':>7}")
+    for count in BATCH_SIZES:
+        names = [f"Bench{count}x{i}" for i in range(count)]
+        # Pad with the inner-slot minimum only, so the measured budget is the contract's own cost
+        composer = build_create_emotions_group(algorand, app_id, sender, names, opcodes_per_emotion=0)
+        group = simulate_group(composer)
+        if group.get("failure-message"):
+            print(f"{count:>8} | failed: {group['failure-message']}")
+            continue
+        ops = group["txn-results"][0]["app-budget-consumed"]
+        group_size = max(app_calls_needed(ops), -(-count // MAX_INNER_PER_APP_CALL))
+        fits = "" if group_size <= MAX_GROUP_SIZE else " (too big)"
+        print(
+            f"{count:>8} | {ops:>6} | {ops / count:>11.0f} | {group_size:>10}{fits}"
+            f" | {(group_size + count) * MIN_FEE:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]))
@@ -0,0 +1,32 @@
+"""Stakers processed per second by the batched StakingRewards keeper.
+
+Lists every staker box of the app, then claims (or, as admin, compounds)
+for all of them with `smart_contracts.offchain.keeper`. This submits real
+transactions, so run it against LocalNet.
+
+Run with ``python -m benchmarks.keeper <app_id> [claim|compound] [max_workers]``.
+"""
+import sys
+
+from benchmarks._localnet import algorand_and_sender
+from smart_contracts.offchain.keeper import CLAIM_MANY, COMPOUND_MANY, run_keeper
+from smart_contracts.offchain.staking import fetch_staker_addresses
+
+
+def main(app_id: int, action: str = "claim", max_workers: int = 8) -> None:
+    algorand, sender = algorand_and_sender()
+    stakers = fetch_staker_addresses(algorand.client.algod, app_id)
+    method = COMPOUND_MANY if action == "compound" else CLAIM_MANY
+
+    report = run_keeper(algorand, app_id, sender, stakers, method, max_workers)
+    print(
+        f"{action}: {report.stakers} of {len(stakers)} stakers in {report.groups} groups"
+        f" ({report.failed_groups} failed), {report.elapsed:.2f}s,"
+        f" {report.stakers_per_second:,.0f} stakers/s"
+    )
+    for failure in report.failures:
+        print(f"  group {failure.index} ({len(failure.stakers)} stakers): {failure.error}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]), *sys.argv[2:3], *map(int, sys.argv[3:4]))
@@ -0,0 +1,38 @@
+"""Throughput of the off-chain SwapPool quote engine.
+
+Run with ``python -m benchmarks.quote_engine``.
+"""
+import time
+
+import numpy as np
+
+from smart_contracts.offchain.quote import PoolReserves, quote_both
+
+BATCH_SIZES = (1, 1_000, 1_000_000)
+MIN_SECONDS = 1.0
+
+POOL = PoolReserves(reserve_a=50_000_000_000, reserve_b=120_000_000_000)
+
+
+def bench(amounts: np.ndarray) -> float:
+    """Return quotes per second (both directions count as two quotes)"""
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < MIN_SECONDS:
+        quote_both(POOL, amounts)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+    return 2 * iterations * amounts.size / elapsed
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'amounts':>10} | {'quotes/s':>16}")
+    for size in BATCH_SIZES:
+        amounts = rng.integers(1, 10_000_000_000, size=size, dtype=np.uint64)
+        print(f"{size:>10} | {bench(amounts):>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Latency and fees of a readonly getter: simulate path vs. submitted transaction.
+
+`EmoswapalgoClient.send.get_*` goes through `AppClient.send.call`, which simulates
+methods marked readonly in the app spec. Building the same call in a group and
+sending it forces the old behaviour (signed, fee-paying, waits for confirmation).
+
+Run against LocalNet (or any network configured via the usual ALGOD_* / DEPLOYER_*
+environment variables) with ``python -m benchmarks.readonly_reads <app_id>``.
+"""
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+import algokit_utils
+from dotenv import load_dotenv
+
+from smart_contracts.artifacts.emoswapalgo.emoswapalgo_client import EmoswapalgoClient
+
+ROUNDS = 20
+
+
+def _timed(call: Callable[[], object]) -> list[float]:
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(label: str, samples: list[float], fee_micro_algo: int) -> None:
+    print(
+        f"{label:>10} | p50 {statistics.median(samples) * 1000:8.1f} ms"
+        f" | max {max(samples) * 1000:8.1f} ms | fee {fee_micro_algo} uAlgo"
+    )
+
+
+def main(app_id: int) -> None:
+    load_dotenv()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+    client = EmoswapalgoClient(
+        algorand=algorand, app_id=app_id, default_sender=deployer.address
+    )
+
+    _report("simulate", _timed(client.send.get_mood_token_id), 0)
+
+    sent = client.new_group().get_mood_token_id().send()
+    _report(
+        "send",
+        _timed(lambda: client.new_group().get_mood_token_id().send()),
+        sent.confirmations[0]["txn"]["txn"]["fee"],
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]))
@@ -0,0 +1,52 @@
+"""Time to project pending rewards and yields for 1M synthetic stakers.
+
+Run with ``python -m benchmarks.reward_projection``.
+"""
+import time
+
+import numpy as np
+
+from smart_contracts.offchain.rewards import REWARD_PRECISION, StakingSnapshot, project
+
+STAKERS = 1_000_000
+WHAT_IF_RATES = (10, 5, 20)
+NOW = 1_750_000_000
+REPEATS = 5
+
+
+def synthetic_snapshot(count: int) -> StakingSnapshot:
+    rng = np.random.default_rng(0)
+    reward_per_token = 3 * REWARD_PRECISION // 10  # Three years at 10%
+    # Stakes spread log-uniformly from 1 to 10**15 base units
+    staked = np.floor(10 ** rng.uniform(0, 15, size=count)).astype(np.uint64)
+    entry_share = rng.uniform(0, 1, size=count)
+    reward_debt = np.floor(staked.astype(np.float64) * entry_share * 0.3).astype(np.uint64)
+    return StakingSnapshot(
+        reward_rate=WHAT_IF_RATES[0],
+        reward_per_token_stored=reward_per_token,
+        last_update_time=NOW - 86_400,
+        total_staked=int(staked.sum(dtype=object)),
+        addresses=[""] * count,
+        staked=staked,
+        reward_debt=reward_debt,
+        accrued_rewards=rng.integers(0, 10**6, size=count, dtype=np.uint64),
+        last_claim_time=np.full(count, NOW - 86_400, dtype=np.uint64),
+        compounded_rewards=np.zeros(count, dtype=np.uint64),
+    )
+
+
+def main() -> None:
+    snapshot = synthetic_snapshot(STAKERS)
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        project(snapshot, NOW, reward_rates=WHAT_IF_RATES)
+        best = min(best, time.perf_counter() - start)
+    print(
+        f"{STAKERS:,} stakers, {len(WHAT_IF_RATES)} rates: {best:.3f}s"
+        f" ({STAKERS / best:,.0f} stakers/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Route computation time for the off-chain multi-hop router.
+
+Builds random pool graphs over the eight README emotions and times
+`PoolGraph.best_route`. Run with ``python -m benchmarks.router``.
+"""
+import random
+import statistics
+import time
+
+from smart_contracts.offchain.router import Pool, PoolGraph
+
+EMOTIONS = ("Happy", "Sad", "Angry", "Excited", "Calm", "Anxious", "Grateful", "Loved")
+POOL_COUNTS = (8, 20, 50)
+MAX_HOPS = 3
+SAMPLES = 2_000
+
+
+def random_graph(pool_count: int, rng: random.Random) -> PoolGraph:
+    assets = list(range(1, len(EMOTIONS) + 1))
+    pools = []
+    for app_id in range(1, pool_count + 1):
+        asset_a, asset_b = rng.sample(assets, 2)
+        pools.append(
+            Pool(
+                app_id=app_id,
+                asset_a=asset_a,
+                asset_b=asset_b,
+                reserve_a=rng.randrange(10**9, 10**12),
+                reserve_b=rng.randrange(10**9, 10**12),
+            )
+        )
+    return PoolGraph(pools)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'pools':>6} | {'p50 us':>8} | {'p99 us':>8}")
+    for pool_count in POOL_COUNTS:
+        graph = random_graph(pool_count, rng)
+        samples = []
+        for _ in range(SAMPLES):
+            asset_in, asset_out = rng.sample(range(1, len(EMOTIONS) + 1), 2)
+            start = time.perf_counter()
+            graph.best_route(asset_in, asset_out, rng.randrange(10**6, 10**9), MAX_HOPS)
+            samples.append((time.perf_counter() - start) * 1e6)
+        samples.sort()
+        print(
+            f"{pool_count:>6} | {statistics.median(samples):>8.1f}"
+            f" | {samples[int(len(samples) * 0.99)]:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Opcode cost and fees of `SwapPool.swap_batch` vs. N individual swap calls.
+
+Both variants are simulated, so nothing is submitted. Fees assume the
+minimum fee per transaction, with extra app calls added to the batch only
+when it needs more than one call's opcode budget.
+
+Run with ``python -m benchmarks.swap_batch <SwapPool.arc56.json> <app_id>``.
+"""
+import sys
+from pathlib import Path
+
+import algokit_utils
+
+from benchmarks._localnet import algorand_and_sender, app_calls_needed, app_client, budget_consumed
+
+BATCH_SIZES = (1, 4, 8, 16, 32, 64)
+MIN_FEE = 1_000
+MAX_GROUP_SIZE = 16
+LEG_AMOUNT = 1_000
+
+
+def _call(client: algokit_utils.AppClient, method: str, args: list) -> algokit_utils.AppCallMethodCallParams:
+    return client.params.call(algokit_utils.AppClientMethodCallParams(method=method, args=args))
+
+
+def individual_budget(algorand: algokit_utils.AlgorandClient, client: algokit_utils.AppClient, n: int) -> int:
+    total = 0
+    for start in range(0, n, MAX_GROUP_SIZE):
+        composer = algorand.new_group()
+        for i in range(start, min(n, start + MAX_GROUP_SIZE)):
+            method = "swap_a_for_b(uint64,uint64)uint64" if i % 2 == 0 else "swap_b_for_a(uint64,uint64)uint64"
+            composer.add_app_call_method_call(_call(client, method, [LEG_AMOUNT, 0]))
+        total += budget_consumed(composer)
+    return total
+
+
+def batch_budget(algorand: algokit_utils.AlgorandClient, client: algokit_utils.AppClient, n: int) -> int:
+    legs = [(i % 2 == 0, LEG_AMOUNT) for i in range(n)]
+    composer = algorand.new_group().add_app_call_method_call(
+        _call(client, "swap_batch((bool,uint64)[])uint64[]", [legs])
+    )
+    return budget_consumed(composer)
+
+
+def main(app_spec: Path, app_id: int) -> None:
+    algorand, sender = algorand_and_sender()
+    client = app_client(algorand, app_spec, app_id, sender)
+
+    print(f"{'N':>4} | {'individual ops':>14} | {'fee':>7} | {'batch ops':>9} | {'fee':>7}")
+    for n in BATCH_SIZES:
+        single = individual_budget(algorand, client, n)
+        batch = batch_budget(algorand, client, n)
+        print(
+            f"{n:>4} | {single:>14} | {n * MIN_FEE:>7}"
+            f" | {batch:>9} | {app_calls_needed(batch) * MIN_FEE:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]), int(sys.argv[2]))
@@ -0,0 +1,93 @@
+"""Opcode cost of `ConcentratedPool` swaps against ticks crossed and tick sparsity.
+
+Each scenario simulates a group of `mint` calls laying out adjacent
+ranges followed by one swap that crosses every range boundary and stops
+inside the last range, so nothing is committed. Sparse layouts put every
+boundary in a different bitmap word, so the swap also pays for scanning
+empty words. The pool must already be
+initialized at tick index TICK_OFFSET (price 1.0) and the sender must be
+its admin. The simulator's quote is printed next to the on-chain result.
+
+Run with ``python -m benchmarks.tick_bitmap <ConcentratedPool.arc56.json> <app_id>``.
+"""
+import base64
+import sys
+from pathlib import Path
+
+import algokit_utils
+
+from benchmarks._localnet import algorand_and_sender, app_calls_needed, app_client, simulate_group
+from smart_contracts.offchain.ticks import (
+    TICK_OFFSET,
+    TICK_SPACING,
+    ConcentratedPoolSim,
+    amount_b_delta,
+    tick_to_sqrt_price,
+)
+
+LIQUIDITY = 10**12
+MIN_FEE = 1_000
+# Fee credit for the op-up calls `ensure_budget` may issue during the swap
+SWAP_EXTRA_FEE = 16 * MIN_FEE
+RANGE_COUNTS = (1, 4, 8, 14)  # 14 mints + the swap stays within a 16 transaction group
+# Range width in ticks: one bitmap bit apart, or one 64-bit word (640 ticks) apart
+WIDTHS = {"dense": TICK_SPACING, "sparse": 64 * TICK_SPACING}
+
+
+def _call(
+    client: algokit_utils.AppClient, method: str, args: list, extra_fee: int = 0
+) -> algokit_utils.AppCallMethodCallParams:
+    return client.params.call(
+        algokit_utils.AppClientMethodCallParams(
+            method=method,
+            args=args,
+            extra_fee=algokit_utils.AlgoAmount.from_micro_algo(extra_fee) if extra_fee else None,
+        )
+    )
+
+
+def main(app_spec: Path, app_id: int) -> None:
+    algorand, sender = algorand_and_sender()
+    client = app_client(algorand, app_spec, app_id, sender)
+
+    print(
+        f"{'layout':>6} | {'crossed':>7} | {'swap ops':>8} | {'app calls':>9}"
+        f" | {'amount out':>14} | {'simulator':>14}"
+    )
+    for layout, width in WIDTHS.items():
+        for count in RANGE_COUNTS:
+            # Ranges sit just above the price, so swapping B for A walks up through each one
+            bounds = [TICK_OFFSET + TICK_SPACING + i * width for i in range(count + 1)]
+            pool = ConcentratedPoolSim.at_tick(TICK_OFFSET)
+            composer = algorand.new_group()
+            for lower, upper in zip(bounds, bounds[1:]):
+                pool.mint(sender, lower, upper, LIQUIDITY)
+                composer.add_app_call_method_call(
+                    _call(client, "mint(uint64,uint64,uint64)(uint64,uint64)", [lower, upper, LIQUIDITY])
+                )
+            # The B that buys out every range; the fee comes off it, so the
+            # swap crosses each lower boundary and stops inside the last range
+            amount_b = amount_b_delta(
+                LIQUIDITY, tick_to_sqrt_price(bounds[0]), tick_to_sqrt_price(bounds[-1]), True
+            )
+            expected = pool.quote(amount_b, a_for_b=False)
+            composer.add_app_call_method_call(
+                _call(client, "swap_b_for_a(uint64)uint64", [amount_b], SWAP_EXTRA_FEE)
+            )
+
+            group = simulate_group(composer)
+            if group.get("failure-message"):
+                print(f"{layout:>6} | {count:>7} | failed: {group['failure-message']}")
+                continue
+            swap = group["txn-results"][-1]
+            swap_ops = swap["app-budget-consumed"]
+            logs = swap["txn-result"].get("logs", [])
+            amount_out = int.from_bytes(base64.b64decode(logs[-1])[-8:], "big") if logs else 0
+            print(
+                f"{layout:>6} | {count:>7} | {swap_ops:>8} | {app_calls_needed(swap_ops):>9}"
+                f" | {amount_out:>14} | {expected if expected is not None else 'failed':>14}"
+            )
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]), int(sys.argv[2]))
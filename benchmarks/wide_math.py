@@ -0,0 +1,63 @@
+"""Opcode cost of the 128-bit swap math at reserve sizes that overflowed uint64 before.
+
+Uses MultiSwapPool because its pairs can be seeded with arbitrary reserves;
+it shares `get_amount_out` with SwapPool. Each scenario simulates
+add_pair + add_reserves + swap in one group, so nothing is committed and
+the benchmark can be re-run against the same app.
+
+Run with ``python -m benchmarks.wide_math <MultiSwapPool.arc56.json> <app_id>``.
+"""
+import sys
+from pathlib import Path
+
+import algokit_utils
+
+from benchmarks._localnet import APP_CALL_BUDGET, algorand_and_sender, app_client, simulate_group
+
+ASSET_A = 1_001
+ASSET_B = 1_002
+RESERVES = (10**6, 10**12, 10**15, 2**62)
+SWAP_FRACTIONS = (1_000_000, 1_000, 10, 2)  # amount_in = reserve // fraction
+
+
+def _call(client: algokit_utils.AppClient, method: str, args: list) -> algokit_utils.AppCallMethodCallParams:
+    return client.params.call(algokit_utils.AppClientMethodCallParams(method=method, args=args))
+
+
+def main(app_spec: Path, app_id: int) -> None:
+    algorand, sender = algorand_and_sender()
+    client = app_client(algorand, app_spec, app_id, sender)
+
+    print(f"{'reserve':>22} | {'amount_in':>22} | {'swap ops':>8} | {'fits 1 call':>11}")
+    for reserve in RESERVES:
+        for fraction in SWAP_FRACTIONS:
+            amount_in = reserve // fraction
+            composer = (
+                algorand.new_group()
+                .add_app_call_method_call(
+                    _call(client, "add_pair(uint64,uint64)uint64", [ASSET_A, ASSET_B])
+                )
+                .add_app_call_method_call(
+                    _call(
+                        client,
+                        "add_reserves(uint64,uint64,uint64,uint64)void",
+                        [ASSET_A, ASSET_B, reserve, reserve],
+                    )
+                )
+                .add_app_call_method_call(
+                    _call(client, "swap(uint64,uint64,uint64)uint64", [ASSET_A, ASSET_B, amount_in])
+                )
+            )
+            group = simulate_group(composer)
+            if group.get("failure-message"):
+                print(f"{reserve:>22} | {amount_in:>22} | {'failed':>8} | {group['failure-message']}")
+                continue
+            swap_ops = group["txn-results"][2]["app-budget-consumed"]
+            print(
+                f"{reserve:>22} | {amount_in:>22} | {swap_ops:>8}"
+                f" | {'yes' if swap_ops <= APP_CALL_BUDGET else 'no':>11}"
+            )
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]), int(sys.argv[2]))
@@ -0,0 +1,134 @@
+"""Latency and fees of `Emoswapalgo.zap_into_farm` against the manual three-step flow.
+
+The manual flow sends swap_a_for_b, add_liquidity and stake one after the
+other, each waiting for confirmation because the next step needs the
+previous result. The zap sends one call whose inner calls do the same.
+Both run against the apps registered on the Emoswapalgo app, which must
+be set as the router of SwapPool and StakingRewards, and the sender must
+be their admin (the manual flow is admin only). The zap deposits
+AMOUNT_A of the pool's asset A, which the sender must hold. Both flows pay
+StakingRewards for the largest possible growth of the staker's boxes.
+
+Run with ``python -m benchmarks.zap <Emoswapalgo app_id> [runs]``.
+"""
+import statistics
+import sys
+import time
+
+import algokit_utils
+from algosdk.abi import Method
+from algosdk.logic import get_application_address
+
+from benchmarks._localnet import algorand_and_sender
+from smart_contracts.offchain.staking import stake_payment
+from smart_contracts.offchain.state import RegistryResolver, fetch_global_state
+
+SWAP_A_FOR_B = Method.from_signature("swap_a_for_b(uint64,uint64)uint64")
+ADD_LIQUIDITY = Method.from_signature("add_liquidity(uint64,uint64)uint64")
+STAKE = Method.from_signature("stake(uint64)uint64")
+ZAP_INTO_FARM = Method.from_signature("zap_into_farm(axfer,pay,uint64)uint64")
+
+AMOUNT_A = 1_000_000
+SWAP_AMOUNT = AMOUNT_A // 2
+# Covers a first stake; later stakes grow the boxes less and the app keeps the rest
+MBR_PAYMENT = stake_payment(has_record=False, checkpoints=0)
+SEND_PARAMS = algokit_utils.SendParams(
+    populate_app_call_resources=True,
+    cover_app_call_inner_transaction_fees=True,
+)
+
+
+def _call(
+    sender: str, app_id: int, method: Method, args: list, inner_calls: int = 0
+) -> algokit_utils.AppCallMethodCallParams:
+    return algokit_utils.AppCallMethodCallParams(
+        sender=sender,
+        app_id=app_id,
+        method=method,
+        args=args,
+        max_fee=algokit_utils.AlgoAmount.from_micro_algo(1_000 * (1 + inner_calls)),
+    )
+
+
+def _mbr_payment(sender: str, staking_rewards_id: int) -> algokit_utils.PaymentParams:
+    return algokit_utils.PaymentParams(
+        sender=sender,
+        receiver=get_application_address(staking_rewards_id),
+        amount=algokit_utils.AlgoAmount.from_micro_algo(MBR_PAYMENT),
+    )
+
+
+def _send(
+    algorand: algokit_utils.AlgorandClient,
+    params: algokit_utils.AppCallMethodCallParams,
+    payment: algokit_utils.PaymentParams | None = None,
+):
+    """Send one call, after `payment` if given, and wait for it; returns (return value, fee paid)"""
+    composer = algorand.new_group()
+    if payment is not None:
+        composer.add_payment(payment)
+    result = composer.add_app_call_method_call(params).send(SEND_PARAMS)
+    fee = sum(confirmation["txn"]["txn"].get("fee", 0) for confirmation in result.confirmations)
+    return result.returns[-1].value, fee
+
+
+def manual_flow(algorand: algokit_utils.AlgorandClient, sender: str, ids: dict[str, int]) -> int:
+    amount_b, swap_fee = _send(algorand, _call(sender, ids["swap_pool_id"], SWAP_A_FOR_B, [SWAP_AMOUNT, 0]))
+    minted, add_fee = _send(
+        algorand, _call(sender, ids["swap_pool_id"], ADD_LIQUIDITY, [AMOUNT_A - SWAP_AMOUNT, amount_b])
+    )
+    _, stake_fee = _send(
+        algorand,
+        _call(sender, ids["staking_rewards_id"], STAKE, [minted]),
+        _mbr_payment(sender, ids["staking_rewards_id"]),
+    )
+    return swap_fee + add_fee + stake_fee
+
+
+def zap_flow(
+    algorand: algokit_utils.AlgorandClient, sender: str, app_id: int, ids: dict[str, int]
+) -> int:
+    deposit = algorand.create_transaction.asset_transfer(
+        algokit_utils.AssetTransferParams(
+            sender=sender,
+            receiver=get_application_address(ids["swap_pool_id"]),
+            asset_id=ids["asset_a"],
+            amount=AMOUNT_A,
+        )
+    )
+    payment = algorand.create_transaction.payment(_mbr_payment(sender, ids["staking_rewards_id"]))
+    _, fee = _send(
+        algorand, _call(sender, app_id, ZAP_INTO_FARM, [deposit, payment, SWAP_AMOUNT], inner_calls=3)
+    )
+    return fee
+
+
+def _timed(flow) -> tuple[float, int]:
+    start = time.perf_counter()
+    fee = flow()
+    return time.perf_counter() - start, fee
+
+
+def main(app_id: int, runs: int) -> None:
+    algorand, sender = algorand_and_sender()
+    resolver = RegistryResolver.shared(algorand.client.algod, app_id)
+    ids = {
+        name: resolver.resolve(name) for name in ("swap_pool_id", "staking_rewards_id")
+    }
+    ids["asset_a"] = int(fetch_global_state(algorand.client.algod, ids["swap_pool_id"])["asset_a"])
+
+    print(f"{'flow':>6} | {'txns signed':>11} | {'p50 s':>7} | {'max s':>7} | {'fee uA':>7}")
+    for label, signed, flow in (
+        ("manual", 4, lambda: manual_flow(algorand, sender, ids)),
+        ("zap", 3, lambda: zap_flow(algorand, sender, app_id, ids)),
+    ):
+        samples = [_timed(flow) for _ in range(runs)]
+        latencies = [latency for latency, _ in samples]
+        print(
+            f"{label:>6} | {signed:>11} | {statistics.median(latencies):>7.2f}"
+            f" | {max(latencies):>7.2f} | {samples[-1][1]:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_mood_token_id", "returns": {"type": "uint64"}, "desc": "Get MOOD token ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_emotion_factory_id", "returns": {"type": "uint64"}, "desc": "Get EmotionFactory App ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_governance_id", "returns": {"type": "uint64"}, "desc": "Get Governance App ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_liquidity_pool_id", "returns": {"type": "uint64"}, "desc": "Get LiquidityPool App ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_staking_rewards_id", "returns": {"type": "uint64"}, "desc": "Get StakingRewards App ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_swap_pool_id", "returns": {"type": "uint64"}, "desc": "Get SwapPool App ID", "events": [], "readonly": false, "recommendations": {}}], "name": "Emoswapalgo", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiABASYBDBUffHUAAAAAAAAAADEbQQCtggcEAr7OEQTwa7MYBJjUAbgEi3DsIwR2m7F7BMcYVW4EbIqGKjYaAI4HAFIAOgAvACQAGQAOAAOBAEMxGRREMRhEKLAiQzEZFEQxGEQosCJDMRkURDEYRCiwIkMxGRREMRhEKLAiQzEZFEQxGEQosCJDMRkURDEYRIAMFR98dQAAAAAseXPqsCJDMRkURDEYRDYaAVcCAIgAHkkVFlcGAkxQgAQVH3x1TFCwIkMxGUD/hjEYFEQiQ4oBAYAHSGVsbG8sIIv/UIk=", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgRW1vc3dhcGFsZ28oQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMgogICAgcHVzaGJ5dGVzcyAweDAyYmVjZTExIDB4ZjA2YmIzMTggMHg5OGQ0MDFiOCAweDhiNzBlYzIzIDB4NzY5YmIxN2IgMHhjNzE4NTU2ZSAweDZjOGE4NjJhIC8vIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiZ2V0X21vb2RfdG9rZW5faWQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2Vtb3Rpb25fZmFjdG9yeV9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfZ292ZXJuYW5jZV9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfbGlxdWlkaXR5X3Bvb2xfaWQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YWtpbmdfcmV3YXJkc19pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfc3dhcF9wb29sX2lkKCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2hlbGxvX3JvdXRlQDMgbWFpbl9nZXRfbW9vZF90b2tlbl9pZF9yb3V0ZUA0IG1haW5fZ2V0X2Vtb3Rpb25fZmFjdG9yeV9pZF9yb3V0ZUA1IG1haW5fZ2V0X2dvdmVybmFuY2VfaWRfcm91dGVANiBtYWluX2dldF9saXF1aWRpdHlfcG9vbF9pZF9yb3V0ZUA3IG1haW5fZ2V0X3N0YWtpbmdfcmV3YXJkc19pZF9yb3V0ZUA4IG1haW5fZ2V0X3N3YXBfcG9vbF9pZF9yb3V0ZUA5CgptYWluX2FmdGVyX2lmX2Vsc2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgRW1vc3dhcGFsZ28oQVJDNENvbnRyYWN0KToKICAgIHB1c2hpbnQgMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X3N3YXBfcG9vbF9pZF9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjM1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9zdGFraW5nX3Jld2FyZHNfaWRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weTozMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbGlxdWlkaXR5X3Bvb2xfaWRfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weToyNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfZ292ZXJuYW5jZV9pZF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9lbW90aW9uX2ZhY3RvcnlfaWRfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weToxNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbW9vZF90b2tlbl9pZF9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDJjNzk3M2VhCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5faGVsbG9fcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weTo2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEVtb3N3YXBhbGdvKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBoZWxsbwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgRW1vc3dhcGFsZ28oQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTYKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmVtb3N3YXBhbGdvLmNvbnRyYWN0LkVtb3N3YXBhbGdvLmhlbGxvKG5hbWU6IGJ5dGVzKSAtPiBieXRlczoKaGVsbG86CiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6Ni03CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBoZWxsbyhzZWxmLCBuYW1lOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjgKICAgIC8vIHJldHVybiAiSGVsbG8sICIgKyBuYW1lCiAgICBwdXNoYnl0ZXMgIkhlbGxvLCAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [86, 97, 108, 119, 130, 141, 165], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [205], "errorMessage": "can only call when creating"}, {"pc": [89, 100, 111, 122, 133, 144, 168], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"name": "Emoswapalgo", "structs": {}, "methods": [{"name": "hello", "args": [{"type": "string", "name": "name"}], "returns": {"type": "string"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": false, "desc": "Welcome message", "events": [], "recommendations": {}}, {"name": "get_mood_token_id", "args": [], "returns": {"type": "uint64"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": true, "desc": "Get MOOD token ID", "events": [], "recommendations": {}}, {"name": "get_emotion_factory_id", "args": [], "returns": {"type": "uint64"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": true, "desc": "Get EmotionFactory App ID", "events": [], "recommendations": {}}, {"name": "get_governance_id", "args": [], "returns": {"type": "uint64"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": true, "desc": "Get Governance App ID", "events": [], "recommendations": {}}, {"name": "get_liquidity_pool_id", "args": [], "returns": {"type": "uint64"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": true, "desc": "Get LiquidityPool App ID (legacy: liquidity now lives in SwapPool)", "events": [], "recommendations": {}}, {"name": "get_staking_rewards_id", "args": [], "returns": {"type": "uint64"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": true, "desc": "Get StakingRewards App ID", "events": [], "recommendations": {}}, {"name": "get_swap_pool_id", "args": [], "returns": {"type": "uint64"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": true, "desc": "Get SwapPool App ID", "events": [], "recommendations": {}}, {"name": "set_governance_id", "args": [{"type": "uint64", "name": "app_id"}], "returns": {"type": "void"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": false, "desc": "Set Governance App ID (admin only)", "events": [], "recommendations": {}}, {"name": "set_liquidity_pool_id", "args": [{"type": "uint64", "name": "app_id"}], "returns": {"type": "void"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": false, "desc": "Set LiquidityPool App ID (admin only)", "events": [], "recommendations": {}}, {"name": "set_staking_rewards_id", "args": [{"type": "uint64", "name": "app_id"}], "returns": {"type": "void"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": false, "desc": "Set StakingRewards App ID (admin only)", "events": [], "recommendations": {}}, {"name": "set_swap_pool_id", "args": [{"type": "uint64", "name": "app_id"}], "returns": {"type": "void"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": false, "desc": "Set SwapPool App ID (admin only)", "events": [], "recommendations": {}}, {"name": "get_all_contract_ids", "args": [], "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,uint64)"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": true, "desc": "Get all contract IDs", "events": [], "recommendations": {}}, {"name": "zap_into_farm", "args": [{"type": "axfer", "name": "deposit"}, {"type": "pay", "name": "mbr_payment"}, {"type": "uint64", "name": "swap_amount"}], "returns": {"type": "uint64"}, "actions": {"create": [], "call": ["NoOp"]}, "readonly": false, "desc": "Swap part of a deposit of asset A to B, add both sides as liquidity and stake the LP shares.\n\n`deposit` must move the sender's asset A into the SwapPool, and only\nwhat it actually delivered is swapped and added. Each step is an\ninner app call (fees are pooled from the outer call, 4 * min fee in\ntotal); the swap and the deposit both go to the SwapPool AMM, which\ntogether with StakingRewards must have this app set as its router.\n`mbr_payment` pays StakingRewards for any growth of the sender's\nstaker record and stake history. Returns the LP shares staked for\nthe sender.", "events": [], "recommendations": {}}], "arcs": [22, 28], "networks": {}, "state": {"schema": {"global": {"ints": 6, "bytes": 1}, "local": {"ints": 0, "bytes": 0}}, "keys": {"global": {"admin": {"keyType": "AVMString", "valueType": "AVMBytes", "key": "YWRtaW4="}, "mood_token_id": {"keyType": "AVMString", "valueType": "AVMUint64", "key": "bW9vZF90b2tlbl9pZA=="}, "emotion_factory_id": {"keyType": "AVMString", "valueType": "AVMUint64", "key": "ZW1vdGlvbl9mYWN0b3J5X2lk"}, "governance_id": {"keyType": "AVMString", "valueType": "AVMUint64", "key": "Z292ZXJuYW5jZV9pZA=="}, "liquidity_pool_id": {"keyType": "AVMString", "valueType": "AVMUint64", "key": "bGlxdWlkaXR5X3Bvb2xfaWQ="}, "staking_rewards_id": {"keyType": "AVMString", "valueType": "AVMUint64", "key": "c3Rha2luZ19yZXdhcmRzX2lk"}, "swap_pool_id": {"keyType": "AVMString", "valueType": "AVMUint64", "key": "c3dhcF9wb29sX2lk"}}, "local": {}, "box": {}}, "maps": {"global": {}, "local": {}, "box": {}}}, "bareActions": {"create": ["NoOp"], "call": []}, "sourceInfo": {"approval": {"sourceInfo": [{"pc": [86, 97, 108, 119, 130, 141, 165], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [205], "errorMessage": "can only call when creating"}, {"pc": [89, 100, 111, 122, 133, 144, 168], "errorMessage": "can only call when not creating"}], "pcOffsetMethod": "none"}, "clear": {"sourceInfo": [], "pcOffsetMethod": "none"}}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgRW1vc3dhcGFsZ28oQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMgogICAgcHVzaGJ5dGVzcyAweDAyYmVjZTExIDB4ZjA2YmIzMTggMHg5OGQ0MDFiOCAweDhiNzBlYzIzIDB4NzY5YmIxN2IgMHhjNzE4NTU2ZSAweDZjOGE4NjJhIC8vIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiZ2V0X21vb2RfdG9rZW5faWQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2Vtb3Rpb25fZmFjdG9yeV9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfZ292ZXJuYW5jZV9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfbGlxdWlkaXR5X3Bvb2xfaWQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YWtpbmdfcmV3YXJkc19pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfc3dhcF9wb29sX2lkKCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2hlbGxvX3JvdXRlQDMgbWFpbl9nZXRfbW9vZF90b2tlbl9pZF9yb3V0ZUA0IG1haW5fZ2V0X2Vtb3Rpb25fZmFjdG9yeV9pZF9yb3V0ZUA1IG1haW5fZ2V0X2dvdmVybmFuY2VfaWRfcm91dGVANiBtYWluX2dldF9saXF1aWRpdHlfcG9vbF9pZF9yb3V0ZUA3IG1haW5fZ2V0X3N0YWtpbmdfcmV3YXJkc19pZF9yb3V0ZUA4IG1haW5fZ2V0X3N3YXBfcG9vbF9pZF9yb3V0ZUA5CgptYWluX2FmdGVyX2lmX2Vsc2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgRW1vc3dhcGFsZ28oQVJDNENvbnRyYWN0KToKICAgIHB1c2hpbnQgMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X3N3YXBfcG9vbF9pZF9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjM1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9zdGFraW5nX3Jld2FyZHNfaWRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weTozMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbGlxdWlkaXR5X3Bvb2xfaWRfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weToyNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfZ292ZXJuYW5jZV9pZF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9lbW90aW9uX2ZhY3RvcnlfaWRfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weToxNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbW9vZF90b2tlbl9pZF9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDJjNzk3M2VhCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5faGVsbG9fcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9lbW9zd2FwYWxnby9jb250cmFjdC5weTo2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEVtb3N3YXBhbGdvKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBoZWxsbwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgRW1vc3dhcGFsZ28oQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTYKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmVtb3N3YXBhbGdvLmNvbnRyYWN0LkVtb3N3YXBhbGdvLmhlbGxvKG5hbWU6IGJ5dGVzKSAtPiBieXRlczoKaGVsbG86CiAgICAvLyBzbWFydF9jb250cmFjdHMvZW1vc3dhcGFsZ28vY29udHJhY3QucHk6Ni03CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBoZWxsbyhzZWxmLCBuYW1lOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Vtb3N3YXBhbGdvL2NvbnRyYWN0LnB5OjgKICAgIC8vIHJldHVybiAiSGVsbG8sICIgKyBuYW1lCiAgICBwdXNoYnl0ZXMgIkhlbGxvLCAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "byteCode": {"approval": "CiABASYBDBUffHUAAAAAAAAAADEbQQCtggcEAr7OEQTwa7MYBJjUAbgEi3DsIwR2m7F7BMcYVW4EbIqGKjYaAI4HAFIAOgAvACQAGQAOAAOBAEMxGRREMRhEKLAiQzEZFEQxGEQosCJDMRkURDEYRCiwIkMxGRREMRhEKLAiQzEZFEQxGEQosCJDMRkURDEYRIAMFR98dQAAAAAseXPqsCJDMRkURDEYRDYaAVcCAIgAHkkVFlcGAkxQgAQVH3x1TFCwIkMxGUD/hjEYFEQiQ4oBAYAHSGVsbG8sIIv/UIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 10, "patch": 0}}, "events": [], "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -74,6 +74,58 @@ class HelloArgs:
         return "hello(string)string"
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetGovernanceIdArgs:
+    """Dataclass for set_governance_id arguments"""
+    app_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_governance_id(uint64)void"
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetLiquidityPoolIdArgs:
+    """Dataclass for set_liquidity_pool_id arguments"""
+    app_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_liquidity_pool_id(uint64)void"
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetStakingRewardsIdArgs:
+    """Dataclass for set_staking_rewards_id arguments"""
+    app_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_staking_rewards_id(uint64)void"
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetSwapPoolIdArgs:
+    """Dataclass for set_swap_pool_id arguments"""
+    app_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_swap_pool_id(uint64)void"
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ZapIntoFarmArgs:
+    """Dataclass for zap_into_farm arguments"""
+    deposit: algokit_utils.AppMethodCallTransactionArgument
+    mbr_payment: algokit_utils.AppMethodCallTransactionArgument
+    swap_amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "zap_into_farm(axfer,pay,uint64)uint64"
+
+
 class EmoswapalgoParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -157,6 +209,82 @@ class EmoswapalgoParams:
             "method": "get_swap_pool_id()uint64",
         }))
 
+    def set_governance_id(
+        self,
+        args: tuple[int] | SetGovernanceIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_governance_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def set_liquidity_pool_id(
+        self,
+        args: tuple[int] | SetLiquidityPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_liquidity_pool_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def set_staking_rewards_id(
+        self,
+        args: tuple[int] | SetStakingRewardsIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_staking_rewards_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def set_swap_pool_id(
+        self,
+        args: tuple[int] | SetSwapPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_swap_pool_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_all_contract_ids(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_all_contract_ids()(uint64,uint64,uint64,uint64,uint64,uint64)",
+        }))
+
+    def zap_into_farm(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | ZapIntoFarmArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "zap_into_farm(axfer,pay,uint64)uint64",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -251,6 +379,82 @@ class EmoswapalgoCreateTransactionParams:
             "method": "get_swap_pool_id()uint64",
         }))
 
+    def set_governance_id(
+        self,
+        args: tuple[int] | SetGovernanceIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_governance_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def set_liquidity_pool_id(
+        self,
+        args: tuple[int] | SetLiquidityPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_liquidity_pool_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def set_staking_rewards_id(
+        self,
+        args: tuple[int] | SetStakingRewardsIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_staking_rewards_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def set_swap_pool_id(
+        self,
+        args: tuple[int] | SetSwapPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_swap_pool_id(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_all_contract_ids(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_all_contract_ids()(uint64,uint64,uint64,uint64,uint64,uint64)",
+        }))
+
+    def zap_into_farm(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | ZapIntoFarmArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "zap_into_farm(axfer,pay,uint64)uint64",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -366,6 +570,100 @@ class EmoswapalgoSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def set_governance_id(
+        self,
+        args: tuple[int] | SetGovernanceIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_governance_id(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def set_liquidity_pool_id(
+        self,
+        args: tuple[int] | SetLiquidityPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_liquidity_pool_id(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def set_staking_rewards_id(
+        self,
+        args: tuple[int] | SetStakingRewardsIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_staking_rewards_id(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def set_swap_pool_id(
+        self,
+        args: tuple[int] | SetSwapPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_swap_pool_id(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_all_contract_ids(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int, int, int, int, int]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_all_contract_ids()(uint64,uint64,uint64,uint64,uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int, int, int, int, int]], parsed_response)
+
+    def zap_into_farm(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | ZapIntoFarmArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "zap_into_farm(axfer,pay,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -383,6 +681,103 @@ class EmoswapalgoState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+@dataclasses.dataclass(frozen=True)
+class GlobalStateValue:
+    """Struct for global_state state values"""
+    admin: bytes
+    mood_token_id: int
+    emotion_factory_id: int
+    governance_id: int
+    liquidity_pool_id: int
+    staking_rewards_id: int
+    swap_pool_id: int
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return GlobalStateValue(**converted)
+
+    @property
+    def admin(self) -> bytes:
+        """Get the current value of the admin key in global_state state"""
+        value = self.app_client.state.global_state.get_value("admin")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def mood_token_id(self) -> int:
+        """Get the current value of the mood_token_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("mood_token_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def emotion_factory_id(self) -> int:
+        """Get the current value of the emotion_factory_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("emotion_factory_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def governance_id(self) -> int:
+        """Get the current value of the governance_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("governance_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def liquidity_pool_id(self) -> int:
+        """Get the current value of the liquidity_pool_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("liquidity_pool_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def staking_rewards_id(self) -> int:
+        """Get the current value of the staking_rewards_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("staking_rewards_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def swap_pool_id(self) -> int:
+        """Get the current value of the swap_pool_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("swap_pool_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class EmoswapalgoClient:
     """Client for interacting with Emoswapalgo smart contract"""
 
@@ -569,6 +964,42 @@ class EmoswapalgoClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_governance_id(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_liquidity_pool_id(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_staking_rewards_id(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_swap_pool_id(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_all_contract_ids()(uint64,uint64,uint64,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[int, int, int, int, int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["zap_into_farm(axfer,pay,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -884,6 +1315,125 @@ class EmoswapalgoFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def set_governance_id(
+        self,
+        args: tuple[int] | SetGovernanceIdArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_governance_id(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_governance_id(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_liquidity_pool_id(
+        self,
+        args: tuple[int] | SetLiquidityPoolIdArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_liquidity_pool_id(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_liquidity_pool_id(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_staking_rewards_id(
+        self,
+        args: tuple[int] | SetStakingRewardsIdArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_staking_rewards_id(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_staking_rewards_id(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_swap_pool_id(
+        self,
+        args: tuple[int] | SetSwapPoolIdArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_swap_pool_id(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_swap_pool_id(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_all_contract_ids(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_all_contract_ids()(uint64,uint64,uint64,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_all_contract_ids()(uint64,uint64,uint64,uint64,uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def zap_into_farm(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | ZapIntoFarmArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the zap_into_farm(axfer,pay,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "zap_into_farm(axfer,pay,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class EmoswapalgoFactoryUpdateParams:
     """Parameters for 'update' operations of Emoswapalgo contract"""
 
@@ -1105,6 +1655,113 @@ class EmoswapalgoComposer:
         )
         return self
 
+    def set_governance_id(
+        self,
+        args: tuple[int] | SetGovernanceIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EmoswapalgoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_governance_id(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_governance_id(uint64)void", v
+            )
+        )
+        return self
+
+    def set_liquidity_pool_id(
+        self,
+        args: tuple[int] | SetLiquidityPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EmoswapalgoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_liquidity_pool_id(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_liquidity_pool_id(uint64)void", v
+            )
+        )
+        return self
+
+    def set_staking_rewards_id(
+        self,
+        args: tuple[int] | SetStakingRewardsIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EmoswapalgoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_staking_rewards_id(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_staking_rewards_id(uint64)void", v
+            )
+        )
+        return self
+
+    def set_swap_pool_id(
+        self,
+        args: tuple[int] | SetSwapPoolIdArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EmoswapalgoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_swap_pool_id(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_swap_pool_id(uint64)void", v
+            )
+        )
+        return self
+
+    def get_all_contract_ids(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EmoswapalgoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_all_contract_ids(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_all_contract_ids()(uint64,uint64,uint64,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def zap_into_farm(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, algokit_utils.AppMethodCallTransactionArgument, int] | ZapIntoFarmArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EmoswapalgoComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.zap_into_farm(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "zap_into_farm(axfer,pay,uint64)uint64", v
+            )
+        )
+        return self
+
     def clear_state(
         self,
         *,
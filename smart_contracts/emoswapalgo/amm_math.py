@@ -0,0 +1,51 @@
+from algopy import BigUInt, UInt64, op, subroutine
+
+# fee_rate is expressed in tenths of a percent: 3 = 0.3%
+FEE_DENOMINATOR = 1000
+
+
+@subroutine
+def mul_div(a: UInt64, b: UInt64, c: UInt64) -> UInt64:
+    """floor(a * b / c) through a 128-bit intermediate product"""
+    product_high, product_low = op.mulw(a, b)
+    quotient_high, quotient_low, _remainder_high, _remainder_low = op.divmodw(
+        product_high, product_low, UInt64(0), c
+    )
+    assert quotient_high == UInt64(0)  # Result fits in uint64
+    return quotient_low
+
+
+@subroutine
+def get_amount_out(
+    amount_in: UInt64, reserve_in: UInt64, reserve_out: UInt64, fee_rate: UInt64
+) -> UInt64:
+    """Constant product output after keeping fee_rate / FEE_DENOMINATOR of the input in the pool"""
+    # amount_out = (reserve_out * amount_in_after_fee) / (reserve_in + amount_in_after_fee)
+    # The quotient is always below reserve_out, so only the product needs 128 bits
+    amount_in_after_fee = amount_in - mul_div(amount_in, fee_rate, UInt64(FEE_DENOMINATOR))
+    return mul_div(reserve_out, amount_in_after_fee, reserve_in + amount_in_after_fee)
+
+
+@subroutine
+def sqrt_product(a: UInt64, b: UInt64) -> UInt64:
+    """floor(sqrt(a * b)) over the full 128-bit product"""
+    product_high, product_low = op.mulw(a, b)
+    root = op.bsqrt(BigUInt.from_bytes(op.itob(product_high) + op.itob(product_low)))
+    return op.btoi(root.bytes)
+
+
+@subroutine
+def zap_swap_amount(amount_in: UInt64, reserve_in: UInt64, fee_rate: UInt64) -> UInt64:
+    """Part of a one-sided deposit to swap first so the rest matches the post-swap ratio.
+
+    Closed-form root of the constant product deposit quadratic, with
+    D = FEE_DENOMINATOR and F = fee_rate:
+    s = (sqrt(r^2 (2D - F)^2 + 4 (D - F) D r a) - r (2D - F)) / (2 (D - F)).
+    r^2 (2D - F)^2 needs ~150 bits, so the terms are byte-math BigUInts.
+    """
+    denominator = BigUInt(FEE_DENOMINATOR)
+    kept = denominator - BigUInt(fee_rate)  # D - F
+    reserve = BigUInt(reserve_in)
+    linear = reserve * (denominator + kept)  # r (2D - F)
+    root = op.bsqrt(linear * linear + BigUInt(4) * kept * denominator * reserve * BigUInt(amount_in))
+    return op.btoi(((root - linear) // (BigUInt(2) * kept)).bytes)
@@ -0,0 +1,385 @@
+from algopy import ARC4Contract, Account, Application, BoxMap, UInt64, GlobalState, Global, Txn, TealType, OpUpFeeSource, arc4, ensure_budget, op, subroutine
+from algopy.arc4 import abimethod
+
+from smart_contracts.emoswapalgo.amm_math import FEE_DENOMINATOR, mul_div
+from smart_contracts.emoswapalgo.tick_math import (
+    MAX_TICK_INDEX,
+    TICK_SPACING,
+    amount_a_delta,
+    amount_b_delta,
+    compute_swap_step,
+    tick_to_sqrt_price,
+)
+
+# One bit per spaced tick index, packed into big-endian uint64 words in one
+# box; bits are numbered from the least significant end of each word
+TICK_BITMAP_KEY = b"bitmap"
+TICK_BITMAP_WORDS = MAX_TICK_INDEX // TICK_SPACING // 64 + 1
+TICK_BITMAP_SIZE = TICK_BITMAP_WORDS * 8  # 3456 bytes: 4 box references of I/O quota
+# Worst-case cost of one swap step (tick search, sqrt price and BigUInt math)
+SWAP_OPCODES_PER_STEP = 700
+BITMAP_OPCODES_PER_WORD = 30
+MINT_OPCODES = 1_000
+
+
+class TickInfo(arc4.Struct):
+    liquidity_lower: arc4.UInt64  # Liquidity of positions whose range starts here
+    liquidity_upper: arc4.UInt64  # Liquidity of positions whose range ends here
+
+
+class PositionKey(arc4.Struct, frozen=True):
+    owner: arc4.Address
+    tick_lower: arc4.UInt64
+    tick_upper: arc4.UInt64
+
+
+# Concentrated liquidity for one pair: LPs supply liquidity over tick ranges.
+# Ticks are unsigned indices (see tick_math.py) and multiples of TICK_SPACING.
+# `tick` only moves when a swap crosses an initialized tick or a mint adds
+# one, so inside a range it may lag the exact price; it still sorts every
+# initialized tick correctly against `sqrt_price`, which is all the swap
+# loop and range checks need. Swap fees come off the input up front and
+# accrue to fees_a / fees_b rather than to positions, until the admin
+# takes them with collect_fees.
+class ConcentratedPool(ARC4Contract):
+    # Global state variables
+    admin = GlobalState(TealType.bytes, default=Global.creator_address())
+    asset_a = GlobalState(TealType.uint64, default=UInt64(0))
+    asset_b = GlobalState(TealType.uint64, default=UInt64(0))
+    fee_rate = GlobalState(TealType.uint64, default=UInt64(3))  # 0.3%
+    sqrt_price = GlobalState(TealType.uint64, default=UInt64(0))  # UQ32.32, 0 until initialize
+    tick = GlobalState(TealType.uint64, default=UInt64(0))  # Tick index
+    liquidity = GlobalState(TealType.uint64, default=UInt64(0))  # Active at the current tick
+    reserve_a = GlobalState(TealType.uint64, default=UInt64(0))
+    reserve_b = GlobalState(TealType.uint64, default=UInt64(0))
+    fees_a = GlobalState(TealType.uint64, default=UInt64(0))
+    fees_b = GlobalState(TealType.uint64, default=UInt64(0))
+    router_app_id = GlobalState(TealType.uint64, default=UInt64(0))  # Emoswapalgo router
+
+    # Box storage: 12,500 microAlgos MBR per initialized tick, 25,300 per position
+    ticks = BoxMap(arc4.UInt64, TickInfo, key_prefix=b"t")
+    positions = BoxMap(PositionKey, arc4.UInt64, key_prefix=b"p")
+
+    @subroutine
+    def _is_admin_or_router(self) -> bool:
+        """The admin, or the Emoswapalgo router app acting for a user"""
+        router_app_id = self.router_app_id.get()
+        return Txn.sender == self.admin.get() or (
+            router_app_id != UInt64(0) and Txn.sender == Application(router_app_id).address
+        )
+
+    @subroutine
+    def _set_tick_bit(self, tick: UInt64, initialized: bool) -> None:
+        compressed = tick // UInt64(TICK_SPACING)
+        offset = compressed // UInt64(64) * UInt64(8)
+        word = op.btoi(op.Box.extract(TICK_BITMAP_KEY, offset, UInt64(8)))
+        word = op.setbit_uint64(word, compressed % UInt64(64), initialized)
+        op.Box.replace(TICK_BITMAP_KEY, offset, op.itob(word))
+
+    @subroutine
+    def _next_tick_above(self, tick: UInt64) -> tuple[UInt64, bool]:
+        """Lowest initialized tick above `tick`, scanning the bitmap a word at a time"""
+        compressed = tick // UInt64(TICK_SPACING) + UInt64(1)
+        word_index = compressed // UInt64(64)
+        if word_index >= UInt64(TICK_BITMAP_WORDS):
+            return UInt64(0), False
+        shift = compressed % UInt64(64)
+        word = op.btoi(op.Box.extract(TICK_BITMAP_KEY, word_index * UInt64(8), UInt64(8)))
+        word = (word >> shift) << shift  # Drop bits at or below `tick`
+        while word == UInt64(0):
+            word_index += UInt64(1)
+            if word_index == UInt64(TICK_BITMAP_WORDS):
+                return UInt64(0), False
+            ensure_budget(UInt64(BITMAP_OPCODES_PER_WORD), OpUpFeeSource.GroupCredit)
+            word = op.btoi(op.Box.extract(TICK_BITMAP_KEY, word_index * UInt64(8), UInt64(8)))
+        lowest_bit = op.bitlen(word & (~word + UInt64(1))) - UInt64(1)
+        return (word_index * UInt64(64) + lowest_bit) * UInt64(TICK_SPACING), True
+
+    @subroutine
+    def _next_tick_at_or_below(self, tick: UInt64) -> tuple[UInt64, bool]:
+        """Highest initialized tick at or below `tick`, scanning the bitmap a word at a time"""
+        compressed = tick // UInt64(TICK_SPACING)
+        word_index = compressed // UInt64(64)
+        shift = UInt64(63) - compressed % UInt64(64)
+        word = op.btoi(op.Box.extract(TICK_BITMAP_KEY, word_index * UInt64(8), UInt64(8)))
+        word = (word << shift) >> shift  # Drop bits above `tick`
+        while word == UInt64(0):
+            if word_index == UInt64(0):
+                return UInt64(0), False
+            word_index -= UInt64(1)
+            ensure_budget(UInt64(BITMAP_OPCODES_PER_WORD), OpUpFeeSource.GroupCredit)
+            word = op.btoi(op.Box.extract(TICK_BITMAP_KEY, word_index * UInt64(8), UInt64(8)))
+        highest_bit = op.bitlen(word) - UInt64(1)
+        return (word_index * UInt64(64) + highest_bit) * UInt64(TICK_SPACING), True
+
+    @subroutine
+    def _add_tick_liquidity(self, tick: UInt64, amount: UInt64, lower: bool) -> None:
+        key = arc4.UInt64(tick)
+        if key in self.ticks:
+            info = self.ticks[key].copy()
+        else:
+            info = TickInfo(arc4.UInt64(0), arc4.UInt64(0))
+            self._set_tick_bit(tick, True)
+        if lower:
+            info.liquidity_lower = arc4.UInt64(info.liquidity_lower.native + amount)
+        else:
+            info.liquidity_upper = arc4.UInt64(info.liquidity_upper.native + amount)
+        self.ticks[key] = info.copy()
+
+    @subroutine
+    def _remove_tick_liquidity(self, tick: UInt64, amount: UInt64, lower: bool) -> None:
+        key = arc4.UInt64(tick)
+        info = self.ticks[key].copy()
+        if lower:
+            info.liquidity_lower = arc4.UInt64(info.liquidity_lower.native - amount)
+        else:
+            info.liquidity_upper = arc4.UInt64(info.liquidity_upper.native - amount)
+        if info.liquidity_lower.native == UInt64(0) and info.liquidity_upper.native == UInt64(0):
+            del self.ticks[key]
+            self._set_tick_bit(tick, False)
+        else:
+            self.ticks[key] = info.copy()
+
+    @subroutine
+    def _sync_tick(self, boundary: UInt64, sqrt_boundary: UInt64) -> None:
+        """Move the lagging `tick` past a newly used boundary so it sorts correctly"""
+        sqrt_price = self.sqrt_price.get()
+        current_tick = self.tick.get()
+        if sqrt_boundary < sqrt_price and current_tick < boundary:
+            self.tick.set(boundary)
+        elif sqrt_boundary > sqrt_price and current_tick >= boundary:
+            self.tick.set(boundary - UInt64(1))
+
+    @subroutine
+    def _position_amounts(
+        self,
+        tick_lower: UInt64,
+        tick_upper: UInt64,
+        sqrt_lower: UInt64,
+        sqrt_upper: UInt64,
+        liquidity: UInt64,
+        round_up: bool,
+    ) -> tuple[UInt64, UInt64, bool]:
+        """(amount A, amount B, in range) backing `liquidity` over a range at the current price"""
+        current_tick = self.tick.get()
+        if current_tick < tick_lower:
+            return amount_a_delta(liquidity, sqrt_lower, sqrt_upper, round_up), UInt64(0), False
+        if current_tick >= tick_upper:
+            return UInt64(0), amount_b_delta(liquidity, sqrt_lower, sqrt_upper, round_up), False
+        sqrt_price = self.sqrt_price.get()
+        if sqrt_price < sqrt_lower:
+            sqrt_price = sqrt_lower
+        elif sqrt_price > sqrt_upper:
+            sqrt_price = sqrt_upper
+        return (
+            amount_a_delta(liquidity, sqrt_price, sqrt_upper, round_up),
+            amount_b_delta(liquidity, sqrt_lower, sqrt_price, round_up),
+            True,
+        )
+
+    @subroutine
+    def _swap(self, amount_in: UInt64, a_for_b: bool) -> UInt64:
+        sqrt_price = self.sqrt_price.get()
+        assert sqrt_price > UInt64(0)  # Pool initialized
+        current_tick = self.tick.get()
+        liquidity = self.liquidity.get()
+
+        fee = mul_div(amount_in, self.fee_rate.get(), UInt64(FEE_DENOMINATOR))
+        remaining = amount_in - fee
+        amount_out = UInt64(0)
+
+        # One step per liquidity range: run to the next initialized tick, cross it
+        while remaining > UInt64(0):
+            ensure_budget(UInt64(SWAP_OPCODES_PER_STEP), OpUpFeeSource.GroupCredit)
+            if a_for_b:
+                next_tick, initialized = self._next_tick_at_or_below(current_tick)
+            else:
+                next_tick, initialized = self._next_tick_above(current_tick)
+                if not initialized:
+                    next_tick = UInt64(MAX_TICK_INDEX)
+            sqrt_target = tick_to_sqrt_price(next_tick)
+
+            sqrt_price, step_in, step_out = compute_swap_step(
+                sqrt_price, sqrt_target, liquidity, remaining, a_for_b
+            )
+            remaining -= step_in
+            amount_out += step_out
+
+            if sqrt_price == sqrt_target:
+                assert initialized or remaining == UInt64(0)  # Not enough liquidity
+                if initialized:
+                    info = self.ticks[arc4.UInt64(next_tick)].copy()
+                    if a_for_b:
+                        liquidity = liquidity + info.liquidity_upper.native - info.liquidity_lower.native
+                        current_tick = next_tick - UInt64(1)
+                    else:
+                        liquidity = liquidity + info.liquidity_lower.native - info.liquidity_upper.native
+                        current_tick = next_tick
+
+        self.sqrt_price.set(sqrt_price)
+        self.tick.set(current_tick)
+        self.liquidity.set(liquidity)
+        if a_for_b:
+            self.fees_a.set(self.fees_a.get() + fee)
+            self.reserve_a.set(self.reserve_a.get() + amount_in - fee)
+            self.reserve_b.set(self.reserve_b.get() - amount_out)
+        else:
+            self.fees_b.set(self.fees_b.get() + fee)
+            self.reserve_b.set(self.reserve_b.get() + amount_in - fee)
+            self.reserve_a.set(self.reserve_a.get() - amount_out)
+        return amount_out
+
+    @abimethod()
+    def set_router_app_id(self, app_id: UInt64) -> None:
+        """Allow an Emoswapalgo router app to call this app for users (admin only)"""
+        assert Txn.sender == self.admin.get()
+        self.router_app_id.set(app_id)
+
+    @abimethod()
+    def set_assets(self, asset_a: UInt64, asset_b: UInt64) -> None:
+        """Set asset pair for the pool (admin only)"""
+        assert Txn.sender == self.admin.get()
+        self.asset_a.set(asset_a)
+        self.asset_b.set(asset_b)
+
+    @abimethod()
+    def set_fee_rate(self, rate: UInt64) -> None:
+        """Set swap fee rate (in tenths of a percent) (admin only)"""
+        assert Txn.sender == self.admin.get()
+        assert rate < UInt64(FEE_DENOMINATOR)
+        self.fee_rate.set(rate)
+
+    @abimethod()
+    def collect_fees(self) -> tuple[UInt64, UInt64]:
+        """Take the swap fees collected in A and B, resetting them to zero (admin only)"""
+        assert Txn.sender == self.admin.get()
+        fees = (self.fees_a.get(), self.fees_b.get())
+        self.fees_a.set(UInt64(0))
+        self.fees_b.set(UInt64(0))
+        return fees
+
+    @abimethod()
+    def initialize(self, tick: UInt64) -> None:
+        """Set the starting price to a tick and create the tick bitmap box (admin only).
+
+        The app must first be funded with the bitmap's 1,387,300 microAlgo MBR.
+        """
+        assert Txn.sender == self.admin.get()
+        assert self.sqrt_price.get() == UInt64(0)  # Not initialized yet
+        self.sqrt_price.set(tick_to_sqrt_price(tick))
+        self.tick.set(tick)
+        assert op.Box.create(TICK_BITMAP_KEY, UInt64(TICK_BITMAP_SIZE))
+
+    @abimethod(readonly=True)
+    def get_pool_state(self) -> tuple[UInt64, UInt64, UInt64]:
+        """Get (sqrt_price, tick, active liquidity)"""
+        return (self.sqrt_price.get(), self.tick.get(), self.liquidity.get())
+
+    @abimethod(readonly=True)
+    def get_reserves(self) -> tuple[UInt64, UInt64]:
+        """Get the amounts backing all positions"""
+        return (self.reserve_a.get(), self.reserve_b.get())
+
+    @abimethod(readonly=True)
+    def get_fees(self) -> tuple[UInt64, UInt64]:
+        """Get swap fees collected in A and B"""
+        return (self.fees_a.get(), self.fees_b.get())
+
+    @abimethod(readonly=True)
+    def get_fee_rate(self) -> UInt64:
+        """Get swap fee rate"""
+        return self.fee_rate.get()
+
+    @abimethod(readonly=True)
+    def get_tick(self, tick: UInt64) -> TickInfo:
+        """Get the liquidity starting and ending at a tick (zero if uninitialized)"""
+        return self.ticks.get(
+            arc4.UInt64(tick), default=TickInfo(arc4.UInt64(0), arc4.UInt64(0))
+        ).copy()
+
+    @abimethod(readonly=True)
+    def get_position(self, owner: Account, tick_lower: UInt64, tick_upper: UInt64) -> UInt64:
+        """Get a position's liquidity"""
+        key = PositionKey(arc4.Address(owner), arc4.UInt64(tick_lower), arc4.UInt64(tick_upper))
+        return self.positions.get(key, default=arc4.UInt64(0)).native
+
+    @abimethod()
+    def mint(
+        self, tick_lower: UInt64, tick_upper: UInt64, liquidity: UInt64
+    ) -> tuple[UInt64, UInt64]:
+        """Add liquidity over [tick_lower, tick_upper) for the sender (admin or router only)"""
+        assert self._is_admin_or_router()
+        assert self.sqrt_price.get() > UInt64(0)  # Pool initialized
+        assert tick_lower % UInt64(TICK_SPACING) == UInt64(0)
+        assert tick_upper % UInt64(TICK_SPACING) == UInt64(0)
+        # Index 0 is kept free so a crossed tick can always step below it
+        assert UInt64(0) < tick_lower and tick_lower < tick_upper
+        assert tick_upper <= UInt64(MAX_TICK_INDEX)
+        assert liquidity > UInt64(0)
+        ensure_budget(UInt64(MINT_OPCODES), OpUpFeeSource.GroupCredit)
+
+        sqrt_lower = tick_to_sqrt_price(tick_lower)
+        sqrt_upper = tick_to_sqrt_price(tick_upper)
+        self._sync_tick(tick_lower, sqrt_lower)
+        self._sync_tick(tick_upper, sqrt_upper)
+        self._add_tick_liquidity(tick_lower, liquidity, True)
+        self._add_tick_liquidity(tick_upper, liquidity, False)
+
+        key = PositionKey(arc4.Address(Txn.sender), arc4.UInt64(tick_lower), arc4.UInt64(tick_upper))
+        current = self.positions.get(key, default=arc4.UInt64(0)).native
+        self.positions[key] = arc4.UInt64(current + liquidity)
+
+        # Rounded up, so the pool always holds at least what positions are owed
+        amount_a, amount_b, in_range = self._position_amounts(
+            tick_lower, tick_upper, sqrt_lower, sqrt_upper, liquidity, True
+        )
+        if in_range:
+            self.liquidity.set(self.liquidity.get() + liquidity)
+        self.reserve_a.set(self.reserve_a.get() + amount_a)
+        self.reserve_b.set(self.reserve_b.get() + amount_b)
+        return (amount_a, amount_b)
+
+    @abimethod()
+    def burn(
+        self, tick_lower: UInt64, tick_upper: UInt64, liquidity: UInt64
+    ) -> tuple[UInt64, UInt64]:
+        """Remove liquidity from the sender's position (admin or router only)"""
+        assert self._is_admin_or_router()
+        assert liquidity > UInt64(0)
+        ensure_budget(UInt64(MINT_OPCODES), OpUpFeeSource.GroupCredit)
+
+        key = PositionKey(arc4.Address(Txn.sender), arc4.UInt64(tick_lower), arc4.UInt64(tick_upper))
+        current = self.positions[key].native
+        assert liquidity <= current
+        if liquidity == current:
+            del self.positions[key]
+        else:
+            self.positions[key] = arc4.UInt64(current - liquidity)
+        self._remove_tick_liquidity(tick_lower, liquidity, True)
+        self._remove_tick_liquidity(tick_upper, liquidity, False)
+
+        amount_a, amount_b, in_range = self._position_amounts(
+            tick_lower,
+            tick_upper,
+            tick_to_sqrt_price(tick_lower),
+            tick_to_sqrt_price(tick_upper),
+            liquidity,
+            False,
+        )
+        if in_range:
+            self.liquidity.set(self.liquidity.get() - liquidity)
+        self.reserve_a.set(self.reserve_a.get() - amount_a)
+        self.reserve_b.set(self.reserve_b.get() - amount_b)
+        return (amount_a, amount_b)
+
+    @abimethod()
+    def swap_a_for_b(self, amount_a: UInt64) -> UInt64:
+        """Swap asset A for asset B across as many ranges as needed (admin or router only)"""
+        assert self._is_admin_or_router()
+        return self._swap(amount_a, True)
+
+    @abimethod()
+    def swap_b_for_a(self, amount_b: UInt64) -> UInt64:
+        """Swap asset B for asset A across as many ranges as needed (admin or router only)"""
+        assert self._is_admin_or_router()
+        return self._swap(amount_b, False)
@@ -1,6 +1,11 @@
-from algopy import ARC4Contract, String, UInt64, GlobalState, Global, Txn, TealType
+from algopy import ARC4Contract, Application, Bytes, String, UInt64, GlobalState, Global, Txn, TealType, arc4, gtxn, op
 from algopy.arc4 import abimethod
 
+from smart_contracts.emoswapalgo.min_balance import min_balance_growth
+
+from smart_contracts.emoswapalgo.staking_rewards import StakingRewards
+from smart_contracts.emoswapalgo.swap_pool import SwapPool
+
 
 class Emoswapalgo(ARC4Contract):
     # Global state variables
@@ -17,32 +22,32 @@ class Emoswapalgo(ARC4Contract):
         """Welcome message"""
         return "Hello, " + name + "! Welcome to EmoSwap - The Future of Emotion Trading!"
     
-    @abimethod()
+    @abimethod(readonly=True)
     def get_mood_token_id(self) -> UInt64:
         """Get MOOD token ID"""
         return self.mood_token_id.get()
     
-    @abimethod()
+    @abimethod(readonly=True)
     def get_emotion_factory_id(self) -> UInt64:
         """Get EmotionFactory App ID"""
         return self.emotion_factory_id.get()
     
-    @abimethod()
+    @abimethod(readonly=True)
     def get_governance_id(self) -> UInt64:
         """Get Governance App ID"""
         return self.governance_id.get()
     
-    @abimethod()
+    @abimethod(readonly=True)
     def get_liquidity_pool_id(self) -> UInt64:
-        """Get LiquidityPool App ID"""
+        """Get LiquidityPool App ID (legacy: liquidity now lives in SwapPool)"""
         return self.liquidity_pool_id.get()
     
-    @abimethod()
+    @abimethod(readonly=True)
     def get_staking_rewards_id(self) -> UInt64:
         """Get StakingRewards App ID"""
         return self.staking_rewards_id.get()
     
-    @abimethod()
+    @abimethod(readonly=True)
     def get_swap_pool_id(self) -> UInt64:
         """Get SwapPool App ID"""
         return self.swap_pool_id.get()
@@ -71,7 +76,7 @@ class Emoswapalgo(ARC4Contract):
         assert Txn.sender == self.admin.get()
         self.swap_pool_id.set(app_id)
     
-    @abimethod()
+    @abimethod(readonly=True)
     def get_all_contract_ids(self) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64, UInt64]:
         """Get all contract IDs"""
         return (
@@ -82,3 +87,51 @@ class Emoswapalgo(ARC4Contract):
             self.staking_rewards_id.get(),
             self.swap_pool_id.get()
         )
+    
+    @abimethod()
+    def zap_into_farm(
+        self,
+        deposit: gtxn.AssetTransferTransaction,
+        mbr_payment: gtxn.PaymentTransaction,
+        swap_amount: UInt64,
+    ) -> UInt64:
+        """Swap part of a deposit of asset A to B, add both sides as liquidity and stake the LP shares.
+
+        `deposit` must move the sender's asset A into the SwapPool, and only
+        what it actually delivered is swapped and added. Each step is an
+        inner app call (fees are pooled from the outer call, 4 * min fee in
+        total); the swap and the deposit both go to the SwapPool AMM, which
+        together with StakingRewards must have this app set as its router.
+        `mbr_payment` pays StakingRewards for any growth of the sender's
+        staker record and stake history. Returns the LP shares staked for
+        the sender.
+        """
+        swap_pool = Application(self.swap_pool_id.get())
+        pool_asset_a, exists = op.AppGlobal.get_ex_uint64(swap_pool, Bytes(b"asset_a"))
+        assert exists  # Registered app is a SwapPool
+        assert deposit.sender == Txn.sender  # Deposit comes from the caller
+        assert deposit.asset_receiver == swap_pool.address  # Deposit lands in the pool
+        assert deposit.xfer_asset.id == pool_asset_a  # Deposit is the pool's asset A
+        amount_a = deposit.asset_amount
+        assert swap_amount > UInt64(0) and swap_amount < amount_a
+        
+        # The B bought is deposited straight back, so no separate swap minimum
+        amount_b, _swap_txn = arc4.abi_call(
+            SwapPool.swap_a_for_b, swap_amount, UInt64(0), app_id=swap_pool, fee=0
+        )
+        minted, _add_txn = arc4.abi_call(
+            SwapPool.add_liquidity, amount_a - swap_amount, amount_b, app_id=swap_pool, fee=0
+        )
+        
+        staking = Application(self.staking_rewards_id.get())
+        min_balance_before = staking.address.min_balance
+        arc4.abi_call(
+            StakingRewards.stake_for,
+            Txn.sender,
+            minted,
+            app_id=staking,
+            fee=0,
+        )
+        assert mbr_payment.receiver == staking.address
+        assert mbr_payment.amount >= min_balance_growth(staking.address, min_balance_before)
+        return minted
@@ -1,6 +1,52 @@
-from algopy import ARC4Contract, UInt64, GlobalState, Global, Txn, TealType
+import typing
+
+from algopy import ARC4Contract, Account, Asset, BoxMap, Bytes, String, UInt64, GlobalState, Global, Txn, TealType, OpUpFeeSource, arc4, ensure_budget, itxn, op, subroutine
 from algopy.arc4 import abimethod
 
+from smart_contracts.emoswapalgo.min_balance import assert_min_balance_paid
+
+# Emotion ASAs are whole units minted out of the factory's own balance
+EMOTION_TOTAL_SUPPLY = 10**12
+EMOTION_UNIT_NAME = b"EMO"
+# Rough opcode cost of creating and registering one emotion in create_emotions
+CREATE_OPCODES_PER_EMOTION = 250
+# Daily mints accrue once per epoch
+EPOCH_LENGTH = 86_400
+# Airdrop claimed-bitmaps are split into chunk boxes created, and paid for,
+# by the first claimer of each chunk, so setting up an airdrop is one call
+# whatever the recipient count
+AIRDROP_CHUNK_BYTES = 1024
+AIRDROP_CHUNK_LEAVES = AIRDROP_CHUNK_BYTES * 8
+AIRDROP_CHUNK_PREFIX = b"m"
+MAX_PROOF_LENGTH = 32
+# Rough opcode cost of claim_airdrop, plus one sha256 and loop step per proof level
+CLAIM_AIRDROP_OPCODES = 300
+VERIFY_OPCODES_PER_LEVEL = 60
+
+Hash32: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
+
+class EmotionRecord(arc4.Struct):
+    asset_id: arc4.UInt64
+    created_round: arc4.UInt64
+    mint_amount: arc4.UInt64
+
+
+class ClaimKey(arc4.Struct, frozen=True):
+    claimer: arc4.Address
+    asset_id: arc4.UInt64
+
+
+class Airdrop(arc4.Struct):
+    root: Hash32  # Merkle root over sha256(itob(index) + address + itob(amount)) leaves
+    leaf_count: arc4.UInt64
+    asset_id: arc4.UInt64
+
+
+class AirdropChunkKey(arc4.Struct, frozen=True):
+    airdrop_id: arc4.UInt64
+    chunk: arc4.UInt64
+
 
 class EmotionFactory(ARC4Contract):
     # Global state variables
@@ -9,6 +55,46 @@ class EmotionFactory(ARC4Contract):
     paused = GlobalState(TealType.uint64, default=UInt64(0))
     emotion_count = GlobalState(TealType.uint64, default=UInt64(0))
     mood_token_id = GlobalState(TealType.uint64, default=UInt64(746157034))
+    airdrop_count = GlobalState(TealType.uint64, default=UInt64(0))
+
+    # Box storage: emotion name -> record, and asset ID -> emotion name
+    emotions = BoxMap(String, EmotionRecord, key_prefix=b"e")
+    emotion_names = BoxMap(UInt64, String, key_prefix=b"a")
+    # (claimer, emotion asset) -> last epoch whose daily mint was claimed
+    last_claimed_epoch = BoxMap(ClaimKey, arc4.UInt64, key_prefix=b"c")
+    # Airdrop ID -> Merkle root; claimed bits live in AIRDROP_CHUNK_PREFIX boxes
+    airdrops = BoxMap(UInt64, Airdrop, key_prefix=b"d")
+
+    @subroutine
+    def _register_emotion(self, emotion_name: String, asset_id: UInt64) -> None:
+        assert emotion_name not in self.emotions  # Name not taken
+        assert asset_id not in self.emotion_names  # Asset not registered
+
+        self.emotions[emotion_name] = EmotionRecord(
+            arc4.UInt64(asset_id),
+            arc4.UInt64(Global.round),
+            arc4.UInt64(self.mint_amount.get()),
+        )
+        self.emotion_names[asset_id] = emotion_name
+
+    @subroutine
+    def _current_epoch(self) -> UInt64:
+        return Global.latest_timestamp // UInt64(EPOCH_LENGTH)
+
+    @subroutine
+    def _claimable_epochs(self, key: ClaimKey) -> UInt64:
+        """Epochs accrued since the last claim; a first claim covers the current epoch only"""
+        last_epoch, exists = self.last_claimed_epoch.maybe(key)
+        if not exists:
+            return UInt64(1)
+        return self._current_epoch() - last_epoch.native
+
+    @subroutine
+    def _airdrop_chunk_name(self, airdrop_id: UInt64, index: UInt64) -> Bytes:
+        chunk_key = AirdropChunkKey(
+            arc4.UInt64(airdrop_id), arc4.UInt64(index // UInt64(AIRDROP_CHUNK_LEAVES))
+        )
+        return Bytes(AIRDROP_CHUNK_PREFIX) + chunk_key.bytes
 
     @abimethod()
     def set_mint_amount(self, amount: UInt64) -> None:
@@ -22,34 +108,224 @@ class EmotionFactory(ARC4Contract):
         assert Txn.sender == self.admin.get()
         self.paused.set(paused_state)
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_mint_amount(self) -> UInt64:
         """Get daily mint amount"""
         return self.mint_amount.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_paused_state(self) -> UInt64:
         """Get pause state"""
         return self.paused.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_emotion_count(self) -> UInt64:
         """Get total emotion count"""
         return self.emotion_count.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_mood_token_id(self) -> UInt64:
         """Get MOOD token ID"""
         return self.mood_token_id.get()
 
+    @abimethod(readonly=True)
+    def get_current_epoch(self) -> UInt64:
+        """Get the current daily mint epoch"""
+        return self._current_epoch()
+
+    @abimethod(readonly=True)
+    def get_claimable(self, claimer: Account, emotion_name: String) -> UInt64:
+        """Get the amount of an emotion a claimer could mint now"""
+        record, exists = self.emotions.maybe(emotion_name)
+        assert exists  # Emotion registered
+        key = ClaimKey(arc4.Address(claimer), record.asset_id)
+        return self._claimable_epochs(key) * record.mint_amount.native
+
+    @abimethod(readonly=True)
+    def get_emotion(self, emotion_name: String) -> EmotionRecord:
+        """Get the registry record of an emotion by name"""
+        record, exists = self.emotions.maybe(emotion_name)
+        assert exists  # Emotion registered
+        return record
+
+    @abimethod(readonly=True)
+    def get_emotion_name(self, asset_id: UInt64) -> String:
+        """Get the emotion name registered for an asset ID"""
+        name, exists = self.emotion_names.maybe(asset_id)
+        assert exists  # Asset registered
+        return name
+
     @abimethod()
-    def create_emotion(self, emotion_name: String) -> UInt64:
-        """Create a new emotion token (admin only)"""
+    def create_emotion(self, emotion_name: String, asset_id: UInt64) -> UInt64:
+        """Register an emotion token under a unique name (admin only)"""
         assert Txn.sender == self.admin.get()
         assert self.paused.get() == UInt64(0)  # Not paused
-        
+        self._register_emotion(emotion_name, asset_id)
+
         # Increment emotion count
         current_count = self.emotion_count.get()
         self.emotion_count.set(current_count + UInt64(1))
         
-        return current_count + UInt64(1)
\ No newline at end of file
+        return current_count + UInt64(1)
+
+    @abimethod()
+    def create_emotions(
+        self, emotion_names: arc4.DynamicArray[arc4.String]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Create and register one emotion ASA per name (admin only).
+
+        The ASAs are created by inner transactions with fee=0, so the caller
+        pays for them through the group's fee credit. Returns the new asset IDs.
+        """
+        assert Txn.sender == self.admin.get()
+        assert self.paused.get() == UInt64(0)  # Not paused
+        ensure_budget(
+            emotion_names.length * UInt64(CREATE_OPCODES_PER_EMOTION), OpUpFeeSource.GroupCredit
+        )
+
+        asset_ids = arc4.DynamicArray[arc4.UInt64]()
+        for name in emotion_names:
+            emotion_name = name.native
+            asset_id = (
+                itxn.AssetConfig(
+                    asset_name=emotion_name,
+                    unit_name=EMOTION_UNIT_NAME,
+                    total=EMOTION_TOTAL_SUPPLY,
+                    decimals=0,
+                    manager=Global.current_application_address,
+                    reserve=Global.current_application_address,
+                    fee=0,
+                )
+                .submit()
+                .created_asset.id
+            )
+            self._register_emotion(emotion_name, asset_id)
+            asset_ids.append(arc4.UInt64(asset_id))
+
+        self.emotion_count.set(self.emotion_count.get() + emotion_names.length)
+        return asset_ids
+
+    @abimethod()
+    def claim_daily_mint(self, emotion_name: String) -> UInt64:
+        """Mint every daily amount of an emotion accrued since the sender's last claim.
+
+        Only the sender's own record is touched, so the cost is the same
+        however many users there are. The inner transfer fee is paid by the
+        caller. A first claim creates the sender's claim box, so it must be
+        preceded by a payment to the app covering the box's minimum balance.
+        Returns the amount minted.
+        """
+        assert self.paused.get() == UInt64(0)  # Not paused
+        record, exists = self.emotions.maybe(emotion_name)
+        assert exists  # Emotion registered
+
+        key = ClaimKey(arc4.Address(Txn.sender), record.asset_id)
+        amount = self._claimable_epochs(key) * record.mint_amount.native
+        assert amount > UInt64(0)  # Nothing to claim this epoch
+        min_balance_before = Global.current_application_address.min_balance
+        self.last_claimed_epoch[key] = arc4.UInt64(self._current_epoch())
+        assert_min_balance_paid(min_balance_before)
+
+        itxn.AssetTransfer(
+            xfer_asset=Asset(record.asset_id.native),
+            asset_receiver=Txn.sender,
+            asset_amount=amount,
+            fee=0,
+        ).submit()
+        return amount
+
+    @abimethod(readonly=True)
+    def get_airdrop(self, airdrop_id: UInt64) -> Airdrop:
+        """Get an airdrop's Merkle root, leaf count and asset"""
+        airdrop, exists = self.airdrops.maybe(airdrop_id)
+        assert exists  # Airdrop exists
+        return airdrop
+
+    @abimethod(readonly=True)
+    def is_airdrop_claimed(self, airdrop_id: UInt64, index: UInt64) -> bool:
+        """Check whether leaf `index` of an airdrop has been claimed"""
+        chunk_name = self._airdrop_chunk_name(airdrop_id, index)
+        _length, exists = op.Box.length(chunk_name)
+        if not exists:
+            return False
+        bit = index % UInt64(AIRDROP_CHUNK_LEAVES)
+        byte = op.Box.extract(chunk_name, bit // UInt64(8), UInt64(1))
+        return op.getbit(byte, bit % UInt64(8)) == UInt64(1)
+
+    @abimethod()
+    def create_airdrop(self, root: Hash32, leaf_count: UInt64) -> UInt64:
+        """Start a MOOD airdrop from the Merkle root of its recipient list (admin only).
+
+        The app must hold enough MOOD to cover every leaf; it is opted in
+        here on the first airdrop. Returns the airdrop ID.
+        """
+        assert Txn.sender == self.admin.get()
+        assert leaf_count > UInt64(0)
+
+        mood = Asset(self.mood_token_id.get())
+        if not Global.current_application_address.is_opted_in(mood):
+            itxn.AssetTransfer(
+                xfer_asset=mood,
+                asset_receiver=Global.current_application_address,
+                asset_amount=0,
+                fee=0,
+            ).submit()
+
+        airdrop_id = self.airdrop_count.get() + UInt64(1)
+        self.airdrops[airdrop_id] = Airdrop(root.copy(), arc4.UInt64(leaf_count), arc4.UInt64(mood.id))
+        self.airdrop_count.set(airdrop_id)
+        return airdrop_id
+
+    @abimethod()
+    def claim_airdrop(
+        self,
+        airdrop_id: UInt64,
+        index: UInt64,
+        amount: UInt64,
+        proof: arc4.DynamicArray[Hash32],
+    ) -> UInt64:
+        """Claim the sender's airdrop leaf with its Merkle proof (inner transfer fee paid by the caller).
+
+        At each level the running hash is the left child when the leaf's
+        position bit is 0 and the right child otherwise. The first claim in
+        each chunk of AIRDROP_CHUNK_LEAVES leaves creates its bitmap box, so
+        it must be preceded by a payment to the app covering the box's
+        minimum balance. Returns the amount.
+        """
+        airdrop, exists = self.airdrops.maybe(airdrop_id)
+        assert exists  # Airdrop exists
+        assert index < airdrop.leaf_count.native
+        assert proof.length <= UInt64(MAX_PROOF_LENGTH)
+        ensure_budget(
+            UInt64(CLAIM_AIRDROP_OPCODES) + proof.length * UInt64(VERIFY_OPCODES_PER_LEVEL),
+            OpUpFeeSource.GroupCredit,
+        )
+
+        node = op.sha256(op.itob(index) + Txn.sender.bytes + op.itob(amount))
+        position = index
+        for sibling in proof:
+            if position % UInt64(2) == UInt64(0):
+                node = op.sha256(node + sibling.bytes)
+            else:
+                node = op.sha256(sibling.bytes + node)
+            position = position // UInt64(2)
+        assert node == airdrop.root.bytes  # Valid proof
+
+        # Flip the leaf's bit, creating its zeroed chunk box on first use
+        chunk_name = self._airdrop_chunk_name(airdrop_id, index)
+        min_balance_before = Global.current_application_address.min_balance
+        op.Box.create(chunk_name, UInt64(AIRDROP_CHUNK_BYTES))
+        assert_min_balance_paid(min_balance_before)
+        bit = index % UInt64(AIRDROP_CHUNK_LEAVES)
+        byte_index = bit // UInt64(8)
+        byte = op.Box.extract(chunk_name, byte_index, UInt64(1))
+        assert op.getbit(byte, bit % UInt64(8)) == UInt64(0)  # Not claimed yet
+        op.Box.replace(chunk_name, byte_index, op.setbit_bytes(byte, bit % UInt64(8), UInt64(1)))
+
+        itxn.AssetTransfer(
+            xfer_asset=Asset(airdrop.asset_id.native),
+            asset_receiver=Txn.sender,
+            asset_amount=amount,
+            fee=0,
+        ).submit()
+        return amount
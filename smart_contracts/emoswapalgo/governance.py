@@ -1,14 +1,52 @@
-from algopy import ARC4Contract, UInt64, GlobalState, Global, Txn, TealType
+from algopy import ARC4Contract, Account, BoxMap, UInt64, GlobalState, Global, Txn, TealType, arc4, subroutine
 from algopy.arc4 import abimethod
 
+from smart_contracts.emoswapalgo.min_balance import assert_min_balance_paid
+from smart_contracts.emoswapalgo.staking_rewards import StakingRewards
+
+VOTE_NO = 0
+VOTE_YES = 1
+VOTE_ABSTAIN = 2
+
+
+class Proposal(arc4.Struct):
+    """A proposal and its running tallies, weighted by voters' stake at snapshot_round"""
+    proposer: arc4.Address
+    start_time: arc4.UInt64
+    end_time: arc4.UInt64
+    snapshot_round: arc4.UInt64
+    yes_votes: arc4.UInt64
+    no_votes: arc4.UInt64
+    abstain_votes: arc4.UInt64
+
+
+class VoteKey(arc4.Struct, frozen=True):
+    proposal_id: arc4.UInt64
+    voter: arc4.Address
+
+
+class VoteRecord(arc4.Struct):
+    choice: arc4.UInt8
+    weight: arc4.UInt64
+
+
+class Ballot(arc4.Struct):
+    proposal_id: arc4.UInt64
+    choice: arc4.UInt8  # VOTE_NO, VOTE_YES or VOTE_ABSTAIN
+
 
 class Governance(ARC4Contract):
     # Global state variables
     admin = GlobalState(TealType.bytes, default=Global.creator_address())
-    min_proposal_amount = GlobalState(TealType.uint64, default=UInt64(1000))
+    min_proposal_amount = GlobalState(TealType.uint64, default=UInt64(1000))  # Proposer's LP stake
     voting_period = GlobalState(TealType.uint64, default=UInt64(604800))  # 7 days
     proposal_count = GlobalState(TealType.uint64, default=UInt64(0))
     mood_token_id = GlobalState(TealType.uint64, default=UInt64(746157034))
+    staking_rewards_id = GlobalState(TealType.uint64, default=UInt64(0))  # Source of vote weights
+
+    # Box storage: proposal ID -> proposal, and (proposal, voter) -> vote
+    proposals = BoxMap(UInt64, Proposal, key_prefix=b"p")
+    votes = BoxMap(VoteKey, VoteRecord, key_prefix=b"v")
 
     @abimethod()
     def set_min_proposal_amount(self, amount: UInt64) -> None:
@@ -23,32 +61,146 @@ class Governance(ARC4Contract):
         self.voting_period.set(period)
 
     @abimethod()
+    def set_staking_rewards_id(self, app_id: UInt64) -> None:
+        """Set StakingRewards App ID used for vote weights (admin only)"""
+        assert Txn.sender == self.admin.get()
+        self.staking_rewards_id.set(app_id)
+
+    @abimethod(readonly=True)
+    def get_staking_rewards_id(self) -> UInt64:
+        """Get StakingRewards App ID"""
+        return self.staking_rewards_id.get()
+
+    @abimethod(readonly=True)
     def get_min_proposal_amount(self) -> UInt64:
         """Get minimum proposal amount"""
         return self.min_proposal_amount.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_voting_period(self) -> UInt64:
         """Get voting period"""
         return self.voting_period.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_proposal_count(self) -> UInt64:
         """Get total proposal count"""
         return self.proposal_count.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_mood_token_id(self) -> UInt64:
         """Get MOOD token ID"""
         return self.mood_token_id.get()
 
+    @abimethod(readonly=True)
+    def get_proposal(self, proposal_id: UInt64) -> Proposal:
+        """Get a proposal with its current yes/no/abstain totals"""
+        proposal, exists = self.proposals.maybe(proposal_id)
+        assert exists  # Proposal exists
+        return proposal
+
+    @abimethod(readonly=True)
+    def get_vote(self, proposal_id: UInt64, voter: Account) -> VoteRecord:
+        """Get a voter's choice and weight on a proposal"""
+        vote, exists = self.votes.maybe(VoteKey(arc4.UInt64(proposal_id), arc4.Address(voter)))
+        assert exists  # Voter has voted
+        return vote
+
+    @abimethod(readonly=True)
+    def has_voted(self, proposal_id: UInt64, voter: Account) -> bool:
+        """Check whether a voter has voted on a proposal"""
+        return VoteKey(arc4.UInt64(proposal_id), arc4.Address(voter)) in self.votes
+
     @abimethod()
     def create_proposal(self, proposal_id: UInt64) -> UInt64:
-        """Create a new governance proposal (admin only)"""
+        """Create a new governance proposal open for voting_period seconds (admin only).
+
+        The proposer must have at least min_proposal_amount staked in
+        StakingRewards (inner call fee paid by the caller).
+        """
         assert Txn.sender == self.admin.get()
-        
+        assert proposal_id not in self.proposals  # Proposal ID not taken
+
+        stake, _txn = arc4.abi_call(
+            StakingRewards.get_staked,
+            Txn.sender,
+            app_id=self.staking_rewards_id.get(),
+            fee=0,
+        )
+        assert stake >= self.min_proposal_amount.get()  # Proposer has enough stake
+
+        now = Global.latest_timestamp
+        self.proposals[proposal_id] = Proposal(
+            arc4.Address(Txn.sender),
+            arc4.UInt64(now),
+            arc4.UInt64(now + self.voting_period.get()),
+            # Stake changed later in this round, or after it, cannot move the vote
+            arc4.UInt64(Global.round - UInt64(1)),
+            arc4.UInt64(0),
+            arc4.UInt64(0),
+            arc4.UInt64(0),
+        )
+
         # Increment proposal count
         current_count = self.proposal_count.get()
         self.proposal_count.set(current_count + UInt64(1))
         
-        return current_count + UInt64(1)
\ No newline at end of file
+        return current_count + UInt64(1)
+
+    @subroutine
+    def _cast_vote(self, proposal_id: UInt64, choice: UInt64) -> UInt64:
+        proposal, exists = self.proposals.maybe(proposal_id)
+        assert exists  # Proposal exists
+        assert Global.latest_timestamp < proposal.end_time.native  # Voting open
+        assert choice <= UInt64(VOTE_ABSTAIN)
+
+        vote_key = VoteKey(arc4.UInt64(proposal_id), arc4.Address(Txn.sender))
+        assert vote_key not in self.votes  # No double votes
+
+        weight, _txn = arc4.abi_call(
+            StakingRewards.get_staked_at,
+            Txn.sender,
+            proposal.snapshot_round.native,
+            app_id=self.staking_rewards_id.get(),
+            fee=0,
+        )
+        assert weight > UInt64(0)  # Voter had stake at the snapshot
+
+        if choice == UInt64(VOTE_YES):
+            proposal.yes_votes = arc4.UInt64(proposal.yes_votes.native + weight)
+        elif choice == UInt64(VOTE_NO):
+            proposal.no_votes = arc4.UInt64(proposal.no_votes.native + weight)
+        else:
+            proposal.abstain_votes = arc4.UInt64(proposal.abstain_votes.native + weight)
+        self.proposals[proposal_id] = proposal.copy()
+        self.votes[vote_key] = VoteRecord(arc4.UInt8(choice), arc4.UInt64(weight))
+
+        return weight
+
+    @abimethod()
+    def vote(self, proposal_id: UInt64, choice: UInt64) -> UInt64:
+        """Vote no (0), yes (1) or abstain (2) with the sender's stake at the snapshot round.
+
+        The weight comes from StakingRewards' stake history (inner call fee
+        paid by the caller). The proposal's totals are updated in place, so
+        results never need a scan of the votes. The vote box is paid for by
+        the caller: the preceding group transaction must pay the app its
+        minimum balance. Returns the vote weight.
+        """
+        min_balance_before = Global.current_application_address.min_balance
+        weight = self._cast_vote(proposal_id, choice)
+        assert_min_balance_paid(min_balance_before)
+        return weight
+
+    @abimethod()
+    def vote_many(self, ballots: arc4.DynamicArray[Ballot]) -> arc4.DynamicArray[arc4.UInt64]:
+        """Cast several votes in one call, each checked like vote() (inner call fees paid by the caller).
+
+        The preceding group transaction must pay the app for every new vote
+        box, as in vote(). Returns the weight of every ballot, in order.
+        """
+        min_balance_before = Global.current_application_address.min_balance
+        weights = arc4.DynamicArray[arc4.UInt64]()
+        for ballot in ballots:
+            weights.append(arc4.UInt64(self._cast_vote(ballot.proposal_id.native, ballot.choice.native)))
+        assert_min_balance_paid(min_balance_before)
+        return weights
@@ -0,0 +1,26 @@
+from algopy import Account, Global, Txn, UInt64, gtxn, subroutine
+
+
+@subroutine
+def min_balance_growth(account: Account, min_balance_before: UInt64) -> UInt64:
+    """How much `account`'s minimum balance rose since `min_balance_before` (0 if it did not)"""
+    min_balance_after = account.min_balance
+    if min_balance_after > min_balance_before:
+        return min_balance_after - min_balance_before
+    return UInt64(0)
+
+
+@subroutine
+def assert_min_balance_paid(min_balance_before: UInt64) -> None:
+    """Require the caller to fund any growth of the app's minimum balance since `min_balance_before`.
+
+    The transaction just before this app call must then be a payment to the
+    app covering the growth, so boxes created on behalf of a user are paid
+    for by that user instead of the app's own balance.
+    """
+    growth = min_balance_growth(Global.current_application_address, min_balance_before)
+    if growth > UInt64(0):
+        assert Txn.group_index > UInt64(0)  # Payment must precede the call
+        payment = gtxn.PaymentTransaction(Txn.group_index - UInt64(1))
+        assert payment.receiver == Global.current_application_address
+        assert payment.amount >= growth
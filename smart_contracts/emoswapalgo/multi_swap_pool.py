@@ -0,0 +1,141 @@
+from algopy import ARC4Contract, BoxMap, UInt64, GlobalState, Global, Txn, TealType, arc4, subroutine, urange
+from algopy.arc4 import abimethod
+
+from smart_contracts.emoswapalgo.amm_math import FEE_DENOMINATOR, get_amount_out
+
+
+class PairKey(arc4.Struct, frozen=True):
+    """Asset pair, always stored with asset_a < asset_b"""
+    asset_a: arc4.UInt64
+    asset_b: arc4.UInt64
+
+
+class PairState(arc4.Struct):
+    reserve_a: arc4.UInt64
+    reserve_b: arc4.UInt64
+    fee_rate: arc4.UInt64
+
+
+class MultiSwapPool(ARC4Contract):
+    # Global state variables
+    admin = GlobalState(TealType.bytes, default=Global.creator_address())
+    pair_count = GlobalState(TealType.uint64, default=UInt64(0))
+    default_fee_rate = GlobalState(TealType.uint64, default=UInt64(3))  # 0.3%
+
+    # Box storage: one box per asset pair
+    pairs = BoxMap(PairKey, PairState, key_prefix=b"p")
+
+    @subroutine
+    def _pair_key(self, asset_x: UInt64, asset_y: UInt64) -> PairKey:
+        assert asset_x != asset_y
+        if asset_x < asset_y:
+            return PairKey(arc4.UInt64(asset_x), arc4.UInt64(asset_y))
+        return PairKey(arc4.UInt64(asset_y), arc4.UInt64(asset_x))
+
+    @abimethod()
+    def set_default_fee_rate(self, rate: UInt64) -> None:
+        """Set fee rate used for newly added pairs (admin only)"""
+        assert Txn.sender == self.admin.get()
+        assert rate < UInt64(FEE_DENOMINATOR)
+        self.default_fee_rate.set(rate)
+
+    @abimethod()
+    def add_pair(self, asset_a: UInt64, asset_b: UInt64) -> UInt64:
+        """Register a new asset pair with empty reserves (admin only)"""
+        assert Txn.sender == self.admin.get()
+        key = self._pair_key(asset_a, asset_b)
+        assert key not in self.pairs  # Pair already exists
+
+        self.pairs[key] = PairState(
+            arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(self.default_fee_rate.get())
+        )
+
+        current_count = self.pair_count.get()
+        self.pair_count.set(current_count + UInt64(1))
+
+        return current_count + UInt64(1)
+
+    @abimethod()
+    def set_pair_fee_rate(self, asset_a: UInt64, asset_b: UInt64, rate: UInt64) -> None:
+        """Set swap fee rate for a pair (admin only)"""
+        assert Txn.sender == self.admin.get()
+        assert rate < UInt64(FEE_DENOMINATOR)
+        key = self._pair_key(asset_a, asset_b)
+        pair = self.pairs[key].copy()
+        pair.fee_rate = arc4.UInt64(rate)
+        self.pairs[key] = pair.copy()
+
+    @abimethod()
+    def add_reserves(
+        self, asset_a: UInt64, asset_b: UInt64, amount_a: UInt64, amount_b: UInt64
+    ) -> None:
+        """Add reserves to a pair, amounts given in the caller's asset order (admin only)"""
+        assert Txn.sender == self.admin.get()
+        key = self._pair_key(asset_a, asset_b)
+        pair = self.pairs[key].copy()
+
+        if asset_a == key.asset_a.native:
+            pair.reserve_a = arc4.UInt64(pair.reserve_a.native + amount_a)
+            pair.reserve_b = arc4.UInt64(pair.reserve_b.native + amount_b)
+        else:
+            pair.reserve_a = arc4.UInt64(pair.reserve_a.native + amount_b)
+            pair.reserve_b = arc4.UInt64(pair.reserve_b.native + amount_a)
+
+        self.pairs[key] = pair.copy()
+
+    @abimethod(readonly=True)
+    def get_pair(self, asset_a: UInt64, asset_b: UInt64) -> PairState:
+        """Get reserves and fee rate of a pair (reserves in ascending asset ID order)"""
+        return self.pairs[self._pair_key(asset_a, asset_b)].copy()
+
+    @abimethod(readonly=True)
+    def get_pair_count(self) -> UInt64:
+        """Get number of registered pairs"""
+        return self.pair_count.get()
+
+    @subroutine
+    def _swap(self, asset_in: UInt64, asset_out: UInt64, amount_in: UInt64) -> UInt64:
+        key = self._pair_key(asset_in, asset_out)
+        pair = self.pairs[key].copy()
+
+        a_to_b = asset_in == key.asset_a.native
+        if a_to_b:
+            reserve_in = pair.reserve_a.native
+            reserve_out = pair.reserve_b.native
+        else:
+            reserve_in = pair.reserve_b.native
+            reserve_out = pair.reserve_a.native
+
+        # Same fee-adjusted, 128-bit constant product math as SwapPool
+        if reserve_in > UInt64(0) and reserve_out > UInt64(0):
+            amount_out = get_amount_out(amount_in, reserve_in, reserve_out, pair.fee_rate.native)
+
+            if a_to_b:
+                pair.reserve_a = arc4.UInt64(reserve_in + amount_in)
+                pair.reserve_b = arc4.UInt64(reserve_out - amount_out)
+            else:
+                pair.reserve_a = arc4.UInt64(reserve_out - amount_out)
+                pair.reserve_b = arc4.UInt64(reserve_in + amount_in)
+            self.pairs[key] = pair.copy()
+
+            return amount_out
+        else:
+            return UInt64(0)
+
+    @abimethod()
+    def swap(self, asset_in: UInt64, asset_out: UInt64, amount_in: UInt64) -> UInt64:
+        """Swap within a single pair (admin only for now)"""
+        assert Txn.sender == self.admin.get()
+        return self._swap(asset_in, asset_out, amount_in)
+
+    @abimethod()
+    def swap_route(self, path: arc4.DynamicArray[arc4.UInt64], amount_in: UInt64) -> UInt64:
+        """Swap along path[0] -> path[1] -> ... across pairs in one call (admin only for now)"""
+        assert Txn.sender == self.admin.get()
+        assert path.length >= UInt64(2)
+
+        amount = amount_in
+        for i in urange(path.length - UInt64(1)):
+            amount = self._swap(path[i].native, path[i + UInt64(1)].native, amount)
+
+        return amount
@@ -1,6 +1,33 @@
-from algopy import ARC4Contract, UInt64, GlobalState, Global, Txn, TealType
+from algopy import ARC4Contract, Account, Application, Asset, BoxMap, Bytes, UInt64, GlobalState, Global, Txn, TealType, OpUpFeeSource, arc4, ensure_budget, itxn, op, subroutine
 from algopy.arc4 import abimethod
 
+from smart_contracts.emoswapalgo.amm_math import mul_div
+from smart_contracts.emoswapalgo.min_balance import assert_min_balance_paid
+
+# reward_per_token is a fixed-point value scaled by REWARD_PRECISION
+REWARD_PRECISION = 10**12
+SECONDS_PER_YEAR = 31_536_000
+# Rough opcode cost of settling one staker in claim_many / compound_many
+BATCH_OPCODES_PER_STAKER = 300
+# Stake history box: an 8-byte header holding the earliest round the
+# history can answer for (0 = complete), then (round, staked) entries.
+# One box reference covers 1 KB, so the oldest entry is dropped when full;
+# a full history locks 422,100 microAlgos, which stake / unstake callers pay
+# for as it grows.
+STAKE_HISTORY_PREFIX = b"k"
+STAKE_CHECKPOINT_SIZE = 16
+STAKE_HISTORY_HEADER_SIZE = 8
+MAX_STAKE_CHECKPOINTS = 63
+
+
+class StakerRecord(arc4.Struct):
+    """Fixed-width 40-byte per-staker record"""
+    staked: arc4.UInt64  # LP tokens
+    reward_debt: arc4.UInt64  # (staked + compounded_rewards) * reward_per_token at last checkpoint
+    accrued_rewards: arc4.UInt64  # Settled but unclaimed rewards
+    last_claim_time: arc4.UInt64
+    compounded_rewards: arc4.UInt64  # Reward tokens restaked by compound_many; earn like stake
+
 
 class StakingRewards(ARC4Contract):
     # Global state variables
@@ -9,6 +36,134 @@ class StakingRewards(ARC4Contract):
     reward_rate = GlobalState(TealType.uint64, default=UInt64(10))  # 10% per year
     total_staked = GlobalState(TealType.uint64, default=UInt64(0))
     last_update_time = GlobalState(TealType.uint64, default=UInt64(0))
+    reward_per_token_stored = GlobalState(TealType.uint64, default=UInt64(0))
+    router_app_id = GlobalState(TealType.uint64, default=UInt64(0))  # Emoswapalgo router
+
+    # Box storage: one packed StakerRecord per staker, keyed by address
+    stakers = BoxMap(Account, StakerRecord, key_prefix=b"s")
+
+    @subroutine
+    def _reward_per_token(self) -> UInt64:
+        """Accumulator value as of now, without writing it"""
+        reward_per_token = self.reward_per_token_stored.get()
+        last_update = self.last_update_time.get()
+        now = Global.latest_timestamp
+        if last_update > UInt64(0) and now > last_update:
+            # reward_rate percent per year, per staked token
+            reward_per_token += mul_div(
+                self.reward_rate.get() * (now - last_update),
+                UInt64(REWARD_PRECISION),
+                UInt64(100 * SECONDS_PER_YEAR),
+            )
+        return reward_per_token
+
+    @subroutine
+    def _update_reward_per_token(self) -> UInt64:
+        reward_per_token = self._reward_per_token()
+        self.reward_per_token_stored.set(reward_per_token)
+        self.last_update_time.set(Global.latest_timestamp)
+        return reward_per_token
+
+    @subroutine
+    def _load_staker(self, staker: Account) -> StakerRecord:
+        """Read a staker's record with a single box read (zeroes if absent)"""
+        return self.stakers.get(
+            staker,
+            default=StakerRecord(
+                arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0)
+            ),
+        ).copy()
+
+    @subroutine
+    def _earned(self, record: StakerRecord, reward_per_token: UInt64) -> UInt64:
+        """Accrued plus not-yet-settled rewards of a staker"""
+        earning = record.staked.native + record.compounded_rewards.native
+        return (
+            record.accrued_rewards.native
+            + mul_div(earning, reward_per_token, UInt64(REWARD_PRECISION))
+            - record.reward_debt.native
+        )
+
+    @subroutine
+    def _checkpoint(
+        self, record: StakerRecord, new_staked: UInt64, reward_per_token: UInt64
+    ) -> StakerRecord:
+        """Settle a staker's rewards and restart their debt at the new stake"""
+        earning = new_staked + record.compounded_rewards.native
+        return StakerRecord(
+            arc4.UInt64(new_staked),
+            arc4.UInt64(mul_div(earning, reward_per_token, UInt64(REWARD_PRECISION))),
+            arc4.UInt64(self._earned(record, reward_per_token)),
+            record.last_claim_time,
+            record.compounded_rewards,
+        )
+
+    @subroutine
+    def _settle_claim(self, staker: Account, record: StakerRecord, reward_per_token: UInt64) -> UInt64:
+        """Pay out everything a staker has earned or compounded and write back their record"""
+        amount = self._earned(record, reward_per_token) + record.compounded_rewards.native
+        staked = record.staked.native
+        self.stakers[staker] = StakerRecord(
+            arc4.UInt64(staked),
+            arc4.UInt64(mul_div(staked, reward_per_token, UInt64(REWARD_PRECISION))),
+            arc4.UInt64(0),
+            arc4.UInt64(Global.latest_timestamp),
+            arc4.UInt64(0),
+        )
+
+        if amount > UInt64(0):
+            itxn.AssetTransfer(
+                xfer_asset=Asset(self.reward_token.get()),
+                asset_receiver=staker,
+                asset_amount=amount,
+                fee=0,
+            ).submit()
+        return amount
+
+    @subroutine
+    def _write_stake_checkpoint(self, staker: Account, staked: UInt64) -> None:
+        """Append (current round, staked) to the staker's history box"""
+        name = Bytes(STAKE_HISTORY_PREFIX) + staker.bytes
+        entry = op.itob(Global.round) + op.itob(staked)
+        length, exists = op.Box.length(name)
+        if not exists:
+            op.Box.put(name, op.itob(0) + entry)
+            return
+
+        last = length - UInt64(STAKE_CHECKPOINT_SIZE)
+        if op.btoi(op.Box.extract(name, last, UInt64(8))) == Global.round:
+            # Several changes in one round keep only the final balance
+            op.Box.replace(name, last, entry)
+        elif (length - UInt64(STAKE_HISTORY_HEADER_SIZE)) // UInt64(STAKE_CHECKPOINT_SIZE) < UInt64(
+            MAX_STAKE_CHECKPOINTS
+        ):
+            op.Box.resize(name, length + UInt64(STAKE_CHECKPOINT_SIZE))
+            op.Box.replace(name, length, entry)
+        else:
+            # Drop the oldest entry; rounds before the next one become unknown
+            kept_start = UInt64(STAKE_HISTORY_HEADER_SIZE + STAKE_CHECKPOINT_SIZE)
+            kept = op.Box.extract(name, kept_start, length - kept_start)
+            op.Box.put(name, op.extract(kept, 0, 8) + kept + entry)
+
+    @subroutine
+    def _stake(self, staker: Account, amount: UInt64) -> UInt64:
+        reward_per_token = self._update_reward_per_token()
+        record = self._load_staker(staker)
+        self.stakers[staker] = self._checkpoint(
+            record, record.staked.native + amount, reward_per_token
+        )
+        self._write_stake_checkpoint(staker, record.staked.native + amount)
+
+        current_staked = self.total_staked.get()
+        self.total_staked.set(current_staked + amount)
+
+        return current_staked + amount
+
+    @abimethod()
+    def set_router_app_id(self, app_id: UInt64) -> None:
+        """Allow an Emoswapalgo router app to stake for users (admin only)"""
+        assert Txn.sender == self.admin.get()
+        self.router_app_id.set(app_id)
 
     @abimethod()
     def set_reward_token(self, token_id: UInt64) -> None:
@@ -20,41 +175,168 @@ class StakingRewards(ARC4Contract):
     def set_reward_rate(self, rate: UInt64) -> None:
         """Set reward rate (percentage per year) (admin only)"""
         assert Txn.sender == self.admin.get()
+        # Accrue at the old rate up to now before switching
+        self._update_reward_per_token()
         self.reward_rate.set(rate)
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_reward_rate(self) -> UInt64:
         """Get reward rate"""
         return self.reward_rate.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_total_staked(self) -> UInt64:
         """Get total staked amount"""
         return self.total_staked.get()
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_reward_token(self) -> UInt64:
         """Get reward token ID"""
         return self.reward_token.get()
 
+    @abimethod(readonly=True)
+    def get_reward_per_token(self) -> UInt64:
+        """Get reward per staked token accrued up to now (scaled by 10**12)"""
+        return self._reward_per_token()
+
+    @abimethod(readonly=True)
+    def get_staker(self, staker: Account) -> StakerRecord:
+        """Get a staker's record (zeroes if they never staked)"""
+        return self._load_staker(staker)
+
+    @abimethod(readonly=True)
+    def get_staked(self, staker: Account) -> UInt64:
+        """Get staked amount of a staker"""
+        return self._load_staker(staker).staked.native
+
+    @abimethod(readonly=True)
+    def get_pending_rewards(self, staker: Account) -> UInt64:
+        """Get rewards a staker has earned and not yet claimed or compounded"""
+        return self._earned(self._load_staker(staker), self._reward_per_token())
+
+    @abimethod(readonly=True)
+    def get_staked_at(self, staker: Account, round: UInt64) -> UInt64:
+        """Get a staker's stake as of the end of `round` (binary search over their history)"""
+        name = Bytes(STAKE_HISTORY_PREFIX) + staker.bytes
+        length, exists = op.Box.length(name)
+        if not exists:
+            return UInt64(0)
+        assert round >= op.btoi(op.Box.extract(name, UInt64(0), UInt64(8)))  # History kept that far
+
+        # Find the last entry whose round is <= `round`
+        low = UInt64(0)
+        high = (length - UInt64(STAKE_HISTORY_HEADER_SIZE)) // UInt64(STAKE_CHECKPOINT_SIZE)
+        while low < high:
+            middle = (low + high) // UInt64(2)
+            offset = UInt64(STAKE_HISTORY_HEADER_SIZE) + middle * UInt64(STAKE_CHECKPOINT_SIZE)
+            if op.btoi(op.Box.extract(name, offset, UInt64(8))) <= round:
+                low = middle + UInt64(1)
+            else:
+                high = middle
+        if low == UInt64(0):
+            return UInt64(0)  # Nothing staked yet at that round
+        offset = UInt64(STAKE_HISTORY_HEADER_SIZE) + (low - UInt64(1)) * UInt64(STAKE_CHECKPOINT_SIZE)
+        return op.btoi(op.Box.extract(name, offset + UInt64(8), UInt64(8)))
+
     @abimethod()
     def stake(self, amount: UInt64) -> UInt64:
-        """Stake LP tokens (admin only for now)"""
+        """Stake LP tokens (admin only for now).
+
+        When the sender's record or stake history grows, the preceding group
+        transaction must pay the app for the extra minimum balance.
+        """
         assert Txn.sender == self.admin.get()
-        
-        current_staked = self.total_staked.get()
-        self.total_staked.set(current_staked + amount)
-        
-        return current_staked + amount
+        min_balance_before = Global.current_application_address.min_balance
+        total = self._stake(Txn.sender, amount)
+        assert_min_balance_paid(min_balance_before)
+        return total
+
+    @abimethod()
+    def stake_for(self, staker: Account, amount: UInt64) -> UInt64:
+        """Stake LP tokens on behalf of a user (router app only).
+
+        The router charges the user for any growth of this app's minimum balance.
+        """
+        router_app_id = self.router_app_id.get()
+        assert router_app_id != UInt64(0) and Txn.sender == Application(router_app_id).address
+        return self._stake(staker, amount)
 
     @abimethod()
     def unstake(self, amount: UInt64) -> UInt64:
-        """Unstake LP tokens (admin only for now)"""
+        """Unstake LP tokens (admin only for now); history growth is paid for as in stake()"""
         assert Txn.sender == self.admin.get()
-        
+        min_balance_before = Global.current_application_address.min_balance
+
+        record = self._load_staker(Txn.sender)
+        assert record.staked.native >= amount  # Check sufficient balance
+
+        reward_per_token = self._update_reward_per_token()
+        self.stakers[Txn.sender] = self._checkpoint(
+            record, record.staked.native - amount, reward_per_token
+        )
+        self._write_stake_checkpoint(Txn.sender, record.staked.native - amount)
+        assert_min_balance_paid(min_balance_before)
+
         current_staked = self.total_staked.get()
-        assert current_staked >= amount  # Check sufficient balance
-        
         self.total_staked.set(current_staked - amount)
-        
-        return current_staked - amount
\ No newline at end of file
+
+        return current_staked - amount
+
+    @abimethod()
+    def claim(self) -> UInt64:
+        """Claim all accrued rewards of the sender (inner transfer fee paid by the caller)"""
+        record, exists = self.stakers.maybe(Txn.sender)
+        assert exists  # Only known stakers; never create a box for a non-staker
+        reward_per_token = self._update_reward_per_token()
+        return self._settle_claim(Txn.sender, record.copy(), reward_per_token)
+
+    @abimethod()
+    def claim_many(self, stakers: arc4.DynamicArray[arc4.Address]) -> UInt64:
+        """Pay out accrued rewards of many stakers in one call (inner fees paid by the caller).
+
+        Stakers not opted in to the reward token are skipped so one wallet
+        cannot fail a keeper's whole group. Returns the total paid.
+        """
+        ensure_budget(stakers.length * UInt64(BATCH_OPCODES_PER_STAKER), OpUpFeeSource.GroupCredit)
+        reward_per_token = self._update_reward_per_token()
+        reward_token = Asset(self.reward_token.get())
+
+        total_paid = UInt64(0)
+        for staker in stakers:
+            account = staker.native
+            record, exists = self.stakers.maybe(account)
+            assert exists  # Only known stakers
+            if account.is_opted_in(reward_token):
+                total_paid += self._settle_claim(account, record.copy(), reward_per_token)
+        return total_paid
+
+    @abimethod()
+    def compound_many(self, stakers: arc4.DynamicArray[arc4.Address]) -> UInt64:
+        """Restake accrued rewards of many stakers in one call (admin only).
+
+        Rewards are reward tokens, not LP, so they move into each record's
+        compounded_rewards, where they earn like stake and stay in the app
+        until claimed. LP stake, total_staked and the stake history are left
+        alone, so no box grows. Returns the total compounded.
+        """
+        assert Txn.sender == self.admin.get()
+        ensure_budget(stakers.length * UInt64(BATCH_OPCODES_PER_STAKER), OpUpFeeSource.GroupCredit)
+        reward_per_token = self._update_reward_per_token()
+
+        total_compounded = UInt64(0)
+        for staker in stakers:
+            account = staker.native
+            record, exists = self.stakers.maybe(account)
+            assert exists  # Only known stakers
+            earned = self._earned(record, reward_per_token)
+            compounded = record.compounded_rewards.native + earned
+            earning = record.staked.native + compounded
+            self.stakers[account] = StakerRecord(
+                record.staked,
+                arc4.UInt64(mul_div(earning, reward_per_token, UInt64(REWARD_PRECISION))),
+                arc4.UInt64(0),
+                record.last_claim_time,
+                arc4.UInt64(compounded),
+            )
+            total_compounded += earned
+        return total_compounded
@@ -1,6 +1,54 @@
-from algopy import ARC4Contract, UInt64, GlobalState, Global, Txn, TealType
+from algopy import ARC4Contract, Application, UInt64, GlobalState, Global, Txn, TealType, arc4, op, subroutine
 from algopy.arc4 import abimethod
 
+from smart_contracts.emoswapalgo.amm_math import (
+    FEE_DENOMINATOR,
+    get_amount_out,
+    mul_div,
+    sqrt_product,
+    zap_swap_amount,
+)
+
+# Cumulative prices are UQ32.32 fixed point: price * 2**32
+PRICE_SCALE = 2**32
+# Largest UQ32.32 price; larger prices saturate here
+MAX_PRICE = 2**64 - 1
+# LP shares locked by the first deposit so total_supply never returns to zero
+MINIMUM_LIQUIDITY = 1000
+
+
+@subroutine
+def _accumulate_price(
+    cumulative_high: UInt64,
+    cumulative_low: UInt64,
+    numerator: UInt64,
+    denominator: UInt64,
+    elapsed: UInt64,
+) -> tuple[UInt64, UInt64]:
+    """(high, low) words of cumulative + (numerator / denominator) * elapsed.
+
+    The accumulator is 128 bits wide, so the full price * elapsed product is
+    kept and the carry out of the low word moves into the high word; it only
+    wraps, at 2**128, after ~2**64 seconds at the largest price. Prices of
+    2**32 or more saturate at 2**64 - 1 (UQ32.32) instead of truncating.
+    """
+    scaled_high, scaled_low = op.mulw(numerator, UInt64(PRICE_SCALE))
+    price_high, price, _rem_high, _rem_low = op.divmodw(
+        scaled_high, scaled_low, UInt64(0), denominator
+    )
+    if price_high != UInt64(0):
+        price = UInt64(MAX_PRICE)
+    term_high, term_low = op.mulw(price, elapsed)
+    carry, low = op.addw(cumulative_low, term_low)
+    # term_high <= 2**64 - 2, so adding the carry cannot overflow
+    _wrap, high = op.addw(cumulative_high, term_high + carry)
+    return high, low
+
+
+class SwapLeg(arc4.Struct):
+    a_for_b: arc4.Bool  # True: swap A for B, False: swap B for A
+    amount: arc4.UInt64
+
 
 class SwapPool(ARC4Contract):
     # Global state variables
@@ -10,6 +58,54 @@ class SwapPool(ARC4Contract):
     reserve_a = GlobalState(TealType.uint64, default=UInt64(0))
     reserve_b = GlobalState(TealType.uint64, default=UInt64(0))
     fee_rate = GlobalState(TealType.uint64, default=UInt64(3))  # 0.3%
+    total_supply = GlobalState(TealType.uint64, default=UInt64(0))  # LP shares
+    # 128-bit price accumulators, UQ32.32 * seconds, split into high and low words
+    price_a_cumulative_high = GlobalState(TealType.uint64, default=UInt64(0))  # B per A
+    price_a_cumulative_low = GlobalState(TealType.uint64, default=UInt64(0))
+    price_b_cumulative_high = GlobalState(TealType.uint64, default=UInt64(0))  # A per B
+    price_b_cumulative_low = GlobalState(TealType.uint64, default=UInt64(0))
+    last_update_timestamp = GlobalState(TealType.uint64, default=UInt64(0))
+    router_app_id = GlobalState(TealType.uint64, default=UInt64(0))  # Emoswapalgo router
+
+    @subroutine
+    def _update_price_accumulators(self, reserve_a: UInt64, reserve_b: UInt64) -> None:
+        """Accrue the pre-swap price over the time elapsed since the last update"""
+        now = Global.latest_timestamp
+        elapsed = now - self.last_update_timestamp.get()
+        if elapsed > UInt64(0) and reserve_a > UInt64(0) and reserve_b > UInt64(0):
+            a_high, a_low = _accumulate_price(
+                self.price_a_cumulative_high.get(),
+                self.price_a_cumulative_low.get(),
+                reserve_b,
+                reserve_a,
+                elapsed,
+            )
+            b_high, b_low = _accumulate_price(
+                self.price_b_cumulative_high.get(),
+                self.price_b_cumulative_low.get(),
+                reserve_a,
+                reserve_b,
+                elapsed,
+            )
+            self.price_a_cumulative_high.set(a_high)
+            self.price_a_cumulative_low.set(a_low)
+            self.price_b_cumulative_high.set(b_high)
+            self.price_b_cumulative_low.set(b_low)
+        self.last_update_timestamp.set(now)
+
+    @subroutine
+    def _is_admin_or_router(self) -> bool:
+        """The admin, or the Emoswapalgo router app acting for a user"""
+        router_app_id = self.router_app_id.get()
+        return Txn.sender == self.admin.get() or (
+            router_app_id != UInt64(0) and Txn.sender == Application(router_app_id).address
+        )
+
+    @abimethod()
+    def set_router_app_id(self, app_id: UInt64) -> None:
+        """Allow an Emoswapalgo router app to call this app for users (admin only)"""
+        assert Txn.sender == self.admin.get()
+        self.router_app_id.set(app_id)
 
     @abimethod()
     def set_assets(self, asset_a: UInt64, asset_b: UInt64) -> None:
@@ -20,58 +116,231 @@ class SwapPool(ARC4Contract):
 
     @abimethod()
     def set_fee_rate(self, rate: UInt64) -> None:
-        """Set swap fee rate (in basis points) (admin only)"""
+        """Set swap fee rate (in tenths of a percent) (admin only)"""
         assert Txn.sender == self.admin.get()
+        assert rate < UInt64(FEE_DENOMINATOR)
         self.fee_rate.set(rate)
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_reserves(self) -> tuple[UInt64, UInt64]:
         """Get current reserves"""
         return (self.reserve_a.get(), self.reserve_b.get())
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_fee_rate(self) -> UInt64:
         """Get swap fee rate"""
         return self.fee_rate.get()
 
+    @abimethod(readonly=True)
+    def get_total_supply(self) -> UInt64:
+        """Get total LP shares, including the locked MINIMUM_LIQUIDITY"""
+        return self.total_supply.get()
+
+    @abimethod(readonly=True)
+    def get_price_cumulatives(self) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64]:
+        """Get (price_a_high, price_a_low, price_b_high, price_b_low, timestamp) accrued up to now"""
+        current_reserve_a = self.reserve_a.get()
+        current_reserve_b = self.reserve_b.get()
+        a_high = self.price_a_cumulative_high.get()
+        a_low = self.price_a_cumulative_low.get()
+        b_high = self.price_b_cumulative_high.get()
+        b_low = self.price_b_cumulative_low.get()
+
+        # Include the time since the last swap so two reads bracket any window
+        now = Global.latest_timestamp
+        elapsed = now - self.last_update_timestamp.get()
+        if elapsed > UInt64(0) and current_reserve_a > UInt64(0) and current_reserve_b > UInt64(0):
+            a_high, a_low = _accumulate_price(
+                a_high, a_low, current_reserve_b, current_reserve_a, elapsed
+            )
+            b_high, b_low = _accumulate_price(
+                b_high, b_low, current_reserve_a, current_reserve_b, elapsed
+            )
+
+        return (a_high, a_low, b_high, b_low, now)
+
     @abimethod()
-    def swap_a_for_b(self, amount_a: UInt64) -> UInt64:
-        """Swap asset A for asset B (admin only for now)"""
-        assert Txn.sender == self.admin.get()
+    def add_liquidity(self, amount_a: UInt64, amount_b: UInt64) -> UInt64:
+        """Deposit into the swap reserves and return the LP shares minted (admin or router only)"""
+        assert self._is_admin_or_router()
+        
+        current_reserve_a = self.reserve_a.get()
+        current_reserve_b = self.reserve_b.get()
+        current_supply = self.total_supply.get()
+        # Deposits move the price, so accrue the old one first
+        self._update_price_accumulators(current_reserve_a, current_reserve_b)
+        
+        # LP shares: sqrt(a * b) for the first deposit, less the locked
+        # minimum, otherwise proportional to the smaller side
+        if current_supply == UInt64(0):
+            minted = sqrt_product(amount_a, amount_b)
+            assert minted > UInt64(MINIMUM_LIQUIDITY)  # First deposit too small
+            current_supply = UInt64(MINIMUM_LIQUIDITY)
+            minted -= UInt64(MINIMUM_LIQUIDITY)
+        else:
+            minted_a = mul_div(amount_a, current_supply, current_reserve_a)
+            minted_b = mul_div(amount_b, current_supply, current_reserve_b)
+            minted = minted_a if minted_a < minted_b else minted_b
+        assert minted > UInt64(0)  # Deposit too small
+        
+        self.reserve_a.set(current_reserve_a + amount_a)
+        self.reserve_b.set(current_reserve_b + amount_b)
+        self.total_supply.set(current_supply + minted)
+        
+        return minted
+
+    @abimethod()
+    def zap_in(self, asset: UInt64, amount: UInt64) -> UInt64:
+        """Deposit one side only: swap the closed-form optimal part, add the rest (admin or router only).
+
+        Returns the LP shares minted. Rounding leaves at most a few units
+        of dust, which stay in the reserves like any unmatched deposit.
+        """
+        assert self._is_admin_or_router()
+        
+        current_reserve_a = self.reserve_a.get()
+        current_reserve_b = self.reserve_b.get()
+        current_supply = self.total_supply.get()
+        assert current_supply > UInt64(0)  # Pool must be seeded with add_liquidity
+        self._update_price_accumulators(current_reserve_a, current_reserve_b)
+        
+        a_in = asset == self.asset_a.get()
+        if a_in:
+            reserve_in = current_reserve_a
+            reserve_out = current_reserve_b
+        else:
+            assert asset == self.asset_b.get()
+            reserve_in = current_reserve_b
+            reserve_out = current_reserve_a
+        
+        fee_rate = self.fee_rate.get()
+        swap_amount = zap_swap_amount(amount, reserve_in, fee_rate)
+        amount_out = get_amount_out(swap_amount, reserve_in, reserve_out, fee_rate)
+        reserve_in += swap_amount
+        reserve_out -= amount_out
+        
+        # Same proportional minting as add_liquidity, against the post-swap reserves
+        deposit_in = amount - swap_amount
+        minted_in = mul_div(deposit_in, current_supply, reserve_in)
+        minted_out = mul_div(amount_out, current_supply, reserve_out)
+        minted = minted_in if minted_in < minted_out else minted_out
+        assert minted > UInt64(0)  # Deposit too small
+        reserve_in += deposit_in
+        reserve_out += amount_out
+        
+        if a_in:
+            self.reserve_a.set(reserve_in)
+            self.reserve_b.set(reserve_out)
+        else:
+            self.reserve_a.set(reserve_out)
+            self.reserve_b.set(reserve_in)
+        self.total_supply.set(current_supply + minted)
+        
+        return minted
+
+    @abimethod()
+    def remove_liquidity(self, shares: UInt64) -> tuple[UInt64, UInt64]:
+        """Burn LP shares for their pro-rata part of both reserves (admin or router only)"""
+        assert self._is_admin_or_router()
         
         current_reserve_a = self.reserve_a.get()
         current_reserve_b = self.reserve_b.get()
+        current_supply = self.total_supply.get()
+        assert shares > UInt64(0) and shares <= current_supply - UInt64(MINIMUM_LIQUIDITY)
+        self._update_price_accumulators(current_reserve_a, current_reserve_b)
+        
+        # Rounded down, so what stays behind always backs the remaining shares
+        amount_a = mul_div(shares, current_reserve_a, current_supply)
+        amount_b = mul_div(shares, current_reserve_b, current_supply)
+        
+        self.reserve_a.set(current_reserve_a - amount_a)
+        self.reserve_b.set(current_reserve_b - amount_b)
+        self.total_supply.set(current_supply - shares)
+        
+        return (amount_a, amount_b)
+
+    @abimethod()
+    def swap_a_for_b(self, amount_a: UInt64, min_amount_b: UInt64) -> UInt64:
+        """Swap asset A for asset B, failing below `min_amount_b` out (admin or router only for now)"""
+        assert self._is_admin_or_router()
         
-        # Simple constant product formula: x * y = k
-        # amount_b = (reserve_b * amount_a) / (reserve_a + amount_a)
+        current_reserve_a = self.reserve_a.get()
+        current_reserve_b = self.reserve_b.get()
+        self._update_price_accumulators(current_reserve_a, current_reserve_b)
+        
+        # Constant product formula x * y = k with the fee kept in the pool,
+        # computed with 128-bit intermediates so large reserves cannot overflow
+        amount_b = UInt64(0)
         if current_reserve_a > UInt64(0) and current_reserve_b > UInt64(0):
-            amount_b = (current_reserve_b * amount_a) / (current_reserve_a + amount_a)
+            amount_b = get_amount_out(
+                amount_a, current_reserve_a, current_reserve_b, self.fee_rate.get()
+            )
             
             # Update reserves
             self.reserve_a.set(current_reserve_a + amount_a)
             self.reserve_b.set(current_reserve_b - amount_b)
-            
-            return amount_b
-        else:
-            return UInt64(0)
+        
+        assert amount_b >= min_amount_b  # Slippage limit
+        return amount_b
 
     @abimethod()
-    def swap_b_for_a(self, amount_b: UInt64) -> UInt64:
-        """Swap asset B for asset A (admin only for now)"""
-        assert Txn.sender == self.admin.get()
+    def swap_b_for_a(self, amount_b: UInt64, min_amount_a: UInt64) -> UInt64:
+        """Swap asset B for asset A, failing below `min_amount_a` out (admin or router only for now)"""
+        assert self._is_admin_or_router()
         
         current_reserve_a = self.reserve_a.get()
         current_reserve_b = self.reserve_b.get()
+        self._update_price_accumulators(current_reserve_a, current_reserve_b)
         
-        # Simple constant product formula: x * y = k
-        # amount_a = (reserve_a * amount_b) / (reserve_b + amount_b)
+        # Constant product formula x * y = k with the fee kept in the pool,
+        # computed with 128-bit intermediates so large reserves cannot overflow
+        amount_a = UInt64(0)
         if current_reserve_a > UInt64(0) and current_reserve_b > UInt64(0):
-            amount_a = (current_reserve_a * amount_b) / (current_reserve_b + amount_b)
+            amount_a = get_amount_out(
+                amount_b, current_reserve_b, current_reserve_a, self.fee_rate.get()
+            )
             
             # Update reserves
             self.reserve_a.set(current_reserve_a - amount_a)
             self.reserve_b.set(current_reserve_b + amount_b)
-            
-            return amount_a
-        else:
-            return UInt64(0)
\ No newline at end of file
+        
+        assert amount_a >= min_amount_a  # Slippage limit
+        return amount_a
+
+    @abimethod()
+    def swap_batch(self, legs: arc4.DynamicArray[SwapLeg]) -> arc4.DynamicArray[arc4.UInt64]:
+        """Apply swaps in order, writing reserves back once (admin or router only for now)"""
+        assert self._is_admin_or_router()
+
+        # Read reserves once; every leg works on the local copies
+        current_reserve_a = self.reserve_a.get()
+        current_reserve_b = self.reserve_b.get()
+        # All legs share one timestamp, so only the pre-batch price accrues
+        self._update_price_accumulators(current_reserve_a, current_reserve_b)
+        fee_rate = self.fee_rate.get()
+        amounts_out = arc4.DynamicArray[arc4.UInt64]()
+
+        for leg in legs:
+            amount_in = leg.amount.native
+            amount_out = UInt64(0)
+            # Same constant product formula as swap_a_for_b / swap_b_for_a
+            if current_reserve_a > UInt64(0) and current_reserve_b > UInt64(0):
+                if leg.a_for_b.native:
+                    amount_out = get_amount_out(
+                        amount_in, current_reserve_a, current_reserve_b, fee_rate
+                    )
+                    current_reserve_a += amount_in
+                    current_reserve_b -= amount_out
+                else:
+                    amount_out = get_amount_out(
+                        amount_in, current_reserve_b, current_reserve_a, fee_rate
+                    )
+                    current_reserve_a -= amount_out
+                    current_reserve_b += amount_in
+            amounts_out.append(arc4.UInt64(amount_out))
+
+        # Write back once at the end
+        self.reserve_a.set(current_reserve_a)
+        self.reserve_b.set(current_reserve_b)
+
+        return amounts_out
@@ -0,0 +1,118 @@
+from algopy import BigUInt, Bytes, UInt64, op, subroutine, urange
+
+# price(tick) = 1.0001 ** tick (B per A). ABI methods take unsigned tick
+# indices, index = tick + TICK_OFFSET, so index 0 is MIN_TICK; the range
+# keeps prices within about [1e-6, 1e6].
+MAX_TICK = 138160
+TICK_OFFSET = MAX_TICK
+MAX_TICK_INDEX = 2 * MAX_TICK
+TICK_SPACING = 10
+# sqrt prices are UQ32.32 fixed point, like the SwapPool price accumulators
+SQRT_PRICE_SCALE = 2**32
+# floor(2**64 * 1.0001 ** (-2**i / 2)) for i in 0..17, since 2**17 < MAX_TICK < 2**18
+TICK_BITS = 18
+SQRT_RATIO_FACTORS = (
+    "fffcb933bd6fad37fff97272373d4132fff2e50f5f656932ffe5caca7e10e4e6"
+    "ffcb9843d60f6159ff973b41fa98c081ff2ea16466c96a38fe5dee046a99a2a8"
+    "fcbe86c7900a88aef987a7253ac41317f3392b0822b70005e7159475a2c29b74"
+    "d097f3bdfd2022b8a9f746462d870fdf70d869a156d2a1b831be135f97d08fd9"
+    "09aa508b5b7a84e1005d6af8dedb8119"
+)
+
+
+@subroutine
+def tick_to_sqrt_price(tick_index: UInt64) -> UInt64:
+    """sqrt(1.0001 ** tick) as UQ32.32, from one multiply per set bit of |tick|"""
+    assert tick_index <= UInt64(MAX_TICK_INDEX)
+    if tick_index >= UInt64(TICK_OFFSET):
+        abs_tick = tick_index - UInt64(TICK_OFFSET)
+    else:
+        abs_tick = UInt64(TICK_OFFSET) - tick_index
+
+    # sqrt(1.0001 ** -|tick|) as UQ1.63; every factor is below 1.0 as UQ0.64
+    factors = Bytes.from_hex(SQRT_RATIO_FACTORS)
+    ratio = UInt64(2**63)
+    for bit in urange(TICK_BITS):
+        if abs_tick & (UInt64(1) << bit):
+            ratio, _low = op.mulw(ratio, op.extract_uint64(factors, bit * UInt64(8)))
+
+    if tick_index > UInt64(TICK_OFFSET):
+        # 2**95 / ratio inverts the UQ1.63 ratio into UQ32.32
+        quotient_high, sqrt_price, _remainder_high, _remainder_low = op.divmodw(
+            UInt64(2**31), UInt64(0), UInt64(0), ratio
+        )
+        assert quotient_high == UInt64(0)
+        return sqrt_price
+    return ratio >> UInt64(31)
+
+
+@subroutine
+def _big_to_uint64(value: BigUInt, denominator: BigUInt, round_up: bool) -> UInt64:
+    """value / denominator, rounded as asked; panics unless the result fits in uint64"""
+    if round_up:
+        value += denominator - BigUInt(1)
+    return op.btoi((value // denominator).bytes)
+
+
+@subroutine
+def amount_a_delta(
+    liquidity: UInt64, sqrt_lower: UInt64, sqrt_upper: UInt64, round_up: bool
+) -> UInt64:
+    """Asset A held by `liquidity` between two sqrt prices: L * (upper - lower) / (lower * upper)"""
+    return _big_to_uint64(
+        BigUInt(liquidity) * BigUInt(sqrt_upper - sqrt_lower) * BigUInt(SQRT_PRICE_SCALE),
+        BigUInt(sqrt_lower) * BigUInt(sqrt_upper),
+        round_up,
+    )
+
+
+@subroutine
+def amount_b_delta(
+    liquidity: UInt64, sqrt_lower: UInt64, sqrt_upper: UInt64, round_up: bool
+) -> UInt64:
+    """Asset B held by `liquidity` between two sqrt prices: L * (upper - lower)"""
+    return _big_to_uint64(
+        BigUInt(liquidity) * BigUInt(sqrt_upper - sqrt_lower),
+        BigUInt(SQRT_PRICE_SCALE),
+        round_up,
+    )
+
+
+@subroutine
+def compute_swap_step(
+    sqrt_price: UInt64, sqrt_target: UInt64, liquidity: UInt64, amount_remaining: UInt64, a_for_b: bool
+) -> tuple[UInt64, UInt64, UInt64]:
+    """Move toward `sqrt_target` within one liquidity range; returns (new sqrt price, in, out).
+
+    Inputs are rounded up and outputs down, so the pool never pays out
+    more than the liquidity backs. With no liquidity the price jumps to the
+    target for free.
+    """
+    if a_for_b:
+        amount_needed = amount_a_delta(liquidity, sqrt_target, sqrt_price, True)
+        if amount_remaining >= amount_needed:
+            new_sqrt_price = sqrt_target
+            amount_in = amount_needed
+        else:
+            # L * P / (L + amount * P), rounded up so the price never overshoots
+            scaled_liquidity = BigUInt(liquidity) * BigUInt(SQRT_PRICE_SCALE)
+            new_sqrt_price = _big_to_uint64(
+                scaled_liquidity * BigUInt(sqrt_price),
+                scaled_liquidity + BigUInt(amount_remaining) * BigUInt(sqrt_price),
+                True,
+            )
+            amount_in = amount_remaining
+        amount_out = amount_b_delta(liquidity, new_sqrt_price, sqrt_price, False)
+    else:
+        amount_needed = amount_b_delta(liquidity, sqrt_price, sqrt_target, True)
+        if amount_remaining >= amount_needed:
+            new_sqrt_price = sqrt_target
+            amount_in = amount_needed
+        else:
+            # P + amount / L, rounded down
+            new_sqrt_price = sqrt_price + _big_to_uint64(
+                BigUInt(amount_remaining) * BigUInt(SQRT_PRICE_SCALE), BigUInt(liquidity), False
+            )
+            amount_in = amount_remaining
+        amount_out = amount_a_delta(liquidity, sqrt_price, new_sqrt_price, False)
+    return new_sqrt_price, amount_in, amount_out
@@ -0,0 +1,228 @@
+"""Streaming Merkle tree and proof builder for `EmotionFactory` airdrops.
+
+Leaves are sha256(index || address || amount) with big-endian uint64s,
+inner nodes are sha256(left || right), and an odd node at the end of a
+level is paired with itself. Every level is written to its own file in a
+work directory, so memory use is bounded by `chunk_size` no matter how
+long the recipient list is; proofs are then read back through memory maps.
+"""
+import csv
+import dataclasses
+import hashlib
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+from algosdk import encoding
+
+HASH_SIZE = 32
+DEFAULT_CHUNK_SIZE = 1 << 16  # Must be even so chunks never split a pair
+# Proof output is ~1.4 kB per leaf at depth 20, so it is written in smaller chunks
+PROOF_CHUNK_SIZE = 1 << 13
+UINT64_MAX = 2**64 - 1
+
+# Must match the AIRDROP_CHUNK_* constants in smart_contracts/emoswapalgo/emotion_factory.py
+AIRDROP_CHUNK_BYTES = 1024
+AIRDROP_CHUNK_LEAVES = AIRDROP_CHUNK_BYTES * 8
+AIRDROP_CHUNK_KEY_SIZE = 1 + 8 + 8  # b"m" + airdrop ID + chunk index
+# microAlgos the first claimer of a chunk pays for its bitmap box
+AIRDROP_CHUNK_MIN_BALANCE = 2_500 + 400 * (AIRDROP_CHUNK_KEY_SIZE + AIRDROP_CHUNK_BYTES)
+
+
+@dataclasses.dataclass(frozen=True)
+class AirdropEntry:
+    address: str
+    amount: int
+
+
+def leaf_hash(index: int, address: str, amount: int) -> bytes:
+    """Leaf value `claim_airdrop` recomputes for the sender"""
+    return hashlib.sha256(
+        index.to_bytes(8, "big") + encoding.decode_address(address) + amount.to_bytes(8, "big")
+    ).digest()
+
+
+def verify_proof(root: bytes, index: int, address: str, amount: int, proof: list[bytes]) -> bool:
+    """Off-chain mirror of the contract's proof check"""
+    node = leaf_hash(index, address, amount)
+    position = index
+    for sibling in proof:
+        node = hashlib.sha256(node + sibling if position % 2 == 0 else sibling + node).digest()
+        position //= 2
+    return node == root
+
+
+def chunk_index(index: int) -> int:
+    """Bitmap chunk box holding leaf `index`'s claimed bit"""
+    return index // AIRDROP_CHUNK_LEAVES
+
+
+def claim_payment(chunk_exists: bool) -> int:
+    """microAlgos a claim_airdrop call must pay the app first; nonzero only for a chunk's first claim"""
+    return 0 if chunk_exists else AIRDROP_CHUNK_MIN_BALANCE
+
+
+def read_entries_csv(path: Path) -> Iterator[AirdropEntry]:
+    """Stream `address,amount` rows; blank lines and a header row on the first line are skipped.
+
+    Raises ValueError naming the line of any row without both columns, with
+    an invalid Algorand address or with an amount that is not a uint64.
+    """
+    with path.open(newline="") as file:
+        reader = csv.reader(file)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{reader.line_num}: expected address,amount, got {row!r}")
+            amount = row[1].strip()
+            if not amount.isdigit():
+                if reader.line_num == 1:
+                    continue  # Header
+                raise ValueError(f"{path}:{reader.line_num}: amount {amount!r} is not a whole number")
+            if int(amount) > UINT64_MAX:
+                raise ValueError(f"{path}:{reader.line_num}: amount {amount} does not fit in a uint64")
+            address = row[0].strip()
+            if not encoding.is_valid_address(address):
+                raise ValueError(f"{path}:{reader.line_num}: {address!r} is not a valid Algorand address")
+            yield AirdropEntry(address, int(amount))
+
+
+def _level_path(directory: Path, level: int) -> Path:
+    return directory / f"level_{level}.bin"
+
+
+@dataclasses.dataclass(frozen=True)
+class MerkleTree:
+    """A tree whose levels live in `directory`; level 0 holds the leaves"""
+
+    directory: Path
+    level_sizes: tuple[int, ...]
+
+    @property
+    def leaf_count(self) -> int:
+        return self.level_sizes[0]
+
+    @property
+    def depth(self) -> int:
+        return len(self.level_sizes) - 1
+
+    @property
+    def root(self) -> bytes:
+        with _level_path(self.directory, self.depth).open("rb") as file:
+            return file.read(HASH_SIZE)
+
+    @classmethod
+    def open(cls, directory: Path) -> "MerkleTree":
+        sizes = []
+        while (path := _level_path(directory, len(sizes))).exists():
+            sizes.append(path.stat().st_size // HASH_SIZE)
+        if not sizes:
+            raise FileNotFoundError(f"no Merkle tree in {directory}")
+        return cls(directory, tuple(sizes))
+
+    def _levels(self) -> list[np.ndarray]:
+        return [
+            np.memmap(
+                _level_path(self.directory, level), dtype=np.uint8, mode="r", shape=(size, HASH_SIZE)
+            )
+            for level, size in enumerate(self.level_sizes[:-1])
+        ]
+
+    def proof(self, index: int) -> list[bytes]:
+        return next(self.iter_proofs(index, index + 1))
+
+    def iter_proofs(
+        self, start: int = 0, stop: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[list[bytes]]:
+        """Proofs for leaves [start, stop), gathered a chunk at a time"""
+        for chunk in self.iter_proof_chunks(start, stop, chunk_size):
+            for row in chunk:
+                yield [bytes(sibling) for sibling in row]
+
+    def iter_proof_chunks(
+        self, start: int = 0, stop: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[np.ndarray]:
+        """(leaves, depth, 32) arrays of proofs for consecutive chunks of [start, stop)"""
+        stop = self.leaf_count if stop is None else min(stop, self.leaf_count)
+        levels = self._levels()
+        for chunk_start in range(start, stop, chunk_size):
+            indices = np.arange(chunk_start, min(stop, chunk_start + chunk_size), dtype=np.int64)
+            chunk = np.empty((len(indices), self.depth, HASH_SIZE), dtype=np.uint8)
+            for level, nodes in enumerate(levels):
+                # A lone last node is its own sibling
+                chunk[:, level] = nodes[np.minimum((indices >> level) ^ 1, len(nodes) - 1)]
+            yield chunk
+
+
+def _hash_pairs(nodes: bytes) -> bytes:
+    count = len(nodes) // HASH_SIZE
+    out = bytearray()
+    for i in range(0, count, 2):
+        left = nodes[i * HASH_SIZE : (i + 1) * HASH_SIZE]
+        right = nodes[(i + 1) * HASH_SIZE : (i + 2) * HASH_SIZE] if i + 1 < count else left
+        out += hashlib.sha256(left + right).digest()
+    return bytes(out)
+
+
+def build_tree(
+    entries: Iterable[AirdropEntry], directory: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> MerkleTree:
+    """Hash `entries` (leaf index = position) into a tree stored in `directory`"""
+    if chunk_size < 2 or chunk_size % 2:
+        raise ValueError("chunk_size must be a positive even number")
+    directory.mkdir(parents=True, exist_ok=True)
+
+    leaf_count = 0
+    iterator = iter(entries)
+    with _level_path(directory, 0).open("wb") as file:
+        while chunk := list(islice(iterator, chunk_size)):
+            file.write(
+                b"".join(
+                    leaf_hash(leaf_count + offset, entry.address, entry.amount)
+                    for offset, entry in enumerate(chunk)
+                )
+            )
+            leaf_count += len(chunk)
+    if leaf_count == 0:
+        raise ValueError("an airdrop needs at least one entry")
+
+    sizes = [leaf_count]
+    while sizes[-1] > 1:
+        level = len(sizes)
+        source_path, target_path = _level_path(directory, level - 1), _level_path(directory, level)
+        with source_path.open("rb") as source, target_path.open("wb") as target:
+            while nodes := source.read(chunk_size * HASH_SIZE):
+                target.write(_hash_pairs(nodes))
+        sizes.append((sizes[-1] + 1) // 2)
+    return MerkleTree(directory, tuple(sizes))
+
+
+def write_proofs(
+    tree: MerkleTree, entries: Iterable[AirdropEntry], path: Path, chunk_size: int = PROOF_CHUNK_SIZE
+) -> int:
+    """Stream one JSON line per entry with its index and hex proof; returns the count"""
+    hex_size = 2 * HASH_SIZE
+    iterator = iter(entries)
+    written = 0
+    with path.open("w") as file:
+        for chunk in tree.iter_proof_chunks(chunk_size=chunk_size):
+            # One hex conversion per chunk instead of one per sibling
+            hexes = chunk.tobytes().hex()
+            proof_size = tree.depth * hex_size
+            lines = []
+            for row, entry in enumerate(islice(iterator, len(chunk))):
+                offset = row * proof_size
+                proof = '","'.join(
+                    hexes[offset + level * hex_size : offset + (level + 1) * hex_size]
+                    for level in range(tree.depth)
+                )
+                proof = f'"{proof}"' if tree.depth else ""
+                lines.append(
+                    f'{{"index": {written + row}, "address": "{entry.address}",'
+                    f' "amount": {entry.amount}, "proof": [{proof}]}}\n'
+                )
+            file.writelines(lines)
+            written += len(lines)
+    return written
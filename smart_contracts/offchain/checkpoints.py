@@ -0,0 +1,73 @@
+"""Off-chain index over StakingRewards' per-holder stake history boxes."""
+import bisect
+import dataclasses
+
+import numpy as np
+import numpy.typing as npt
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.offchain.state import fetch_boxes
+
+# Must match the stake history layout in smart_contracts/emoswapalgo/staking_rewards.py
+STAKE_HISTORY_PREFIX = b"k"
+STAKE_CHECKPOINT_SIZE = 16
+STAKE_HISTORY_HEADER_SIZE = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class StakeHistory:
+    """One holder's checkpoints; rounds before `history_start` are unknown (0 = complete)"""
+
+    history_start: int
+    rounds: npt.NDArray[np.uint64]
+    balances: npt.NDArray[np.uint64]
+
+    @classmethod
+    def from_box(cls, value: bytes) -> "StakeHistory":
+        entries = np.frombuffer(value, dtype=">u8", offset=STAKE_HISTORY_HEADER_SIZE).reshape(-1, 2)
+        return cls(
+            history_start=int.from_bytes(value[:STAKE_HISTORY_HEADER_SIZE], "big"),
+            rounds=entries[:, 0].astype(np.uint64),
+            balances=entries[:, 1].astype(np.uint64),
+        )
+
+    def index_at(self, round: int) -> int | None:
+        """Index of the checkpoint in force at the end of `round`, None if nothing was staked yet.
+
+        This is the entry `get_staked_at` lands on with its binary search.
+        """
+        if round < self.history_start:
+            raise ValueError(f"history only goes back to round {self.history_start}")
+        index = bisect.bisect_right(self.rounds, round) - 1
+        return None if index < 0 else index
+
+    def balance_at(self, round: int) -> int:
+        index = self.index_at(round)
+        return 0 if index is None else int(self.balances[index])
+
+
+@dataclasses.dataclass(frozen=True)
+class CheckpointIndex:
+    """Every holder's stake history, loaded in one box-listing pass"""
+
+    histories: dict[str, StakeHistory]
+
+    @classmethod
+    def from_chain(cls, algod: AlgodClient, app_id: int) -> "CheckpointIndex":
+        boxes = fetch_boxes(algod, app_id, STAKE_HISTORY_PREFIX)
+        return cls(
+            {
+                encoding.encode_address(name[len(STAKE_HISTORY_PREFIX):]): StakeHistory.from_box(value)
+                for name, value in boxes.items()
+            }
+        )
+
+    def indexes_at(self, round: int) -> dict[str, int | None]:
+        """Checkpoint index of every holder at `round`, e.g. to precompute a proposal snapshot"""
+        return {address: history.index_at(round) for address, history in self.histories.items()}
+
+    def weights_at(self, round: int) -> dict[str, int]:
+        """Vote weight `Governance.vote` would use for every holder at snapshot `round`"""
+        weights = {address: history.balance_at(round) for address, history in self.histories.items()}
+        return {address: weight for address, weight in weights.items() if weight > 0}
@@ -0,0 +1,150 @@
+"""Client-side view of the EmotionFactory name -> asset registry and bulk creation."""
+import dataclasses
+import math
+import struct
+from collections.abc import Sequence
+
+import algokit_utils
+from algosdk.abi import Method
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.offchain.state import fetch_boxes
+
+# Must match EmotionFactory.emotions in smart_contracts/emoswapalgo/emotion_factory.py
+EMOTION_KEY_PREFIX = b"e"
+CREATE_OPCODES_PER_EMOTION = 250
+
+# Box minimum balance of EmotionFactory.last_claimed_epoch: 2500 + 400 * ("c" + address + asset ID + epoch)
+CLAIM_RECORD_MIN_BALANCE = 2_500 + 400 * (1 + 32 + 8 + 8)
+
+CREATE_EMOTIONS = Method.from_signature("create_emotions(string[])uint64[]")
+CLAIM_DAILY_MINT = Method.from_signature("claim_daily_mint(string)uint64")
+# Cheap readonly call used to pad a group with opcode budget and inner transaction slots
+GET_EMOTION_COUNT = Method.from_signature("get_emotion_count()uint64")
+
+SUPPORTED_EMOTIONS = ("Happy", "Sad", "Angry", "Excited", "Calm", "Anxious", "Grateful", "Loved")
+
+MAX_GROUP_SIZE = 16
+APP_CALL_BUDGET = 700
+MAX_INNER_PER_APP_CALL = 16
+MIN_FEE = 1_000
+
+_RECORD = struct.Struct(">QQQ")
+
+
+@dataclasses.dataclass(frozen=True)
+class Emotion:
+    name: str
+    asset_id: int
+    created_round: int
+    mint_amount: int
+
+    @classmethod
+    def from_box(cls, name: bytes, value: bytes) -> "Emotion":
+        asset_id, created_round, mint_amount = _RECORD.unpack(value)
+        return cls(
+            name[len(EMOTION_KEY_PREFIX):].decode("utf-8"), asset_id, created_round, mint_amount
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class EmotionRegistry:
+    """Both directions of the registry, loaded together"""
+
+    by_name: dict[str, Emotion]
+    by_asset_id: dict[int, Emotion]
+
+    @classmethod
+    def from_chain(cls, algod: AlgodClient, app_id: int) -> "EmotionRegistry":
+        """Load every registered emotion in one box-listing pass"""
+        emotions = [
+            Emotion.from_box(name, value)
+            for name, value in fetch_boxes(algod, app_id, EMOTION_KEY_PREFIX).items()
+        ]
+        return cls(
+            by_name={emotion.name: emotion for emotion in emotions},
+            by_asset_id={emotion.asset_id: emotion for emotion in emotions},
+        )
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+
+def create_emotions_group_size(count: int, opcodes_per_emotion: int = CREATE_OPCODES_PER_EMOTION) -> int:
+    """App calls a group needs to pool budget and inner-transaction slots for `count` emotions"""
+    return max(
+        1,
+        math.ceil(count * opcodes_per_emotion / APP_CALL_BUDGET),
+        math.ceil(count / MAX_INNER_PER_APP_CALL),
+    )
+
+
+def build_create_emotions_group(
+    algorand: algokit_utils.AlgorandClient,
+    app_id: int,
+    sender: str,
+    names: Sequence[str] = SUPPORTED_EMOTIONS,
+    opcodes_per_emotion: int = CREATE_OPCODES_PER_EMOTION,
+) -> algokit_utils.TransactionComposer:
+    """One create_emotions call plus enough padding calls to pool its budget.
+
+    Padding the group up front means the contract never has to issue
+    op-up inner calls; the create call's fee covers one inner ASA creation
+    per name.
+    """
+    group_size = create_emotions_group_size(len(names), opcodes_per_emotion)
+    if group_size > MAX_GROUP_SIZE:
+        raise ValueError(f"{len(names)} emotions do not fit in one group")
+
+    composer = algorand.new_group().add_app_call_method_call(
+        algokit_utils.AppCallMethodCallParams(
+            sender=sender,
+            app_id=app_id,
+            method=CREATE_EMOTIONS,
+            args=[list(names)],
+            static_fee=algokit_utils.AlgoAmount.from_micro_algo(MIN_FEE * (1 + len(names))),
+        )
+    )
+    for note in range(group_size - 1):
+        composer.add_app_call_method_call(
+            algokit_utils.AppCallMethodCallParams(
+                sender=sender,
+                app_id=app_id,
+                method=GET_EMOTION_COUNT,
+                args=[],
+                # Identical padding calls would share a transaction ID
+                note=note.to_bytes(2, "big"),
+            )
+        )
+    return composer
+
+
+def build_claim_daily_mint_group(
+    algorand: algokit_utils.AlgorandClient,
+    app_id: int,
+    sender: str,
+    emotion_name: str,
+    first_claim: bool,
+) -> algokit_utils.TransactionComposer:
+    """claim_daily_mint call, preceded on the sender's first claim of an emotion
+    by the payment that funds their claim box"""
+    composer = algorand.new_group()
+    if first_claim:
+        composer.add_payment(
+            algokit_utils.PaymentParams(
+                sender=sender,
+                receiver=get_application_address(app_id),
+                amount=algokit_utils.AlgoAmount.from_micro_algo(CLAIM_RECORD_MIN_BALANCE),
+            )
+        )
+    return composer.add_app_call_method_call(
+        algokit_utils.AppCallMethodCallParams(
+            sender=sender,
+            app_id=app_id,
+            method=CLAIM_DAILY_MINT,
+            args=[emotion_name],
+            # Covers the call and the inner mint transfer
+            static_fee=algokit_utils.AlgoAmount.from_micro_algo(2 * MIN_FEE),
+        )
+    )
@@ -0,0 +1,123 @@
+"""Client-side ballot batching for `Governance.vote_many`."""
+import dataclasses
+from collections.abc import Iterable
+
+import algokit_utils
+from algosdk import encoding
+from algosdk.abi import Method
+from algosdk.logic import get_application_address
+
+VOTE_NO = 0
+VOTE_YES = 1
+VOTE_ABSTAIN = 2
+
+VOTE_MANY = Method.from_signature("vote_many((uint64,uint8)[])uint64[]")
+
+# Must match the box prefixes in smart_contracts/emoswapalgo/governance.py and staking_rewards.py
+PROPOSAL_KEY_PREFIX = b"p"
+VOTE_KEY_PREFIX = b"v"
+STAKE_HISTORY_PREFIX = b"k"
+
+MAX_GROUP_SIZE = 16
+MAX_REFERENCES_PER_TXN = 8
+MIN_FEE = 1_000
+# Every call references the StakingRewards app and the voter's stake history
+# box; each ballot adds its proposal box and its (proposal, voter) vote box
+BALLOTS_PER_CALL = (MAX_REFERENCES_PER_TXN - 2) // 2
+# Each call is preceded by the payment for the vote boxes it creates
+CALLS_PER_GROUP = MAX_GROUP_SIZE // 2
+# microAlgos each new vote box locks: "v" + proposal ID + voter key, 9-byte VoteRecord
+VOTE_RECORD_MIN_BALANCE = 2_500 + 400 * (len(VOTE_KEY_PREFIX) + 8 + 32 + 1 + 8)
+
+
+@dataclasses.dataclass(frozen=True)
+class Ballot:
+    proposal_id: int
+    choice: int
+
+
+class GovernanceComposer:
+    """Splits a voter's ballots into vote_many calls and groups that fit the reference limits.
+
+    Box references are set explicitly rather than relying on resource
+    population, so every call is known to fit before it is sent. Each call
+    is preceded by a payment of VOTE_RECORD_MIN_BALANCE per ballot for the
+    vote boxes it creates.
+    """
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        app_id: int,
+        staking_rewards_id: int,
+        voter: str,
+    ):
+        self.algorand = algorand
+        self.app_id = app_id
+        self.staking_rewards_id = staking_rewards_id
+        self.voter = voter
+        self._ballots: list[Ballot] = []
+
+    def vote(self, proposal_id: int, choice: int) -> "GovernanceComposer":
+        if choice not in (VOTE_NO, VOTE_YES, VOTE_ABSTAIN):
+            raise ValueError(f"invalid choice {choice}")
+        self._ballots.append(Ballot(proposal_id, choice))
+        return self
+
+    def vote_many(self, ballots: Iterable[Ballot]) -> "GovernanceComposer":
+        for ballot in ballots:
+            self.vote(ballot.proposal_id, ballot.choice)
+        return self
+
+    def _payment(self, ballots: list[Ballot], note: int) -> algokit_utils.PaymentParams:
+        return algokit_utils.PaymentParams(
+            sender=self.voter,
+            receiver=get_application_address(self.app_id),
+            amount=algokit_utils.AlgoAmount.from_micro_algo(VOTE_RECORD_MIN_BALANCE * len(ballots)),
+            note=note.to_bytes(4, "big"),
+        )
+
+    def _call(self, ballots: list[Ballot], note: int) -> algokit_utils.AppCallMethodCallParams:
+        voter_key = encoding.decode_address(self.voter)
+        boxes = [algokit_utils.BoxReference(self.staking_rewards_id, STAKE_HISTORY_PREFIX + voter_key)]
+        for ballot in ballots:
+            proposal_key = ballot.proposal_id.to_bytes(8, "big")
+            boxes.append(algokit_utils.BoxReference(0, PROPOSAL_KEY_PREFIX + proposal_key))
+            boxes.append(algokit_utils.BoxReference(0, VOTE_KEY_PREFIX + proposal_key + voter_key))
+        return algokit_utils.AppCallMethodCallParams(
+            sender=self.voter,
+            app_id=self.app_id,
+            method=VOTE_MANY,
+            args=[[(ballot.proposal_id, ballot.choice) for ballot in ballots]],
+            app_references=[self.staking_rewards_id],
+            box_references=boxes,
+            # One inner get_staked_at call per ballot
+            static_fee=algokit_utils.AlgoAmount.from_micro_algo(MIN_FEE * (1 + len(ballots))),
+            # Calls with identical ballots in separate groups must not share a transaction ID
+            note=note.to_bytes(4, "big"),
+        )
+
+    def build(self) -> list[algokit_utils.TransactionComposer]:
+        """One atomic group per CALLS_PER_GROUP paid calls of at most BALLOTS_PER_CALL ballots"""
+        calls = []
+        for start in range(0, len(self._ballots), BALLOTS_PER_CALL):
+            ballots = self._ballots[start : start + BALLOTS_PER_CALL]
+            calls.append((self._payment(ballots, start), self._call(ballots, start)))
+        groups = []
+        for start in range(0, len(calls), CALLS_PER_GROUP):
+            composer = self.algorand.new_group()
+            for payment, call in calls[start : start + CALLS_PER_GROUP]:
+                composer.add_payment(payment)
+                composer.add_app_call_method_call(call)
+            groups.append(composer)
+        return groups
+
+    def send(self) -> list[int]:
+        """Send every group in order and return the weight of each ballot"""
+        weights: list[int] = []
+        for composer in self.build():
+            result = composer.send()
+            for returned in result.returns:
+                weights.extend(returned.value)
+        self._ballots.clear()
+        return weights
@@ -0,0 +1,127 @@
+"""Keeper that claims or compounds StakingRewards for every staker in few, concurrent groups."""
+import dataclasses
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import algokit_utils
+from algosdk.abi import Method
+
+CLAIM_MANY = Method.from_signature("claim_many(address[])uint64")
+COMPOUND_MANY = Method.from_signature("compound_many(address[])uint64")
+
+MAX_GROUP_SIZE = 16
+MAX_REFERENCES_PER_TXN = 8
+MIN_FEE = 1_000
+# Each staker needs an account and a box reference; the reward token's
+# asset reference is shared by the whole group
+STAKERS_PER_GROUP = (MAX_GROUP_SIZE * MAX_REFERENCES_PER_TXN - 1) // 2
+
+
+@dataclasses.dataclass(frozen=True)
+class GroupFailure:
+    """A group that could not be sent, with the stakers it left unprocessed"""
+
+    index: int
+    stakers: tuple[str, ...]
+    error: str
+
+
+@dataclasses.dataclass(frozen=True)
+class KeeperReport:
+    stakers: int
+    groups: int
+    failures: tuple[GroupFailure, ...]
+    elapsed: float
+
+    @property
+    def failed_groups(self) -> int:
+        return len(self.failures)
+
+    @property
+    def stakers_per_second(self) -> float:
+        return self.stakers / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def shard(
+    stakers: Sequence[str], stakers_per_group: int = STAKERS_PER_GROUP
+) -> list[list[list[str]]]:
+    """Split stakers into groups of at most MAX_GROUP_SIZE calls each.
+
+    Stakers in a group are spread evenly over its calls so every call
+    brings its own opcode budget and reference slots.
+    """
+    if stakers_per_group < 1:
+        raise ValueError("stakers_per_group must be positive")
+    groups = []
+    for start in range(0, len(stakers), stakers_per_group):
+        chunk = list(stakers[start : start + stakers_per_group])
+        calls = min(MAX_GROUP_SIZE, len(chunk))
+        groups.append([chunk[i::calls] for i in range(calls)])
+    return groups
+
+
+def build_group(
+    algorand: algokit_utils.AlgorandClient,
+    app_id: int,
+    sender: str,
+    calls: Sequence[Sequence[str]],
+    method: Method = CLAIM_MANY,
+) -> algokit_utils.TransactionComposer:
+    """Atomic group with one claim_many / compound_many call per staker slice"""
+    composer = algorand.new_group()
+    for call_stakers in calls:
+        composer.add_app_call_method_call(
+            algokit_utils.AppCallMethodCallParams(
+                sender=sender,
+                app_id=app_id,
+                method=method,
+                args=[list(call_stakers)],
+                # Covers the call, one inner transfer per staker and any op-up calls
+                max_fee=algokit_utils.AlgoAmount.from_micro_algo(
+                    MIN_FEE * (1 + 2 * len(call_stakers))
+                ),
+            )
+        )
+    return composer
+
+
+def run_keeper(
+    algorand: algokit_utils.AlgorandClient,
+    app_id: int,
+    sender: str,
+    stakers: Sequence[str],
+    method: Method = CLAIM_MANY,
+    max_workers: int = 8,
+) -> KeeperReport:
+    """Submit every shard concurrently and time the whole run.
+
+    Groups are independent, so a group that fails for any reason (logic
+    error, rejected fee, network error) is recorded in the report's
+    `failures` and the others still go through; its stakers are simply not
+    counted as processed and can be retried from the failure.
+    """
+    groups = shard(stakers)
+    send_params = algokit_utils.SendParams(
+        populate_app_call_resources=True,
+        cover_app_call_inner_transaction_fees=True,
+    )
+
+    def send(calls: list[list[str]]) -> int:
+        build_group(algorand, app_id, sender, calls, method).send(send_params)
+        return sum(len(call_stakers) for call_stakers in calls)
+
+    processed = 0
+    failures: list[GroupFailure] = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(send, calls): index for index, calls in enumerate(groups)}
+        for future in as_completed(futures):
+            try:
+                processed += future.result()
+            except Exception as error:  # One bad group must not stop the run
+                index = futures[future]
+                group_stakers = tuple(staker for call in groups[index] for staker in call)
+                failures.append(GroupFailure(index, group_stakers, f"{type(error).__name__}: {error}"))
+    failures.sort(key=lambda failure: failure.index)
+    return KeeperReport(processed, len(groups), tuple(failures), time.perf_counter() - start)
@@ -0,0 +1,237 @@
+"""Off-chain swap quotes that reproduce SwapPool's on-chain math (see amm_math.py)."""
+import dataclasses
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+UINT64_MAX = (1 << 64) - 1
+# Must match FEE_DENOMINATOR in smart_contracts/emoswapalgo/amm_math.py
+FEE_DENOMINATOR = 1000
+
+_U32 = np.uint64(32)
+_LOW_32 = np.uint64(0xFFFFFFFF)
+# Largest float64 below 2**64, so clipped estimates still convert to uint64
+_FLOAT_UINT64_MAX = float(np.nextafter(np.float64(2.0**64), 0.0))
+
+AmountsLike = int | npt.ArrayLike
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolReserves:
+    """Snapshot of a SwapPool's `get_reserves` / `get_fee_rate` values"""
+
+    reserve_a: int
+    reserve_b: int
+    fee_rate: int = 3
+
+
+@dataclasses.dataclass(frozen=True)
+class SwapQuote:
+    """Vectorized swap result.
+
+    `ok` is False wherever the contract would panic (the new input reserve
+    overflowing uint64 aborts the call instead of wrapping); `amount_out`
+    is 0 there.
+    """
+
+    amount_out: npt.NDArray[np.uint64]
+    ok: npt.NDArray[np.bool_]
+
+
+def as_uint64(amounts: AmountsLike) -> npt.NDArray[np.uint64]:
+    """Convert integer amounts to a uint64 array, rejecting anything the ABI would"""
+    if isinstance(amounts, np.ndarray):
+        array = amounts
+    else:
+        # Going through object dtype keeps Python ints above 2**63 exact
+        array = np.array(amounts, dtype=object)
+        if not all(isinstance(v, int | np.integer) for v in array.flat):
+            raise TypeError("amounts must be integers")
+    if array.dtype.kind not in "uiO":
+        raise TypeError(f"amounts must be integers, got dtype {array.dtype}")
+    if array.dtype.kind != "u" and (array < 0).any():
+        raise ValueError("amounts must be non-negative")
+    try:
+        return array.astype(np.uint64)
+    except OverflowError:
+        raise ValueError("amounts must fit in uint64") from None
+
+
+def amount_out(amount_in: int, reserve_in: int, reserve_out: int, fee_rate: int) -> int | None:
+    """Scalar version of `get_amount_out`; None where the contract would panic"""
+    if reserve_in == 0 or reserve_out == 0:
+        return 0
+    if reserve_in + amount_in > UINT64_MAX:
+        return None
+    amount_in_after_fee = amount_in - amount_in * fee_rate // FEE_DENOMINATOR
+    return reserve_out * amount_in_after_fee // (reserve_in + amount_in_after_fee)
+
+
+def _mul128(
+    x: npt.NDArray[np.uint64], y: npt.NDArray[np.uint64]
+) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.uint64]]:
+    """Full 128-bit product as (high, low) words, like the AVM's `mulw`"""
+    x_high, x_low = x >> _U32, x & _LOW_32
+    y_high, y_low = y >> _U32, y & _LOW_32
+    low_low = x_low * y_low
+    low_high = x_low * y_high
+    high_low = x_high * y_low
+    middle = (low_low >> _U32) + (low_high & _LOW_32) + (high_low & _LOW_32)
+    low = (low_low & _LOW_32) | (middle << _U32)
+    high = x_high * y_high + (low_high >> _U32) + (high_low >> _U32) + (middle >> _U32)
+    return high, low
+
+
+def _mul_div_floor(
+    x: npt.NDArray[np.uint64], y: npt.NDArray[np.uint64], d: npt.NDArray[np.uint64]
+) -> npt.NDArray[np.uint64]:
+    """floor(x * y / d) for lanes whose quotient fits in uint64 (`mul_div` on-chain).
+
+    A float64 estimate is off by at most a few thousand units; one
+    correction step using the float value of the exact 128-bit remainder
+    brings it within one unit, and an exact remainder comparison finishes it.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        d_float = d.astype(np.float64)
+        estimate = np.floor(x.astype(np.float64) * y.astype(np.float64) / d_float)
+        quotient = np.clip(np.nan_to_num(estimate), 0.0, _FLOAT_UINT64_MAX).astype(np.uint64)
+        product_high, product_low = _mul128(x, y)
+
+        def remainder() -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.uint64]]:
+            # x * y - quotient * d as a two's complement 128-bit value
+            qd_high, qd_low = _mul128(quotient, d)
+            borrow = (product_low < qd_low).astype(np.uint64)
+            return product_high - qd_high - borrow, product_low - qd_low
+
+        rem_high, rem_low = remainder()
+        # Convert |remainder| rather than the raw words to avoid cancellation
+        negative = rem_high.view(np.int64) < 0
+        abs_low = np.where(negative, ~rem_low + np.uint64(1), rem_low)
+        abs_high = np.where(negative, ~rem_high + (rem_low == 0).astype(np.uint64), rem_high)
+        rem_float = abs_high.astype(np.float64) * 2.0**64 + abs_low.astype(np.float64)
+        step = np.floor(np.where(negative, -rem_float, rem_float) / d_float)
+        up = np.clip(step, 0.0, _FLOAT_UINT64_MAX).astype(np.uint64)
+        down = np.clip(-step, 0.0, _FLOAT_UINT64_MAX).astype(np.uint64)
+        quotient = np.where(quotient >= down, quotient - down, np.uint64(0))
+        quotient = np.where(np.uint64(UINT64_MAX) - quotient >= up, quotient + up, np.uint64(UINT64_MAX))
+
+        # The step can only be off by one where the float ratio rounds across an integer
+        rem_high, rem_low = remainder()
+        negative = rem_high.view(np.int64) < 0
+        too_small = ~negative & ((rem_high > 0) | (rem_low >= d))
+        quotient = quotient - negative.astype(np.uint64) + too_small.astype(np.uint64)
+    return quotient
+
+
+def _constant_product_out(
+    amounts: npt.NDArray[np.uint64], reserve_in: int, reserve_out: int, fee_rate: int
+) -> SwapQuote:
+    if reserve_in == 0 or reserve_out == 0:
+        # Empty pool: the contract returns 0 and leaves the reserves untouched
+        return SwapQuote(
+            np.zeros(amounts.shape, dtype=np.uint64),
+            np.ones(amounts.shape, dtype=np.bool_),
+        )
+
+    shape = amounts.shape
+    amounts = amounts.reshape(-1)
+    ok = amounts <= np.uint64(UINT64_MAX - reserve_in)
+    safe = np.where(ok, amounts, np.uint64(0))
+
+    # fee = floor(amount * fee_rate / FEE_DENOMINATOR), split so nothing overflows
+    denominator = np.uint64(FEE_DENOMINATOR)
+    fee = (safe // denominator) * np.uint64(fee_rate) + (
+        (safe % denominator) * np.uint64(fee_rate)
+    ) // denominator
+    amount_in_after_fee = safe - fee
+
+    denominator = np.uint64(reserve_in) + amount_in_after_fee
+
+    # Plain uint64 math where reserve_out * amount fits, 128-bit math elsewhere
+    narrow = amount_in_after_fee <= np.uint64(UINT64_MAX // reserve_out)
+    amount_out = (np.uint64(reserve_out) * np.where(narrow, amount_in_after_fee, np.uint64(0))) // denominator
+    if not narrow.all():
+        wide = ~narrow
+        amount_out[wide] = _mul_div_floor(
+            np.full(int(wide.sum()), reserve_out, dtype=np.uint64),
+            amount_in_after_fee[wide],
+            denominator[wide],
+        )
+    amount_out[~ok] = 0
+    return SwapQuote(amount_out.reshape(shape), ok.reshape(shape))
+
+
+def quote_a_for_b(pool: PoolReserves, amounts_a: AmountsLike) -> SwapQuote:
+    """Amounts of B returned by `SwapPool.swap_a_for_b` for each input amount"""
+    return _constant_product_out(
+        as_uint64(amounts_a), pool.reserve_a, pool.reserve_b, pool.fee_rate
+    )
+
+
+def quote_b_for_a(pool: PoolReserves, amounts_b: AmountsLike) -> SwapQuote:
+    """Amounts of A returned by `SwapPool.swap_b_for_a` for each input amount"""
+    return _constant_product_out(
+        as_uint64(amounts_b), pool.reserve_b, pool.reserve_a, pool.fee_rate
+    )
+
+
+def quote_both(pool: PoolReserves, amounts: AmountsLike) -> tuple[SwapQuote, SwapQuote]:
+    """Quote the same input amounts in both directions"""
+    array = as_uint64(amounts)
+    return (
+        _constant_product_out(array, pool.reserve_a, pool.reserve_b, pool.fee_rate),
+        _constant_product_out(array, pool.reserve_b, pool.reserve_a, pool.fee_rate),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class ZapPreview:
+    """What `SwapPool.zap_in` would do; reserves are the pool's after the call"""
+
+    swap_amount: int
+    amount_out: int
+    shares: int
+    reserve_a: int
+    reserve_b: int
+
+
+def zap_swap_amount(amount_in: int, reserve_in: int, fee_rate: int) -> int:
+    """Same closed form and rounding as `zap_swap_amount` in amm_math.py"""
+    kept = FEE_DENOMINATOR - fee_rate
+    linear = reserve_in * (FEE_DENOMINATOR + kept)
+    root = math.isqrt(linear * linear + 4 * kept * FEE_DENOMINATOR * reserve_in * amount_in)
+    return (root - linear) // (2 * kept)
+
+
+def preview_zap_in(
+    pool: PoolReserves, total_supply: int, amount: int, a_in: bool = True
+) -> ZapPreview | None:
+    """Shares `zap_in` mints for a one-sided deposit; None where the contract would panic"""
+    if total_supply == 0:
+        return None
+    if a_in:
+        reserve_in, reserve_out = pool.reserve_a, pool.reserve_b
+    else:
+        reserve_in, reserve_out = pool.reserve_b, pool.reserve_a
+    swap_amount = zap_swap_amount(amount, reserve_in, pool.fee_rate)
+    out = amount_out(swap_amount, reserve_in, reserve_out, pool.fee_rate)
+    if out is None:
+        return None
+    reserve_in += swap_amount
+    reserve_out -= out
+    if reserve_out == 0:
+        return None
+    deposit_in = amount - swap_amount
+    minted_in = deposit_in * total_supply // reserve_in
+    minted_out = out * total_supply // reserve_out
+    # Each mul_div asserts its own result fits, before the min is taken
+    if minted_in > UINT64_MAX or minted_out > UINT64_MAX:
+        return None
+    shares = min(minted_in, minted_out)
+    reserve_in += deposit_in
+    reserve_out += out
+    if shares == 0 or total_supply + shares > UINT64_MAX or reserve_in > UINT64_MAX:
+        return None
+    reserve_a, reserve_b = (reserve_in, reserve_out) if a_in else (reserve_out, reserve_in)
+    return ZapPreview(swap_amount, out, shares, reserve_a, reserve_b)
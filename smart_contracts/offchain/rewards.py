@@ -0,0 +1,167 @@
+"""Vectorized pending-reward and yield projections for every StakingRewards staker."""
+import dataclasses
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.offchain.staking import STAKER_KEY_PREFIX, STAKER_KEY_SIZE, STAKER_RECORD_SIZE
+from smart_contracts.offchain.state import fetch_boxes_at_round, fetch_global_state
+
+# Must match smart_contracts/emoswapalgo/staking_rewards.py
+REWARD_PRECISION = 10**12
+SECONDS_PER_YEAR = 31_536_000
+
+_U20 = np.uint64(20)
+_LOW_20 = np.uint64((1 << 20) - 1)
+
+_RECORD_DTYPE = np.dtype(
+    [
+        ("staked", ">u8"),
+        ("reward_debt", ">u8"),
+        ("accrued_rewards", ">u8"),
+        ("last_claim_time", ">u8"),
+        ("compounded_rewards", ">u8"),
+    ]
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class StakingSnapshot:
+    """StakingRewards global state plus every staker record, one array lane per staker"""
+
+    reward_rate: int
+    reward_per_token_stored: int
+    last_update_time: int
+    total_staked: int
+    addresses: list[str]
+    staked: npt.NDArray[np.uint64]
+    reward_debt: npt.NDArray[np.uint64]
+    accrued_rewards: npt.NDArray[np.uint64]
+    last_claim_time: npt.NDArray[np.uint64]
+    compounded_rewards: npt.NDArray[np.uint64]
+    round: int = 0  # Ledger round the staker boxes were read at; 0 if unknown
+
+    @classmethod
+    def from_records(
+        cls, state: dict[str, bytes | int], addresses: Sequence[str], records: bytes, round: int = 0
+    ) -> "StakingSnapshot":
+        """Build from decoded global state and the concatenated 40-byte box values"""
+        if len(records) != len(addresses) * STAKER_RECORD_SIZE:
+            raise ValueError("expected one record per address")
+        fields = np.frombuffer(records, dtype=_RECORD_DTYPE)
+        return cls(
+            reward_rate=int(state.get("reward_rate", 0)),
+            reward_per_token_stored=int(state.get("reward_per_token_stored", 0)),
+            last_update_time=int(state.get("last_update_time", 0)),
+            total_staked=int(state.get("total_staked", 0)),
+            addresses=list(addresses),
+            **{name: fields[name].astype(np.uint64) for name in _RECORD_DTYPE.names},
+            round=round,
+        )
+
+    @classmethod
+    def from_chain(cls, algod: AlgodClient, app_id: int, max_attempts: int = 3) -> "StakingSnapshot":
+        """Read global state and every staker box as one consistent view.
+
+        All records come from a single paginated box listing pinned to one
+        round. Every call that touches a staker record also settles the
+        global accumulator, so global state is read before and after the
+        listing and the read is retried whenever either check fails.
+        """
+        for _ in range(max_attempts):
+            state = fetch_global_state(algod, app_id)
+            try:
+                boxes, round = fetch_boxes_at_round(algod, app_id, STAKER_KEY_PREFIX)
+            except ValueError:
+                continue
+            if fetch_global_state(algod, app_id) != state:
+                continue
+            stakers = [(name, value) for name, value in boxes.items() if len(name) == STAKER_KEY_SIZE]
+            addresses = [encoding.encode_address(name[len(STAKER_KEY_PREFIX):]) for name, _ in stakers]
+            records = b"".join(value for _, value in stakers)
+            return cls.from_records(state, addresses, records, round)
+        raise RuntimeError(f"app {app_id} changed during each of {max_attempts} snapshot attempts")
+
+    def reward_per_token_at(self, timestamp: int, reward_rate: int | None = None) -> int:
+        """Accumulator value at `timestamp` if nothing touches the app before then"""
+        rate = self.reward_rate if reward_rate is None else reward_rate
+        reward_per_token = self.reward_per_token_stored
+        if self.last_update_time > 0 and timestamp > self.last_update_time:
+            reward_per_token += (
+                rate * (timestamp - self.last_update_time) * REWARD_PRECISION
+                // (100 * SECONDS_PER_YEAR)
+            )
+        return reward_per_token
+
+
+@dataclasses.dataclass(frozen=True)
+class RewardProjection:
+    """`pending` is earned at the snapshot's `now`; `projected[k]` is earned
+    after `horizon` more seconds at `reward_rates[k]`; `annual_yield[k]` is
+    one year of rewards at that rate. A claim also pays out `compounded_rewards`."""
+
+    reward_rates: tuple[int, ...]
+    pending: npt.NDArray[np.uint64]
+    projected: npt.NDArray[np.uint64]
+    annual_yield: npt.NDArray[np.uint64]
+
+
+def _scaled_share(staked: npt.NDArray[np.uint64], reward_per_token: int) -> npt.NDArray[np.uint64]:
+    """floor(staked * reward_per_token / REWARD_PRECISION), like the contract's mul_div.
+
+    REWARD_PRECISION is below 2**40, so splitting both factors around it
+    (and the stake remainder at 2**20) keeps every partial product inside
+    uint64 without 128-bit limbs. Lanes whose result overflows uint64 would
+    also fail on-chain.
+    """
+    precision = np.uint64(REWARD_PRECISION)
+    rpt_high, rpt_low = divmod(reward_per_token, REWARD_PRECISION)
+    staked_high, staked_low = staked // precision, staked % precision
+    # staked_low * rpt_low needs up to 80 bits: split staked_low at 2**20
+    partial = (staked_low >> _U20) * np.uint64(rpt_low)
+    partial_high, partial_low = partial // precision, partial % precision
+    low_bits = (partial_low << _U20) + (staked_low & _LOW_20) * np.uint64(rpt_low)
+    return (
+        staked_high * np.uint64(reward_per_token)
+        + staked_low * np.uint64(rpt_high)
+        + (partial_high << _U20)
+        + low_bits // precision
+    )
+
+
+def _earned(snapshot: StakingSnapshot, reward_per_token: int) -> npt.NDArray[np.uint64]:
+    earning = snapshot.staked + snapshot.compounded_rewards
+    return snapshot.accrued_rewards + _scaled_share(earning, reward_per_token) - snapshot.reward_debt
+
+
+def project(
+    snapshot: StakingSnapshot,
+    now: int,
+    horizon: int = SECONDS_PER_YEAR,
+    reward_rates: Sequence[int] | None = None,
+) -> RewardProjection:
+    """Pending rewards now and after `horizon` seconds for every staker.
+
+    `reward_rates` are what-if rates (percent per year); the current rate
+    is used when omitted. Projections assume no other app call settles the
+    accumulator in between, so they can differ from on-chain results by
+    the rounding of intermediate updates.
+    """
+    rates = (snapshot.reward_rate,) if reward_rates is None else tuple(reward_rates)
+    reward_per_token = snapshot.reward_per_token_at(now)
+    pending = _earned(snapshot, reward_per_token)
+
+    projected = np.empty((len(rates), len(snapshot.addresses)), dtype=np.uint64)
+    annual_yield = np.empty_like(projected)
+    for k, rate in enumerate(rates):
+        # The accumulator grows by the same amount for every staker, so
+        # each rate is one scalar plus a single pass over the stake array
+        growth = rate * horizon * REWARD_PRECISION // (100 * SECONDS_PER_YEAR)
+        projected[k] = _earned(snapshot, reward_per_token + growth)
+        annual_yield[k] = _scaled_share(
+            snapshot.staked + snapshot.compounded_rewards, rate * REWARD_PRECISION // 100
+        )
+    return RewardProjection(rates, pending, projected, annual_yield)
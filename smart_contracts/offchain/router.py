@@ -0,0 +1,219 @@
+"""Multi-hop routing across SwapPool apps using an in-memory reserve graph."""
+import dataclasses
+from collections import defaultdict
+from collections.abc import Iterable
+
+import algokit_utils
+from algosdk.abi import Method
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.offchain.quote import amount_out
+from smart_contracts.offchain.state import fetch_global_state
+
+SWAP_A_FOR_B = Method.from_signature("swap_a_for_b(uint64,uint64)uint64")
+SWAP_B_FOR_A = Method.from_signature("swap_b_for_a(uint64,uint64)uint64")
+
+MAX_GROUP_SIZE = 16
+# Slippage tolerances are in basis points of the quoted output
+BPS_DENOMINATOR = 10_000
+DEFAULT_SLIPPAGE_BPS = 50
+
+
+def min_amount_out(quoted: int, slippage_bps: int = DEFAULT_SLIPPAGE_BPS) -> int:
+    """Smallest output to accept for a quote, `slippage_bps` below it and rounded down"""
+    if not 0 <= slippage_bps <= BPS_DENOMINATOR:
+        raise ValueError(f"slippage_bps must be in 0..{BPS_DENOMINATOR}")
+    return quoted * (BPS_DENOMINATOR - slippage_bps) // BPS_DENOMINATOR
+
+
+@dataclasses.dataclass
+class Pool:
+    """Cached SwapPool state; `round` is the round the reserves were read at"""
+
+    app_id: int
+    asset_a: int
+    asset_b: int
+    reserve_a: int
+    reserve_b: int
+    fee_rate: int = 3
+    round: int = 0
+
+    @classmethod
+    def from_global_state(cls, app_id: int, state: dict[str, bytes | int], round: int) -> "Pool":
+        return cls(
+            app_id=app_id,
+            asset_a=int(state.get("asset_a", 0)),
+            asset_b=int(state.get("asset_b", 0)),
+            reserve_a=int(state.get("reserve_a", 0)),
+            reserve_b=int(state.get("reserve_b", 0)),
+            fee_rate=int(state.get("fee_rate", 3)),
+            round=round,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Hop:
+    app_id: int
+    a_for_b: bool
+    asset_in: int
+    asset_out: int
+    amount_in: int
+    amount_out: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Route:
+    hops: tuple[Hop, ...]
+
+    @property
+    def amount_in(self) -> int:
+        return self.hops[0].amount_in
+
+    @property
+    def amount_out(self) -> int:
+        return self.hops[-1].amount_out
+
+    @property
+    def assets(self) -> list[int]:
+        return [self.hops[0].asset_in, *(hop.asset_out for hop in self.hops)]
+
+    def min_amount_out(self, slippage_bps: int = DEFAULT_SLIPPAGE_BPS) -> int:
+        """Final output to accept if reserves move against the route before it lands"""
+        return min_amount_out(self.amount_out, slippage_bps)
+
+
+class PoolGraph:
+    """Asset graph whose edges are the two swap directions of every pool"""
+
+    def __init__(self, pools: Iterable[Pool] = ()):
+        self.pools: dict[int, Pool] = {}
+        self._edges: dict[int, list[tuple[Pool, bool]]] = defaultdict(list)
+        for pool in pools:
+            self.add_pool(pool)
+
+    def add_pool(self, pool: Pool) -> None:
+        if pool.app_id in self.pools:
+            self.remove_pool(pool.app_id)
+        self.pools[pool.app_id] = pool
+        self._edges[pool.asset_a].append((pool, True))
+        self._edges[pool.asset_b].append((pool, False))
+
+    def remove_pool(self, app_id: int) -> None:
+        pool = self.pools.pop(app_id)
+        for asset in (pool.asset_a, pool.asset_b):
+            self._edges[asset] = [edge for edge in self._edges[asset] if edge[0] is not pool]
+
+    def add_pool_from_chain(self, algod: AlgodClient, app_id: int) -> Pool:
+        current_round = algod.status()["last-round"]
+        pool = Pool.from_global_state(app_id, fetch_global_state(algod, app_id), current_round)
+        self.add_pool(pool)
+        return pool
+
+    def update_reserves(
+        self,
+        app_id: int,
+        reserve_a: int,
+        reserve_b: int,
+        round: int,
+        fee_rate: int | None = None,
+    ) -> bool:
+        """Apply reserves observed at `round`; stale updates are ignored"""
+        pool = self.pools[app_id]
+        if round < pool.round:
+            return False
+        pool.reserve_a = reserve_a
+        pool.reserve_b = reserve_b
+        if fee_rate is not None:
+            pool.fee_rate = fee_rate
+        pool.round = round
+        return True
+
+    def refresh(self, algod: AlgodClient, app_ids: Iterable[int] | None = None) -> int:
+        """Re-read pools not yet seen at the current round.
+
+        Pass the app IDs touched by new blocks as `app_ids` to limit the
+        refresh to those pools. Returns the number of pools re-read.
+        """
+        current_round = algod.status()["last-round"]
+        refreshed = 0
+        for app_id in self.pools if app_ids is None else app_ids:
+            pool = self.pools.get(app_id)
+            if pool is None or pool.round >= current_round:
+                continue
+            state = fetch_global_state(algod, app_id)
+            self.update_reserves(
+                app_id,
+                int(state.get("reserve_a", 0)),
+                int(state.get("reserve_b", 0)),
+                current_round,
+                fee_rate=int(state.get("fee_rate", pool.fee_rate)),
+            )
+            refreshed += 1
+        return refreshed
+
+    def best_route(
+        self, asset_in: int, asset_out: int, amount_in: int, max_hops: int = 3
+    ) -> Route | None:
+        """Highest-output path of at most `max_hops` swaps, or None if unreachable.
+
+        Hop-bounded Bellman-Ford. Maximising the final amount is the same as
+        minimising the summed -log(amount_out / amount_in) of each hop, but
+        relaxing on exact integer outputs keeps price impact and the
+        contract's rounding in the comparison instead of spot log-prices.
+        Paths never revisit an asset.
+        """
+        if asset_in == asset_out or amount_in <= 0:
+            return None
+        max_hops = min(max_hops, MAX_GROUP_SIZE)
+
+        best: Route | None = None
+        frontier: dict[int, tuple[int, tuple[Hop, ...]]] = {asset_in: (amount_in, ())}
+        for _ in range(max_hops):
+            next_frontier: dict[int, tuple[int, tuple[Hop, ...]]] = {}
+            for asset, (amount, hops) in frontier.items():
+                visited = {asset_in, *(hop.asset_out for hop in hops)}
+                for pool, a_for_b in self._edges.get(asset, ()):
+                    if a_for_b:
+                        target = pool.asset_b
+                        out = amount_out(amount, pool.reserve_a, pool.reserve_b, pool.fee_rate)
+                    else:
+                        target = pool.asset_a
+                        out = amount_out(amount, pool.reserve_b, pool.reserve_a, pool.fee_rate)
+                    if target in visited or not out:
+                        continue
+                    known = next_frontier.get(target)
+                    if known is None or out > known[0]:
+                        hop = Hop(pool.app_id, a_for_b, asset, target, amount, out)
+                        next_frontier[target] = (out, (*hops, hop))
+
+            arrived = next_frontier.pop(asset_out, None)
+            if arrived is not None and (best is None or arrived[0] > best.amount_out):
+                best = Route(arrived[1])
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return best
+
+
+def build_route_group(
+    algorand: algokit_utils.AlgorandClient,
+    route: Route,
+    sender: str,
+    slippage_bps: int = DEFAULT_SLIPPAGE_BPS,
+) -> algokit_utils.TransactionComposer:
+    """Atomic group with one swap_a_for_b / swap_b_for_a call per hop.
+
+    Every hop passes its quoted output less `slippage_bps` as the swap's
+    minimum, so the whole group fails if any pool moved too far.
+    """
+    composer = algorand.new_group()
+    for hop in route.hops:
+        composer.add_app_call_method_call(
+            algokit_utils.AppCallMethodCallParams(
+                sender=sender,
+                app_id=hop.app_id,
+                method=SWAP_A_FOR_B if hop.a_for_b else SWAP_B_FOR_A,
+                args=[hop.amount_in, min_amount_out(hop.amount_out, slippage_bps)],
+            )
+        )
+    return composer
@@ -0,0 +1,103 @@
+"""Client-side helpers for StakingRewards' packed per-staker box records."""
+import dataclasses
+import struct
+
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.offchain.checkpoints import (
+    STAKE_CHECKPOINT_SIZE,
+    STAKE_HISTORY_HEADER_SIZE,
+    STAKE_HISTORY_PREFIX,
+)
+from smart_contracts.offchain.state import fetch_boxes
+
+# Must match StakingRewards.stakers in smart_contracts/emoswapalgo/staking_rewards.py
+STAKER_KEY_PREFIX = b"s"
+STAKER_KEY_SIZE = len(STAKER_KEY_PREFIX) + 32  # prefix + 32-byte address
+STAKER_RECORD_SIZE = 5 * 8  # staked, reward_debt, accrued_rewards, last_claim_time, compounded_rewards
+# Must match MAX_STAKE_CHECKPOINTS in staking_rewards.py
+MAX_STAKE_CHECKPOINTS = 63
+STAKE_HISTORY_KEY_SIZE = len(STAKE_HISTORY_PREFIX) + 32
+
+# Protocol minimum balance for box storage, in microAlgos
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+_RECORD = struct.Struct(">QQQQQ")
+
+
+@dataclasses.dataclass(frozen=True)
+class StakerRecord:
+    staked: int
+    reward_debt: int
+    accrued_rewards: int
+    last_claim_time: int
+    compounded_rewards: int
+
+    @classmethod
+    def from_box(cls, value: bytes) -> "StakerRecord":
+        if len(value) != STAKER_RECORD_SIZE:
+            raise ValueError(f"expected {STAKER_RECORD_SIZE} bytes, got {len(value)}")
+        return cls(*_RECORD.unpack(value))
+
+
+def staker_box_name(address: str) -> bytes:
+    """Box name holding the record of `address`"""
+    return STAKER_KEY_PREFIX + encoding.decode_address(address)
+
+
+def fetch_staker_addresses(algod: AlgodClient, app_id: int) -> list[str]:
+    """Addresses of every staker with a record box, from a paginated box listing"""
+    return [
+        encoding.encode_address(name[len(STAKER_KEY_PREFIX):])
+        for name in fetch_boxes(algod, app_id, STAKER_KEY_PREFIX)
+        if len(name) == STAKER_KEY_SIZE
+    ]
+
+
+def box_min_balance(key_size: int, value_size: int) -> int:
+    """microAlgos the app account must hold for one box of the given sizes"""
+    return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (key_size + value_size)
+
+
+def stake_history_min_balance(checkpoints: int = MAX_STAKE_CHECKPOINTS) -> int:
+    """microAlgos locked by a stake history box with `checkpoints` entries (422,100 when full)"""
+    if not 0 < checkpoints <= MAX_STAKE_CHECKPOINTS:
+        raise ValueError(f"checkpoints must be in 1..{MAX_STAKE_CHECKPOINTS}")
+    return box_min_balance(
+        STAKE_HISTORY_KEY_SIZE, STAKE_HISTORY_HEADER_SIZE + checkpoints * STAKE_CHECKPOINT_SIZE
+    )
+
+
+def staker_min_balance() -> int:
+    """microAlgos of app minimum balance each staker can lock: their record plus a full history"""
+    return box_min_balance(STAKER_KEY_SIZE, STAKER_RECORD_SIZE) + stake_history_min_balance()
+
+
+def stake_payment(has_record: bool, checkpoints: int) -> int:
+    """microAlgos a stake / unstake must pay the app for a staker with `checkpoints` history entries.
+
+    This is the growth if the call lands in a new round; a second change in
+    the same round, or one to a full history, grows nothing and any
+    overpayment stays with the app.
+    """
+    if checkpoints < 0 or checkpoints > MAX_STAKE_CHECKPOINTS:
+        raise ValueError(f"checkpoints must be in 0..{MAX_STAKE_CHECKPOINTS}")
+    payment = 0 if has_record else box_min_balance(STAKER_KEY_SIZE, STAKER_RECORD_SIZE)
+    if checkpoints == 0:
+        return payment + stake_history_min_balance(1)
+    if checkpoints < MAX_STAKE_CHECKPOINTS:
+        return payment + BOX_BYTE_MIN_BALANCE * STAKE_CHECKPOINT_SIZE
+    return payment
+
+
+def min_balance_for_stakers(count: int) -> int:
+    """microAlgos that cover `count` stakers' records and full histories.
+
+    Stakers pay for their own boxes as they grow, so this is what their
+    payments add up to once every history is full.
+    """
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    return count * staker_min_balance()
@@ -0,0 +1,266 @@
+"""Bulk, cached reads of app global state via a single `application_info` request,
+plus bulk box reads via algod's box listing."""
+import base64
+import dataclasses
+import threading
+import time
+import typing
+from collections.abc import Callable, Iterator
+
+import algokit_utils
+from algosdk.encoding import encode_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.emoswapalgo.emoswapalgo_client import EmoswapalgoClient
+
+# algod TEAL value type for byte slices (uints are type 2)
+_BYTES_TYPE = 1
+
+
+def decode_global_state(raw_state: list[dict]) -> dict[str, bytes | int]:
+    """Decode algod's `global-state` key/value list into a plain dict"""
+    decoded: dict[str, bytes | int] = {}
+    for entry in raw_state:
+        key = base64.b64decode(entry["key"]).decode("utf-8", errors="replace")
+        value = entry["value"]
+        if value["type"] == _BYTES_TYPE:
+            decoded[key] = base64.b64decode(value.get("bytes", ""))
+        else:
+            decoded[key] = value.get("uint", 0)
+    return decoded
+
+
+def fetch_global_state(algod: AlgodClient, app_id: int) -> dict[str, bytes | int]:
+    """Fetch and decode every global key of an app in one request"""
+    info = algod.application_info(app_id)
+    return decode_global_state(info["params"].get("global-state", []))
+
+
+def _box_pages(algod: AlgodClient, app_id: int, prefix: bytes) -> Iterator[dict]:
+    """Pages of the box listing endpoint with `values=true`, following next-token"""
+    params: dict[str, str] = {"values": "true"}
+    if prefix:
+        params["prefix"] = "b64:" + base64.b64encode(prefix).decode()
+    while True:
+        page = algod.algod_request("GET", f"/applications/{app_id}/boxes", params=params)
+        yield page
+        next_token = page.get("next-token")
+        if not next_token:
+            return
+        params["next"] = next_token
+
+
+def _decode_boxes(page: dict) -> dict[bytes, bytes]:
+    return {
+        base64.b64decode(box["name"]): base64.b64decode(box.get("value", ""))
+        for box in page.get("boxes", [])
+    }
+
+
+def fetch_boxes(algod: AlgodClient, app_id: int, prefix: bytes = b"") -> dict[bytes, bytes]:
+    """Fetch every box whose name starts with `prefix`, values included.
+
+    Uses the box listing endpoint with `values=true`, so the whole set
+    comes back in one paginated pass instead of one request per box.
+    """
+    boxes: dict[bytes, bytes] = {}
+    for page in _box_pages(algod, app_id, prefix):
+        boxes.update(_decode_boxes(page))
+    return boxes
+
+
+def fetch_boxes_at_round(
+    algod: AlgodClient, app_id: int, prefix: bytes = b""
+) -> tuple[dict[bytes, bytes], int]:
+    """Like `fetch_boxes`, plus the round the listing was read at.
+
+    Each page reports the round it was served from; a listing whose pages
+    disagree mixes two ledger states, so it raises ValueError and callers
+    should read again.
+    """
+    boxes: dict[bytes, bytes] = {}
+    rounds: set[int] = set()
+    for page in _box_pages(algod, app_id, prefix):
+        boxes.update(_decode_boxes(page))
+        rounds.add(page.get("round", 0))
+    if len(rounds) > 1:
+        raise ValueError(f"box listing spanned rounds {min(rounds)}..{max(rounds)}")
+    return boxes, rounds.pop()
+
+
+@dataclasses.dataclass(frozen=True)
+class EmoswapalgoGlobalState:
+    """Typed view of the Emoswapalgo registry's global state"""
+
+    admin: str
+    mood_token_id: int
+    emotion_factory_id: int
+    governance_id: int
+    liquidity_pool_id: int
+    staking_rewards_id: int
+    swap_pool_id: int
+
+    @classmethod
+    def from_raw(cls, state: dict[str, bytes | int]) -> "EmoswapalgoGlobalState":
+        """Decode every registry key; raises KeyError if any is missing, so a
+        wrong app ID or an outdated contract fails loudly instead of reading 0"""
+        missing = [field.name for field in dataclasses.fields(cls) if field.name not in state]
+        if missing:
+            raise KeyError(f"registry global state lacks {', '.join(missing)}")
+        values: dict[str, str | int] = {}
+        for field in dataclasses.fields(cls):
+            value = state[field.name]
+            if field.name == "admin":
+                values[field.name] = encode_address(value) if value else ""
+            else:
+                values[field.name] = int(value)
+        return cls(**values)  # type: ignore[arg-type]
+
+
+@dataclasses.dataclass(frozen=True)
+class _CacheEntry:
+    state: EmoswapalgoGlobalState
+    round: int
+    fetched_at: float
+
+
+class EmoswapalgoStateReader:
+    """Caches the registry state per round, optionally short-circuited by a TTL.
+
+    Within `ttl` seconds of the last fetch no request is made at all. After
+    that, one `status` call tells whether a new round has been produced; the
+    state is only re-fetched when it has, since it cannot change mid-round.
+    """
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        app_id: int,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.algod = algod
+        self.app_id = app_id
+        self.ttl = ttl
+        self._clock = clock
+        self._entry: _CacheEntry | None = None
+
+    @classmethod
+    def from_client(
+        cls, app_client: EmoswapalgoClient, *, ttl: float | None = None
+    ) -> "EmoswapalgoStateReader":
+        """Build a reader for the app behind a typed client"""
+        return cls(app_client.algorand.client.algod, app_client.app_id, ttl=ttl)
+
+    @property
+    def last_round(self) -> int | None:
+        """Round at which the cached state was last confirmed current"""
+        return self._entry.round if self._entry else None
+
+    def invalidate(self) -> None:
+        self._entry = None
+
+    def get(self, *, force: bool = False) -> EmoswapalgoGlobalState:
+        now = self._clock()
+        entry = self._entry
+        if (
+            not force
+            and entry is not None
+            and self.ttl is not None
+            and now - entry.fetched_at < self.ttl
+        ):
+            return entry.state
+
+        current_round = self.algod.status()["last-round"]
+        if not force and entry is not None and entry.round == current_round:
+            self._entry = dataclasses.replace(entry, fetched_at=now)
+            return entry.state
+
+        state = EmoswapalgoGlobalState.from_raw(fetch_global_state(self.algod, self.app_id))
+        self._entry = _CacheEntry(state=state, round=current_round, fetched_at=now)
+        return state
+
+
+_ClientT = typing.TypeVar("_ClientT")
+
+
+class RegistryResolver:
+    """Process-wide, thread-safe cache of the app IDs held by an Emoswapalgo registry.
+
+    `shared` hands out one resolver per (algod node, registry app), so every
+    typed client built through it resolves IDs from the same cache; each
+    refresh is one `application_info` request, subject to the TTL and
+    round checks of `EmoswapalgoStateReader`.
+    """
+
+    _shared: typing.ClassVar[dict[tuple[str, int], "RegistryResolver"]] = {}
+    _shared_lock: typing.ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        app_id: int,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._reader = EmoswapalgoStateReader(algod, app_id, ttl=ttl, clock=clock)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, algod: AlgodClient, app_id: int, *, ttl: float | None = None) -> "RegistryResolver":
+        """The resolver for this node and registry, created on first use.
+
+        A `ttl` given here replaces the TTL of an existing shared resolver.
+        """
+        key = (algod.algod_address, app_id)
+        with cls._shared_lock:
+            resolver = cls._shared.get(key)
+            if resolver is None:
+                resolver = cls._shared[key] = cls(algod, app_id, ttl=ttl)
+            elif ttl is not None:
+                resolver._reader.ttl = ttl
+            return resolver
+
+    @classmethod
+    def for_client(cls, app_client: EmoswapalgoClient, *, ttl: float | None = None) -> "RegistryResolver":
+        return cls.shared(app_client.algorand.client.algod, app_client.app_id, ttl=ttl)
+
+    @property
+    def app_id(self) -> int:
+        return self._reader.app_id
+
+    def get(self, *, force: bool = False) -> EmoswapalgoGlobalState:
+        with self._lock:
+            return self._reader.get(force=force)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._reader.invalidate()
+
+    def resolve(self, name: str) -> int:
+        """App or asset ID stored under `name`, e.g. "swap_pool_id".
+
+        Raises KeyError for a name the registry does not hold and
+        ValueError when the ID is 0, i.e. it was never set.
+        """
+        value = getattr(self.get(), name, None)
+        if not isinstance(value, int):
+            raise KeyError(name)
+        if value == 0:
+            raise ValueError(f"{name} is not set in registry app {self.app_id}")
+        return value
+
+    def typed_client(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        client_type: type[_ClientT],
+        name: str,
+        *,
+        default_sender: str | None = None,
+    ) -> _ClientT:
+        """Typed client for the app registered under `name`, resolved from the shared cache"""
+        return algorand.client.get_typed_app_client_by_id(
+            client_type, app_id=self.resolve(name), default_sender=default_sender
+        )
@@ -0,0 +1,218 @@
+"""Streaming governance tallies rebuilt from Governance app calls, checkpointed to disk.
+
+The aggregator replays confirmed `create_proposal`, `vote` and `vote_many`
+calls in round order and keeps yes/no/abstain totals in memory. Vote
+weights are read from each call's ARC-4 return log, so no box is ever
+re-read. Every `checkpoint_every` rounds the totals are written to disk;
+on restart they are loaded and only later rounds are fetched, so a
+refresh costs time proportional to the new votes.
+"""
+import base64
+import dataclasses
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Protocol
+
+from algosdk.abi import Method
+from algosdk.v2client.indexer import IndexerClient
+
+# Must match the vote choices in smart_contracts/emoswapalgo/governance.py
+VOTE_NO = 0
+VOTE_YES = 1
+VOTE_ABSTAIN = 2
+
+CREATE_PROPOSAL = Method.from_signature("create_proposal(uint64)uint64")
+VOTE = Method.from_signature("vote(uint64,uint64)uint64")
+VOTE_MANY = Method.from_signature("vote_many((uint64,uint8)[])uint64[]")
+
+_RETURN_PREFIX = bytes.fromhex("151f7c75")
+_METHODS = {method.get_selector(): method for method in (CREATE_PROPOSAL, VOTE, VOTE_MANY)}
+
+
+class TransactionSource(Protocol):
+    """Confirmed app calls to `app_id` from `min_round` on, in round order (indexer JSON shape).
+
+    Calls made as inner transactions, e.g. by a router app, are included.
+    """
+
+    def transactions(self, app_id: int, min_round: int) -> Iterator[dict]: ...
+
+
+def app_calls(txn: dict, app_id: int) -> Iterator[dict]:
+    """`txn` and its inner transactions, depth first, that call `app_id`.
+
+    Inner transactions carry no round of their own in indexer results, so
+    each yielded call gets its root transaction's `confirmed-round`.
+    """
+    if txn.get("application-transaction", {}).get("application-id") == app_id:
+        yield txn
+    for inner in txn.get("inner-txns", []):
+        for call in app_calls(inner, app_id):
+            yield {**call, "confirmed-round": txn["confirmed-round"]}
+
+
+class FileSource:
+    """Replays transactions from a JSON-lines file, e.g. a saved indexer export"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def transactions(self, app_id: int, min_round: int) -> Iterator[dict]:
+        with self.path.open() as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                txn = json.loads(line)
+                if txn["confirmed-round"] >= min_round:
+                    yield from app_calls(txn, app_id)
+
+
+class IndexerSource:
+    """Pages through the indexer's transaction search for the app.
+
+    The search also returns root transactions whose inner transactions call
+    the app, so both are walked for calls to it.
+    """
+
+    def __init__(self, indexer: IndexerClient, page_size: int = 1000):
+        self.indexer = indexer
+        self.page_size = page_size
+
+    def transactions(self, app_id: int, min_round: int) -> Iterator[dict]:
+        next_page = None
+        while True:
+            page = self.indexer.search_transactions(
+                application_id=app_id,
+                min_round=min_round,
+                txn_type="appl",
+                limit=self.page_size,
+                next_page=next_page,
+            )
+            for txn in page.get("transactions", []):
+                yield from app_calls(txn, app_id)
+            next_page = page.get("next-token")
+            if not next_page or not page.get("transactions"):
+                return
+
+
+@dataclasses.dataclass
+class ProposalTally:
+    yes_votes: int = 0
+    no_votes: int = 0
+    abstain_votes: int = 0
+    voters: int = 0
+
+    def add(self, choice: int, weight: int) -> None:
+        if choice == VOTE_YES:
+            self.yes_votes += weight
+        elif choice == VOTE_NO:
+            self.no_votes += weight
+        else:
+            self.abstain_votes += weight
+        self.voters += 1
+
+
+class TallyAggregator:
+    """Running tallies of one Governance app; `processed_round` is the last fully applied round"""
+
+    def __init__(self, app_id: int, checkpoint_path: Path, checkpoint_every: int = 1_000):
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be positive")
+        self.app_id = app_id
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.tallies: dict[int, ProposalTally] = {}
+        self.processed_round = 0
+        self._checkpoint_round = 0
+
+    @classmethod
+    def resume(cls, app_id: int, checkpoint_path: Path, checkpoint_every: int = 1_000) -> "TallyAggregator":
+        """Start from the checkpoint at `checkpoint_path`, or from scratch if there is none"""
+        aggregator = cls(app_id, checkpoint_path, checkpoint_every)
+        if checkpoint_path.exists():
+            saved = json.loads(checkpoint_path.read_text())
+            if saved["app_id"] != app_id:
+                raise ValueError(f"checkpoint belongs to app {saved['app_id']}")
+            aggregator.processed_round = aggregator._checkpoint_round = saved["processed_round"]
+            aggregator.tallies = {
+                int(proposal_id): ProposalTally(**tally) for proposal_id, tally in saved["tallies"].items()
+            }
+        return aggregator
+
+    def checkpoint(self) -> None:
+        """Atomically write the tallies as of `processed_round`"""
+        state = {
+            "app_id": self.app_id,
+            "processed_round": self.processed_round,
+            "tallies": {
+                str(proposal_id): dataclasses.asdict(tally) for proposal_id, tally in self.tallies.items()
+            },
+        }
+        temporary = self.checkpoint_path.with_suffix(self.checkpoint_path.suffix + ".tmp")
+        temporary.write_text(json.dumps(state))
+        os.replace(temporary, self.checkpoint_path)
+        self._checkpoint_round = self.processed_round
+
+    def _apply(self, txn: dict) -> None:
+        call = txn.get("application-transaction", {})
+        args = [base64.b64decode(arg) for arg in call.get("application-args", [])]
+        method = _METHODS.get(args[0]) if args else None
+        if method is None:
+            return
+        logs = [base64.b64decode(log) for log in txn.get("logs", [])]
+        if not logs or not logs[-1].startswith(_RETURN_PREFIX):
+            return
+        returned = method.returns.type.decode(logs[-1][len(_RETURN_PREFIX) :])
+        decoded = [arg.type.decode(value) for arg, value in zip(method.args, args[1:])]
+
+        if method is CREATE_PROPOSAL:
+            self.tallies.setdefault(decoded[0], ProposalTally())
+        elif method is VOTE:
+            self.tallies.setdefault(decoded[0], ProposalTally()).add(decoded[1], returned)
+        else:
+            for (proposal_id, choice), weight in zip(decoded[0], returned):
+                self.tallies.setdefault(proposal_id, ProposalTally()).add(choice, weight)
+
+    def _finish_round(self, round: int) -> None:
+        self.processed_round = round
+        if round - self._checkpoint_round >= self.checkpoint_every:
+            self.checkpoint()
+
+    def consume(self, transactions: Iterable[dict], through_round: int | None = None) -> int:
+        """Apply transactions given in round order; returns how many were applied.
+
+        A round is applied only once it is known to be complete: when a
+        later round shows up, or when `through_round` covers it. The last
+        round of an open-ended stream is therefore left for the next
+        refresh, and rounds at or before `processed_round` are skipped, so
+        replaying an overlapping range never double counts.
+        """
+        applied = 0
+        pending: list[dict] = []
+        for txn in transactions:
+            round = txn["confirmed-round"]
+            if round <= self.processed_round:
+                continue
+            if through_round is not None and round > through_round:
+                break
+            if pending and round != pending[0]["confirmed-round"]:
+                applied += self._apply_round(pending)
+                pending = []
+            pending.append(txn)
+        if pending and through_round is not None:
+            applied += self._apply_round(pending)
+        if through_round is not None and through_round > self.processed_round:
+            self._finish_round(through_round)
+        return applied
+
+    def _apply_round(self, transactions: list[dict]) -> int:
+        for txn in transactions:
+            self._apply(txn)
+        self._finish_round(transactions[0]["confirmed-round"])
+        return len(transactions)
+
+    def refresh(self, source: TransactionSource, through_round: int | None = None) -> int:
+        """Pull and apply everything after `processed_round`"""
+        return self.consume(source.transactions(self.app_id, self.processed_round + 1), through_round)
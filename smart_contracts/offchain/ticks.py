@@ -0,0 +1,385 @@
+"""Off-chain simulator of ConcentratedPool's tick math, bit-for-bit with the contract.
+
+`ConcentratedPoolSim` replays mint / burn / swap with the same integer
+rounding and the same lagging `tick` as the app, so it can quote swaps
+against a snapshot (`from_chain`) and drive property tests without a node.
+Where the contract would panic, the simulator raises `PoolError` and
+leaves its state untouched.
+"""
+import copy
+import dataclasses
+
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.offchain.state import fetch_boxes, fetch_global_state
+
+# Must match smart_contracts/emoswapalgo/tick_math.py and concentrated_pool.py
+MAX_TICK = 138160
+TICK_OFFSET = MAX_TICK
+MAX_TICK_INDEX = 2 * MAX_TICK
+TICK_SPACING = 10
+SQRT_PRICE_SCALE = 2**32
+FEE_DENOMINATOR = 1000
+UINT64_MAX = (1 << 64) - 1
+SQRT_RATIO_FACTORS = (
+    0xFFFCB933BD6FAD37, 0xFFF97272373D4132, 0xFFF2E50F5F656932, 0xFFE5CACA7E10E4E6,
+    0xFFCB9843D60F6159, 0xFF973B41FA98C081, 0xFF2EA16466C96A38, 0xFE5DEE046A99A2A8,
+    0xFCBE86C7900A88AE, 0xF987A7253AC41317, 0xF3392B0822B70005, 0xE7159475A2C29B74,
+    0xD097F3BDFD2022B8, 0xA9F746462D870FDF, 0x70D869A156D2A1B8, 0x31BE135F97D08FD9,
+    0x09AA508B5B7A84E1, 0x005D6AF8DEDB8119,
+)
+TICK_BITMAP_KEY = b"bitmap"
+TICK_BITMAP_WORDS = MAX_TICK_INDEX // TICK_SPACING // 64 + 1
+TICK_PREFIX = b"t"
+POSITION_PREFIX = b"p"
+
+
+class PoolError(ValueError):
+    """The contract would reject this call"""
+
+
+def _check_uint64(value: int) -> int:
+    if not 0 <= value <= UINT64_MAX:
+        raise PoolError("uint64 overflow")
+    return value
+
+
+def tick_index(tick: int) -> int:
+    """ABI tick index of a signed tick"""
+    return tick + TICK_OFFSET
+
+
+def tick_to_sqrt_price(index: int) -> int:
+    """`tick_to_sqrt_price`: sqrt(1.0001 ** tick) as UQ32.32"""
+    if not 0 <= index <= MAX_TICK_INDEX:
+        raise PoolError("tick out of range")
+    abs_tick = abs(index - TICK_OFFSET)
+    ratio = 1 << 63
+    for bit, factor in enumerate(SQRT_RATIO_FACTORS):
+        if abs_tick >> bit & 1:
+            ratio = ratio * factor >> 64
+    if index > TICK_OFFSET:
+        return (1 << 95) // ratio
+    return ratio >> 31
+
+
+def sqrt_price_to_tick(sqrt_price: int) -> int:
+    """Highest tick index whose sqrt price is at or below `sqrt_price` (the exact tick)"""
+    low, high = 0, MAX_TICK_INDEX
+    if sqrt_price < tick_to_sqrt_price(low):
+        raise PoolError("price below MIN_TICK")
+    while low < high:
+        middle = (low + high + 1) // 2
+        if tick_to_sqrt_price(middle) <= sqrt_price:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _divide(numerator: int, denominator: int, round_up: bool) -> int:
+    return _check_uint64(-(-numerator // denominator) if round_up else numerator // denominator)
+
+
+def amount_a_delta(liquidity: int, sqrt_lower: int, sqrt_upper: int, round_up: bool) -> int:
+    return _divide(
+        liquidity * (sqrt_upper - sqrt_lower) * SQRT_PRICE_SCALE, sqrt_lower * sqrt_upper, round_up
+    )
+
+
+def amount_b_delta(liquidity: int, sqrt_lower: int, sqrt_upper: int, round_up: bool) -> int:
+    return _divide(liquidity * (sqrt_upper - sqrt_lower), SQRT_PRICE_SCALE, round_up)
+
+
+def compute_swap_step(
+    sqrt_price: int, sqrt_target: int, liquidity: int, amount_remaining: int, a_for_b: bool
+) -> tuple[int, int, int]:
+    """(new sqrt price, amount in, amount out) of one step, as `compute_swap_step`"""
+    if a_for_b:
+        amount_needed = amount_a_delta(liquidity, sqrt_target, sqrt_price, True)
+        if amount_remaining >= amount_needed:
+            new_sqrt_price, amount_in = sqrt_target, amount_needed
+        else:
+            scaled_liquidity = liquidity * SQRT_PRICE_SCALE
+            new_sqrt_price = _divide(
+                scaled_liquidity * sqrt_price, scaled_liquidity + amount_remaining * sqrt_price, True
+            )
+            amount_in = amount_remaining
+        return new_sqrt_price, amount_in, amount_b_delta(liquidity, new_sqrt_price, sqrt_price, False)
+
+    amount_needed = amount_b_delta(liquidity, sqrt_price, sqrt_target, True)
+    if amount_remaining >= amount_needed:
+        new_sqrt_price, amount_in = sqrt_target, amount_needed
+    else:
+        new_sqrt_price = _check_uint64(
+            sqrt_price + _divide(amount_remaining * SQRT_PRICE_SCALE, liquidity, False)
+        )
+        amount_in = amount_remaining
+    return new_sqrt_price, amount_in, amount_a_delta(liquidity, sqrt_price, new_sqrt_price, False)
+
+
+@dataclasses.dataclass
+class TickBitmap:
+    """ConcentratedPool's tick bitmap: bit `tick // TICK_SPACING` of the
+    64-bit words is set for every initialized tick, lowest bit first"""
+
+    words: list[int] = dataclasses.field(default_factory=lambda: [0] * TICK_BITMAP_WORDS)
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "TickBitmap":
+        """Decode the contract's bitmap box"""
+        if len(value) != TICK_BITMAP_WORDS * 8:
+            raise ValueError(f"expected {TICK_BITMAP_WORDS * 8} bytes, got {len(value)}")
+        return cls([int.from_bytes(value[i : i + 8], "big") for i in range(0, len(value), 8)])
+
+    def set(self, tick: int, initialized: bool) -> None:
+        """`_set_tick_bit`"""
+        word_index, bit = divmod(tick // TICK_SPACING, 64)
+        if initialized:
+            self.words[word_index] |= 1 << bit
+        else:
+            self.words[word_index] &= ~(1 << bit)
+
+    def next_above(self, tick: int) -> int | None:
+        """`_next_tick_above`: lowest initialized tick above `tick`"""
+        word_index, shift = divmod(tick // TICK_SPACING + 1, 64)
+        if word_index >= TICK_BITMAP_WORDS:
+            return None
+        word = self.words[word_index] >> shift << shift
+        while word == 0:
+            word_index += 1
+            if word_index == TICK_BITMAP_WORDS:
+                return None
+            word = self.words[word_index]
+        lowest_bit = (word & -word).bit_length() - 1
+        return (word_index * 64 + lowest_bit) * TICK_SPACING
+
+    def next_at_or_below(self, tick: int) -> int | None:
+        """`_next_tick_at_or_below`: highest initialized tick at or below `tick`"""
+        word_index, bit = divmod(tick // TICK_SPACING, 64)
+        word = self.words[word_index] & ((2 << bit) - 1)
+        while word == 0:
+            if word_index == 0:
+                return None
+            word_index -= 1
+            word = self.words[word_index]
+        return (word_index * 64 + word.bit_length() - 1) * TICK_SPACING
+
+
+@dataclasses.dataclass
+class TickInfo:
+    liquidity_lower: int = 0
+    liquidity_upper: int = 0
+
+
+@dataclasses.dataclass
+class ConcentratedPoolSim:
+    """In-memory ConcentratedPool; `bitmap` marks exactly the keys of `ticks`"""
+
+    sqrt_price: int
+    tick: int
+    fee_rate: int = 3
+    liquidity: int = 0
+    reserve_a: int = 0
+    reserve_b: int = 0
+    fees_a: int = 0
+    fees_b: int = 0
+    ticks: dict[int, TickInfo] = dataclasses.field(default_factory=dict)
+    bitmap: TickBitmap = dataclasses.field(default_factory=TickBitmap)
+    positions: dict[tuple[str, int, int], int] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def at_tick(cls, index: int, fee_rate: int = 3) -> "ConcentratedPoolSim":
+        """A freshly `initialize`d pool"""
+        return cls(sqrt_price=tick_to_sqrt_price(index), tick=index, fee_rate=fee_rate)
+
+    @classmethod
+    def from_chain(cls, algod: AlgodClient, app_id: int) -> "ConcentratedPoolSim":
+        """Snapshot of the app's globals, tick bitmap, tick boxes and position boxes"""
+        state = fetch_global_state(algod, app_id)
+        pool = cls(
+            sqrt_price=state.get("sqrt_price", 0),
+            tick=state.get("tick", 0),
+            fee_rate=state.get("fee_rate", 3),
+            liquidity=state.get("liquidity", 0),
+            reserve_a=state.get("reserve_a", 0),
+            reserve_b=state.get("reserve_b", 0),
+            fees_a=state.get("fees_a", 0),
+            fees_b=state.get("fees_b", 0),
+        )
+        for name, value in fetch_boxes(algod, app_id, TICK_PREFIX).items():
+            index = int.from_bytes(name[len(TICK_PREFIX) :], "big")
+            pool.ticks[index] = TickInfo(
+                int.from_bytes(value[:8], "big"), int.from_bytes(value[8:16], "big")
+            )
+        bitmap = fetch_boxes(algod, app_id, TICK_BITMAP_KEY).get(TICK_BITMAP_KEY)
+        if bitmap is not None:  # Created by `initialize`
+            pool.bitmap = TickBitmap.from_bytes(bitmap)
+        for name, value in fetch_boxes(algod, app_id, POSITION_PREFIX).items():
+            key = name[len(POSITION_PREFIX) :]
+            owner = encoding.encode_address(key[:32])
+            lower, upper = int.from_bytes(key[32:40], "big"), int.from_bytes(key[40:48], "big")
+            pool.positions[(owner, lower, upper)] = int.from_bytes(value, "big")
+        return pool
+
+    def copy(self) -> "ConcentratedPoolSim":
+        return copy.deepcopy(self)
+
+    def _add_tick_liquidity(self, tick: int, amount: int, lower: bool) -> None:
+        if tick not in self.ticks:
+            self.ticks[tick] = TickInfo()
+            self.bitmap.set(tick, True)
+        info = self.ticks[tick]
+        if lower:
+            info.liquidity_lower = _check_uint64(info.liquidity_lower + amount)
+        else:
+            info.liquidity_upper = _check_uint64(info.liquidity_upper + amount)
+
+    def _remove_tick_liquidity(self, tick: int, amount: int, lower: bool) -> None:
+        info = self.ticks[tick]
+        if lower:
+            info.liquidity_lower -= amount
+        else:
+            info.liquidity_upper -= amount
+        if info.liquidity_lower == 0 and info.liquidity_upper == 0:
+            del self.ticks[tick]
+            self.bitmap.set(tick, False)
+
+    def _sync_tick(self, boundary: int, sqrt_boundary: int) -> None:
+        if sqrt_boundary < self.sqrt_price and self.tick < boundary:
+            self.tick = boundary
+        elif sqrt_boundary > self.sqrt_price and self.tick >= boundary:
+            self.tick = boundary - 1
+
+    def position_amounts(
+        self, tick_lower: int, tick_upper: int, liquidity: int, round_up: bool = False
+    ) -> tuple[int, int, bool]:
+        """(amount A, amount B, in range) backing `liquidity` over a range right now"""
+        sqrt_lower, sqrt_upper = tick_to_sqrt_price(tick_lower), tick_to_sqrt_price(tick_upper)
+        if self.tick < tick_lower:
+            return amount_a_delta(liquidity, sqrt_lower, sqrt_upper, round_up), 0, False
+        if self.tick >= tick_upper:
+            return 0, amount_b_delta(liquidity, sqrt_lower, sqrt_upper, round_up), False
+        sqrt_price = min(max(self.sqrt_price, sqrt_lower), sqrt_upper)
+        return (
+            amount_a_delta(liquidity, sqrt_price, sqrt_upper, round_up),
+            amount_b_delta(liquidity, sqrt_lower, sqrt_price, round_up),
+            True,
+        )
+
+    def _transaction(self, apply) -> tuple:
+        """Run `apply` on a copy and keep it only if it succeeds"""
+        draft = self.copy()
+        result = apply(draft)
+        self.__dict__.update(draft.__dict__)
+        return result
+
+    def mint(self, owner: str, tick_lower: int, tick_upper: int, liquidity: int) -> tuple[int, int]:
+        """`mint`: returns the A and B the position takes"""
+        if self.sqrt_price == 0:
+            raise PoolError("pool not initialized")
+        if tick_lower % TICK_SPACING or tick_upper % TICK_SPACING:
+            raise PoolError("ticks must be multiples of TICK_SPACING")
+        if not 0 < tick_lower < tick_upper <= MAX_TICK_INDEX:
+            raise PoolError("bad tick range")
+        if not 0 < liquidity <= UINT64_MAX:
+            raise PoolError("bad liquidity")
+
+        def apply(pool: "ConcentratedPoolSim") -> tuple[int, int]:
+            pool._sync_tick(tick_lower, tick_to_sqrt_price(tick_lower))
+            pool._sync_tick(tick_upper, tick_to_sqrt_price(tick_upper))
+            pool._add_tick_liquidity(tick_lower, liquidity, True)
+            pool._add_tick_liquidity(tick_upper, liquidity, False)
+            key = (owner, tick_lower, tick_upper)
+            pool.positions[key] = _check_uint64(pool.positions.get(key, 0) + liquidity)
+            amount_a, amount_b, in_range = pool.position_amounts(tick_lower, tick_upper, liquidity, True)
+            if in_range:
+                pool.liquidity = _check_uint64(pool.liquidity + liquidity)
+            pool.reserve_a = _check_uint64(pool.reserve_a + amount_a)
+            pool.reserve_b = _check_uint64(pool.reserve_b + amount_b)
+            return amount_a, amount_b
+
+        return self._transaction(apply)
+
+    def burn(self, owner: str, tick_lower: int, tick_upper: int, liquidity: int) -> tuple[int, int]:
+        """`burn`: returns the A and B released"""
+        key = (owner, tick_lower, tick_upper)
+        if not 0 < liquidity <= self.positions.get(key, 0):
+            raise PoolError("bad liquidity")
+
+        def apply(pool: "ConcentratedPoolSim") -> tuple[int, int]:
+            pool.positions[key] -= liquidity
+            if not pool.positions[key]:
+                del pool.positions[key]
+            pool._remove_tick_liquidity(tick_lower, liquidity, True)
+            pool._remove_tick_liquidity(tick_upper, liquidity, False)
+            amount_a, amount_b, in_range = pool.position_amounts(tick_lower, tick_upper, liquidity)
+            if in_range:
+                pool.liquidity -= liquidity
+            pool.reserve_a = _check_uint64(pool.reserve_a - amount_a)
+            pool.reserve_b = _check_uint64(pool.reserve_b - amount_b)
+            return amount_a, amount_b
+
+        return self._transaction(apply)
+
+    def collect_fees(self) -> tuple[int, int]:
+        """`collect_fees`: returns the A and B fees taken"""
+        fees = (self.fees_a, self.fees_b)
+        self.fees_a = self.fees_b = 0
+        return fees
+
+    def swap(self, amount_in: int, a_for_b: bool) -> int:
+        """`swap_a_for_b` / `swap_b_for_a`: returns the amount out"""
+        if self.sqrt_price == 0:
+            raise PoolError("pool not initialized")
+        _check_uint64(amount_in)
+
+        def apply(pool: "ConcentratedPoolSim") -> int:
+            fee = amount_in * pool.fee_rate // FEE_DENOMINATOR
+            remaining = amount_in - fee
+            amount_out = 0
+            while remaining > 0:
+                if a_for_b:
+                    next_tick = pool.bitmap.next_at_or_below(pool.tick)
+                    target_tick = 0 if next_tick is None else next_tick
+                else:
+                    next_tick = pool.bitmap.next_above(pool.tick)
+                    target_tick = MAX_TICK_INDEX if next_tick is None else next_tick
+                sqrt_target = tick_to_sqrt_price(target_tick)
+                pool.sqrt_price, step_in, step_out = compute_swap_step(
+                    pool.sqrt_price, sqrt_target, pool.liquidity, remaining, a_for_b
+                )
+                remaining -= step_in
+                amount_out = _check_uint64(amount_out + step_out)
+                if pool.sqrt_price == sqrt_target:
+                    if next_tick is None:
+                        if remaining:
+                            raise PoolError("not enough liquidity")
+                        continue
+                    info = pool.ticks[next_tick]
+                    if a_for_b:
+                        pool.liquidity += info.liquidity_upper - info.liquidity_lower
+                        pool.tick = next_tick - 1
+                    else:
+                        pool.liquidity += info.liquidity_lower - info.liquidity_upper
+                        pool.tick = next_tick
+                    _check_uint64(pool.liquidity)
+            if a_for_b:
+                pool.fees_a = _check_uint64(pool.fees_a + fee)
+                pool.reserve_a = _check_uint64(pool.reserve_a + amount_in - fee)
+                pool.reserve_b = _check_uint64(pool.reserve_b - amount_out)
+            else:
+                pool.fees_b = _check_uint64(pool.fees_b + fee)
+                pool.reserve_b = _check_uint64(pool.reserve_b + amount_in - fee)
+                pool.reserve_a = _check_uint64(pool.reserve_a - amount_out)
+            return amount_out
+
+        return self._transaction(apply)
+
+    def quote(self, amount_in: int, a_for_b: bool) -> int | None:
+        """Amount out without changing the pool; None where the swap would fail"""
+        try:
+            return self.copy().swap(amount_in, a_for_b)
+        except PoolError:
+            return None
@@ -0,0 +1,35 @@
+"""Time-weighted average prices from two `SwapPool.get_price_cumulatives` reads."""
+import dataclasses
+
+# Must match PRICE_SCALE in smart_contracts/emoswapalgo/swap_pool.py
+PRICE_SCALE = 2**32
+# The accumulators are 128-bit (high, low) word pairs
+_WRAP = 2**128
+
+
+@dataclasses.dataclass(frozen=True)
+class PriceObservation:
+    price_a_cumulative: int
+    price_b_cumulative: int
+    timestamp: int
+
+    @classmethod
+    def from_abi_return(cls, value: tuple[int, int, int, int, int]) -> "PriceObservation":
+        """Join the (a_high, a_low, b_high, b_low, timestamp) getter return into 128-bit sums"""
+        a_high, a_low, b_high, b_low, timestamp = value
+        return cls((a_high << 64) | a_low, (b_high << 64) | b_low, timestamp)
+
+
+def twap(start: PriceObservation, end: PriceObservation) -> tuple[float, float]:
+    """Average (B per A, A per B) prices over [start.timestamp, end.timestamp].
+
+    Differences are taken modulo 2**128, which only matters if an accumulator
+    wrapped, about 2**64 seconds into the pool's life at the largest price.
+    Prices of 2**32 or more saturate on-chain, so the average is capped there.
+    """
+    elapsed = end.timestamp - start.timestamp
+    if elapsed <= 0:
+        raise ValueError("end observation must be later than start observation")
+    delta_a = (end.price_a_cumulative - start.price_a_cumulative) % _WRAP
+    delta_b = (end.price_b_cumulative - start.price_b_cumulative) % _WRAP
+    return delta_a / elapsed / PRICE_SCALE, delta_b / elapsed / PRICE_SCALE
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("algosdk")
+
+from algosdk import encoding
+
+from smart_contracts.offchain.airdrop import (
+    AIRDROP_CHUNK_LEAVES,
+    AIRDROP_CHUNK_MIN_BALANCE,
+    AirdropEntry,
+    chunk_index,
+    claim_payment,
+    read_entries_csv,
+)
+
+ALICE = encoding.encode_address(bytes(range(32)))
+BOB = encoding.encode_address(bytes(range(32, 64)))
+
+
+def write_csv(tmp_path: Path, text: str) -> Path:
+    path = tmp_path / "entries.csv"
+    path.write_text(text)
+    return path
+
+
+def test_header_and_blank_lines_are_skipped(tmp_path):
+    path = write_csv(tmp_path, f"address,amount\n{ALICE}, 5\n\n{BOB},7\n")
+    assert list(read_entries_csv(path)) == [AirdropEntry(ALICE, 5), AirdropEntry(BOB, 7)]
+
+
+def test_largest_uint64_amount_is_accepted(tmp_path):
+    path = write_csv(tmp_path, f"{ALICE},{2**64 - 1}\n")
+    assert list(read_entries_csv(path)) == [AirdropEntry(ALICE, 2**64 - 1)]
+
+
+@pytest.mark.parametrize(
+    ("text", "line"),
+    [
+        (f"{ALICE},5\n{BOB}\n", 2),
+        (f"address,amount\n{ALICE},5\n{BOB},ten\n", 3),
+        (f"{ALICE},5\n{BOB},-1\n", 2),
+        (f"{ALICE},5\n{BOB},{2**64}\n", 2),
+        (f"{ALICE},5\nnot-an-address,7\n", 2),
+        # A single changed character breaks the checksum
+        (f"{ALICE},5\n{ALICE},6\n{BOB[:10]}{'A' if BOB[10] != 'A' else 'B'}{BOB[11:]},7\n", 3),
+    ],
+)
+def test_malformed_rows_name_their_line(tmp_path, text, line):
+    path = write_csv(tmp_path, text)
+    with pytest.raises(ValueError, match=f":{line}:"):
+        list(read_entries_csv(path))
+
+
+def test_first_claim_of_a_chunk_pays_for_its_bitmap_box():
+    # b"m" + airdrop ID + chunk index key, 1 KB bitmap
+    assert AIRDROP_CHUNK_MIN_BALANCE == 2_500 + 400 * (17 + 1024) == 418_900
+    assert claim_payment(chunk_exists=False) == AIRDROP_CHUNK_MIN_BALANCE
+    assert claim_payment(chunk_exists=True) == 0
+    assert [chunk_index(i) for i in (0, AIRDROP_CHUNK_LEAVES - 1, AIRDROP_CHUNK_LEAVES)] == [0, 0, 1]
@@ -0,0 +1,67 @@
+import ast
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CONTRACT = ROOT / "smart_contracts" / "emoswapalgo" / "contract.py"
+APP_SPEC = ROOT / "smart_contracts" / "artifacts" / "emoswapalgo" / "Emoswapalgo.arc56.json"
+CLIENT = ROOT / "smart_contracts" / "artifacts" / "emoswapalgo" / "emoswapalgo_client.py"
+
+# ARC-4 names of the annotations Emoswapalgo's methods use
+_ABI_TYPES = {
+    "UInt64": "uint64",
+    "String": "string",
+    "bool": "bool",
+    "None": "void",
+    "Account": "account",
+    "gtxn.PaymentTransaction": "pay",
+    "gtxn.AssetTransferTransaction": "axfer",
+}
+
+
+def _abi_type(annotation: ast.expr) -> str:
+    if isinstance(annotation, ast.Subscript) and ast.unparse(annotation.value) == "tuple":
+        elements = annotation.slice.elts if isinstance(annotation.slice, ast.Tuple) else [annotation.slice]
+        return "(" + ",".join(_abi_type(element) for element in elements) + ")"
+    return _ABI_TYPES[ast.unparse(annotation)]
+
+
+def contract_interface() -> tuple[set[str], set[str], dict[str, int]]:
+    """ABI method signatures, the readonly ones among them, and global schema declared by contract.py"""
+    tree = ast.parse(CONTRACT.read_text())
+    contract = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "Emoswapalgo")
+    signatures, readonly = set(), set()
+    schema = {"ints": 0, "bytes": 0}
+    for node in contract.body:
+        if isinstance(node, ast.FunctionDef) and any("abimethod" in ast.unparse(d) for d in node.decorator_list):
+            args = ",".join(_abi_type(arg.annotation) for arg in node.args.args[1:])
+            signature = f"{node.name}({args}){_abi_type(node.returns)}"
+            signatures.add(signature)
+            if any("readonly=True" in ast.unparse(d) for d in node.decorator_list):
+                readonly.add(signature)
+        elif isinstance(node, ast.Assign) and ast.unparse(node.value).startswith("GlobalState("):
+            schema["bytes" if "TealType.bytes" in ast.unparse(node.value) else "ints"] += 1
+    return signatures, readonly, schema
+
+
+def test_app_spec_matches_contract():
+    spec = json.loads(APP_SPEC.read_text())
+    spec_signatures = {
+        f"{method['name']}({','.join(arg['type'] for arg in method['args'])}){method['returns']['type']}":
+        method.get("readonly", False)
+        for method in spec["methods"]
+    }
+    signatures, readonly, schema = contract_interface()
+    assert set(spec_signatures) == signatures
+    assert {signature for signature, flag in spec_signatures.items() if flag} == readonly
+    assert spec["state"]["schema"]["global"] == schema
+
+
+def test_typed_client_matches_app_spec():
+    client = ast.parse(CLIENT.read_text())
+    embedded = next(
+        node.value.value
+        for node in client.body
+        if isinstance(node, ast.Assign) and ast.unparse(node.targets[0]) == "_APP_SPEC_JSON"
+    )
+    assert json.loads(embedded) == json.loads(APP_SPEC.read_text())
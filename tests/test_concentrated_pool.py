@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+pytest.importorskip("algopy_testing")
+pytest.importorskip("algosdk")
+
+from algopy import UInt64
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.emoswapalgo.concentrated_pool import ConcentratedPool
+from smart_contracts.offchain.ticks import TICK_OFFSET, TICK_SPACING, ConcentratedPoolSim, PoolError
+
+LIQUIDITY = 10**12
+
+
+@pytest.fixture()
+def context():
+    with algopy_testing_context() as context:
+        yield context
+
+
+@pytest.fixture()
+def pools(context: AlgopyTestContext):
+    contract = ConcentratedPool()
+    contract.initialize(UInt64(TICK_OFFSET))
+    return contract, ConcentratedPoolSim.at_tick(TICK_OFFSET)
+
+
+def assert_same_state(contract: ConcentratedPool, pool: ConcentratedPoolSim) -> None:
+    assert contract.get_pool_state() == (pool.sqrt_price, pool.tick, pool.liquidity)
+    assert contract.get_reserves() == (pool.reserve_a, pool.reserve_b)
+    assert contract.get_fees() == (pool.fees_a, pool.fees_b)
+    for tick, info in pool.ticks.items():
+        stored = contract.get_tick(UInt64(tick))
+        assert (stored.liquidity_lower.native, stored.liquidity_upper.native) == (
+            info.liquidity_lower,
+            info.liquidity_upper,
+        )
+
+
+def test_contract_matches_simulator(context, pools):
+    contract, pool = pools
+    owner = str(context.default_sender)
+    rng = random.Random(25)
+    for lower in range(TICK_OFFSET - 2000, TICK_OFFSET + 2000, 500):
+        amounts = contract.mint(UInt64(lower), UInt64(lower + 1000), UInt64(LIQUIDITY))
+        assert amounts == pool.mint(owner, lower, lower + 1000, LIQUIDITY)
+    assert_same_state(contract, pool)
+
+    for _ in range(40):
+        amount_in = rng.randrange(1, 10**10)
+        a_for_b = rng.random() < 0.5
+        try:
+            expected = pool.swap(amount_in, a_for_b)
+        except PoolError:
+            continue
+        swap = contract.swap_a_for_b if a_for_b else contract.swap_b_for_a
+        assert swap(UInt64(amount_in)) == expected
+        assert_same_state(contract, pool)
+
+    lower = TICK_OFFSET - 2000 + rng.randrange(8) * 500
+    amounts = contract.burn(UInt64(lower), UInt64(lower + 1000), UInt64(LIQUIDITY // 2))
+    assert amounts == pool.burn(owner, lower, lower + 1000, LIQUIDITY // 2)
+    assert_same_state(contract, pool)
+
+
+def test_collect_fees_hands_over_and_resets_fees(context, pools):
+    contract, pool = pools
+    owner = str(context.default_sender)
+    pool.mint(owner, TICK_OFFSET - 10 * TICK_SPACING, TICK_OFFSET + 10 * TICK_SPACING, LIQUIDITY)
+    contract.mint(
+        UInt64(TICK_OFFSET - 10 * TICK_SPACING), UInt64(TICK_OFFSET + 10 * TICK_SPACING), UInt64(LIQUIDITY)
+    )
+    for amount_in, a_for_b in ((10**6, True), (2 * 10**6, False)):
+        pool.swap(amount_in, a_for_b)
+        (contract.swap_a_for_b if a_for_b else contract.swap_b_for_a)(UInt64(amount_in))
+
+    assert pool.fees_a == 3_000 and pool.fees_b == 6_000
+    assert contract.collect_fees() == pool.collect_fees() == (3_000, 6_000)
+    assert_same_state(contract, pool)
+    assert contract.get_fees() == (0, 0)
+
+    with context.txn.create_group(active_txn_overrides={"sender": context.any.account()}):
+        with pytest.raises(AssertionError):
+            contract.collect_fees()
@@ -0,0 +1,104 @@
+import pytest
+
+pytest.importorskip("algokit_utils")
+
+from algosdk import encoding
+from algosdk.logic import get_application_address
+
+from smart_contracts.offchain.governance import (
+    BALLOTS_PER_CALL,
+    CALLS_PER_GROUP,
+    MAX_GROUP_SIZE,
+    MAX_REFERENCES_PER_TXN,
+    VOTE_MANY,
+    VOTE_RECORD_MIN_BALANCE,
+    VOTE_YES,
+    Ballot,
+    GovernanceComposer,
+)
+
+APP_ID = 1001
+STAKING_REWARDS_ID = 1002
+VOTER = encoding.encode_address(bytes(range(32)))
+
+
+class FakeComposer:
+    def __init__(self):
+        self.txns = []
+
+    def add_payment(self, params):
+        self.txns.append(("pay", params))
+        return self
+
+    def add_app_call_method_call(self, params):
+        self.txns.append(("call", params))
+        return self
+
+
+class FakeAlgorand:
+    def new_group(self):
+        return FakeComposer()
+
+
+def composer() -> GovernanceComposer:
+    return GovernanceComposer(FakeAlgorand(), APP_ID, STAKING_REWARDS_ID, VOTER)
+
+
+def test_seven_ballots_make_three_paid_calls():
+    assert BALLOTS_PER_CALL == 3
+    ballots = [Ballot(proposal_id, VOTE_YES) for proposal_id in range(1, 8)]
+    (group,) = composer().vote_many(ballots).build()
+
+    assert [kind for kind, _ in group.txns] == ["pay", "call"] * 3
+    calls = [params for kind, params in group.txns if kind == "call"]
+    assert [len(call.args[0]) for call in calls] == [3, 3, 1]
+    assert [ballot for call in calls for ballot in call.args[0]] == [
+        (ballot.proposal_id, ballot.choice) for ballot in ballots
+    ]
+    assert all(call.method is VOTE_MANY and call.app_id == APP_ID for call in calls)
+
+
+def test_each_call_references_its_proposal_and_vote_boxes():
+    (group,) = composer().vote(5, VOTE_YES).vote(9, VOTE_YES).build()
+    (_, call), voter_key = group.txns[1], encoding.decode_address(VOTER)
+
+    assert call.app_references == [STAKING_REWARDS_ID]
+    assert [(box.app_id, box.name) for box in call.box_references] == [
+        (STAKING_REWARDS_ID, b"k" + voter_key),
+        (0, b"p" + (5).to_bytes(8, "big")),
+        (0, b"v" + (5).to_bytes(8, "big") + voter_key),
+        (0, b"p" + (9).to_bytes(8, "big")),
+        (0, b"v" + (9).to_bytes(8, "big") + voter_key),
+    ]
+    assert len(call.box_references) + len(call.app_references) <= MAX_REFERENCES_PER_TXN
+
+
+def test_each_call_is_preceded_by_its_vote_box_payment():
+    # "v" + proposal ID + voter key, 9-byte VoteRecord
+    assert VOTE_RECORD_MIN_BALANCE == 2_500 + 400 * (41 + 9) == 22_500
+    ballots = [Ballot(proposal_id, VOTE_YES) for proposal_id in range(1, 8)]
+    (group,) = composer().vote_many(ballots).build()
+
+    payments = [params for kind, params in group.txns if kind == "pay"]
+    assert [payment.amount.micro_algo for payment in payments] == [
+        3 * VOTE_RECORD_MIN_BALANCE,
+        3 * VOTE_RECORD_MIN_BALANCE,
+        VOTE_RECORD_MIN_BALANCE,
+    ]
+    assert all(payment.sender == VOTER for payment in payments)
+    assert all(payment.receiver == get_application_address(APP_ID) for payment in payments)
+    # Payments in separate groups must not share a transaction ID
+    assert len({payment.note for payment in payments}) == len(payments)
+
+
+def test_groups_hold_whole_payment_and_call_pairs():
+    ballots = [Ballot(proposal_id, VOTE_YES) for proposal_id in range(BALLOTS_PER_CALL * CALLS_PER_GROUP + 1)]
+    groups = composer().vote_many(ballots).build()
+
+    assert [len(group.txns) for group in groups] == [2 * CALLS_PER_GROUP, 2]
+    assert all(len(group.txns) <= MAX_GROUP_SIZE for group in groups)
+
+
+def test_invalid_choice_is_rejected():
+    with pytest.raises(ValueError):
+        composer().vote(1, 3)
@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+pytest.importorskip("algokit_utils")
+
+from smart_contracts.offchain.keeper import (
+    COMPOUND_MANY,
+    MAX_GROUP_SIZE,
+    MAX_REFERENCES_PER_TXN,
+    STAKERS_PER_GROUP,
+    run_keeper,
+    shard,
+)
+
+APP_ID = 1234
+
+
+class FakeComposer:
+    def __init__(self, algorand: "FakeAlgorand"):
+        self.algorand = algorand
+        self.calls = []
+
+    def add_app_call_method_call(self, params):
+        self.calls.append(params)
+        return self
+
+    def send(self, params=None):
+        stakers = [staker for call in self.calls for staker in call.args[0]]
+        with self.algorand.lock:
+            self.algorand.groups.append(self.calls)
+        if any(staker in self.algorand.failing for staker in stakers):
+            raise RuntimeError("logic eval error")
+
+
+class FakeAlgorand:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.groups = []
+        self.lock = threading.Lock()
+
+    def new_group(self):
+        return FakeComposer(self)
+
+
+def addresses(count: int) -> list[str]:
+    return [f"STAKER{i:06d}" for i in range(count)]
+
+
+def test_groups_fit_the_reference_limits():
+    # Two references per staker plus the shared reward token
+    assert 2 * STAKERS_PER_GROUP + 1 <= MAX_GROUP_SIZE * MAX_REFERENCES_PER_TXN
+
+    stakers = addresses(2 * STAKERS_PER_GROUP + 5)
+    groups = shard(stakers)
+    assert [sum(map(len, group)) for group in groups] == [STAKERS_PER_GROUP, STAKERS_PER_GROUP, 5]
+    assert all(len(group) <= MAX_GROUP_SIZE for group in groups)
+    # The last group gets one call per staker; full groups spread evenly over MAX_GROUP_SIZE calls
+    assert len(groups[2]) == 5
+    sizes = [len(call) for call in groups[0]]
+    assert max(sizes) - min(sizes) <= 1
+    assert sorted(s for group in groups for call in group for s in call) == sorted(stakers)
+
+
+def test_shard_rejects_empty_groups():
+    with pytest.raises(ValueError):
+        shard(addresses(3), stakers_per_group=0)
+
+
+def test_every_staker_is_sent_once():
+    algorand = FakeAlgorand()
+    stakers = addresses(3 * STAKERS_PER_GROUP)
+    report = run_keeper(algorand, APP_ID, "KEEPER", stakers, COMPOUND_MANY)
+
+    assert (report.stakers, report.groups, report.failures) == (len(stakers), 3, ())
+    calls = [call for group in algorand.groups for call in group]
+    assert all(call.method is COMPOUND_MANY and call.app_id == APP_ID for call in calls)
+    assert sorted(s for call in calls for s in call.args[0]) == sorted(stakers)
+
+
+def test_failed_group_is_reported_and_the_others_still_go_through():
+    stakers = addresses(3 * STAKERS_PER_GROUP)
+    bad = stakers[STAKERS_PER_GROUP + 7]
+    report = run_keeper(FakeAlgorand(failing={bad}), APP_ID, "KEEPER", stakers)
+
+    assert report.stakers == 2 * STAKERS_PER_GROUP
+    assert report.failed_groups == 1
+    (failure,) = report.failures
+    assert failure.index == 1
+    assert sorted(failure.stakers) == stakers[STAKERS_PER_GROUP : 2 * STAKERS_PER_GROUP]
+    assert failure.error == "RuntimeError: logic eval error"
@@ -0,0 +1,199 @@
+import random
+from decimal import Decimal, localcontext
+
+import numpy as np
+import pytest
+
+from smart_contracts.offchain.quote import (
+    FEE_DENOMINATOR,
+    UINT64_MAX,
+    PoolReserves,
+    ZapPreview,
+    preview_zap_in,
+    quote_a_for_b,
+    quote_b_for_a,
+    quote_both,
+    zap_swap_amount,
+)
+
+
+def reference_amount_out(amount_in: int, reserve_in: int, reserve_out: int, fee_rate: int) -> int | None:
+    """SwapPool.swap_a_for_b / swap_b_for_a in plain integers; None where the AVM panics"""
+    if reserve_in == 0 or reserve_out == 0:
+        return 0
+    # The new input reserve is written back with +, which panics on overflow
+    if reserve_in + amount_in > UINT64_MAX:
+        return None
+    # get_amount_out: mul_div keeps the 128-bit product, so only the floors matter
+    amount_in_after_fee = amount_in - amount_in * fee_rate // 1000
+    return reserve_out * amount_in_after_fee // (reserve_in + amount_in_after_fee)
+
+
+def assert_matches_reference(pool: PoolReserves, amounts: list[int]) -> None:
+    for quote, reserve_in, reserve_out in (
+        (quote_a_for_b(pool, amounts), pool.reserve_a, pool.reserve_b),
+        (quote_b_for_a(pool, amounts), pool.reserve_b, pool.reserve_a),
+    ):
+        for amount, amount_out, ok in zip(amounts, quote.amount_out.tolist(), quote.ok.tolist()):
+            expected = reference_amount_out(amount, reserve_in, reserve_out, pool.fee_rate)
+            assert ok == (expected is not None), (pool, amount)
+            assert amount_out == (expected or 0), (pool, amount)
+
+
+def random_uint64(rng: random.Random) -> int:
+    # Spread over every magnitude so both the narrow and the 128-bit paths run
+    return rng.getrandbits(rng.randrange(1, 65))
+
+
+def test_random_pools_match_scalar_reference():
+    rng = random.Random(1234)
+    for _ in range(300):
+        pool = PoolReserves(random_uint64(rng), random_uint64(rng), rng.randrange(0, 1000))
+        assert_matches_reference(pool, [random_uint64(rng) for _ in range(200)])
+
+
+def test_zero_output_for_dust_and_empty_pools():
+    pool = PoolReserves(10**18, 10, 3)
+    # Outputs below one unit floor to zero instead of rounding up
+    assert quote_a_for_b(pool, [1, 10**6, 10**16]).amount_out.tolist() == [0, 0, 0]
+    # Fee rounds down, so an input of 1 keeps its whole unit but still buys nothing
+    assert quote_a_for_b(PoolReserves(1000, 1000, 3), [1]).amount_out.tolist() == [0]
+
+    for empty in (PoolReserves(0, 10**9), PoolReserves(10**9, 0)):
+        a_for_b, b_for_a = quote_both(empty, [0, 1, 10**12])
+        assert a_for_b.amount_out.tolist() == [0, 0, 0] and a_for_b.ok.all()
+        assert b_for_a.amount_out.tolist() == [0, 0, 0] and b_for_a.ok.all()
+
+
+def test_rounding_edges():
+    # Amounts where the fee or the quotient lands exactly on an integer boundary
+    pool = PoolReserves(999, 1_000_001, 3)
+    amounts = [332, 333, 334, 999, 1000, 1001, 2**32 - 1, 2**32, 2**32 + 1]
+    assert_matches_reference(pool, amounts)
+    # Large reserves force the 128-bit mul_div path, where float estimates are off by ones
+    assert_matches_reference(
+        PoolReserves(2**63 + 12345, 2**64 - 1, 997), [2**62 - 1, 2**62, 3, 2**40 + 7]
+    )
+
+
+def test_overflow_lanes_are_flagged():
+    pool = PoolReserves(UINT64_MAX - 10, 10**9, 3)
+    quote = quote_a_for_b(pool, [10, 11, 12])
+    assert quote.ok.tolist() == [True, False, False]
+    assert quote.amount_out.tolist()[1:] == [0, 0]
+
+
+def test_shape_is_preserved():
+    pool = PoolReserves(10**12, 3 * 10**12, 3)
+    amounts = np.arange(12, dtype=np.uint64).reshape(3, 4) * np.uint64(10**6)
+    quote = quote_a_for_b(pool, amounts)
+    assert quote.amount_out.shape == (3, 4)
+    assert_matches_reference(pool, amounts.reshape(-1).tolist())
+
+
+def test_rejects_non_uint64_amounts():
+    pool = PoolReserves(10**9, 10**9)
+    with pytest.raises(ValueError):
+        quote_a_for_b(pool, [-1])
+    with pytest.raises(ValueError):
+        quote_a_for_b(pool, [2**64])
+    with pytest.raises(TypeError):
+        quote_a_for_b(pool, [1.5])
+
+
+def reference_zap_swap_amount(amount_in: int, reserve_in: int, fee_rate: int) -> int:
+    """floor of amm_math.zap_swap_amount's closed form, evaluated with exact decimals"""
+    kept = FEE_DENOMINATOR - fee_rate
+    linear = reserve_in * (FEE_DENOMINATOR + kept)
+    with localcontext() as context:
+        context.prec = 100
+        root = (Decimal(linear * linear + 4 * kept * FEE_DENOMINATOR * reserve_in * amount_in)).sqrt()
+        return int((root - linear) / (2 * kept))
+
+
+def reference_zap_in(
+    pool: PoolReserves, total_supply: int, amount: int, a_in: bool
+) -> ZapPreview | None:
+    """SwapPool.zap_in step by step in plain integers; None where the AVM panics"""
+    if total_supply == 0:
+        return None
+    reserve_in, reserve_out = (pool.reserve_a, pool.reserve_b) if a_in else (pool.reserve_b, pool.reserve_a)
+    swap_amount = reference_zap_swap_amount(amount, reserve_in, pool.fee_rate)
+    out = reference_amount_out(swap_amount, reserve_in, reserve_out, pool.fee_rate)
+    if out is None:
+        return None
+    reserve_in += swap_amount
+    reserve_out -= out
+    if reserve_out == 0:
+        return None  # mul_div divides by zero
+    deposit_in = amount - swap_amount
+    minted_in = deposit_in * total_supply // reserve_in
+    minted_out = out * total_supply // reserve_out
+    if minted_in > UINT64_MAX or minted_out > UINT64_MAX:
+        return None  # mul_div result does not fit
+    minted = min(minted_in, minted_out)
+    if minted == 0:
+        return None  # Deposit too small
+    reserve_in += deposit_in
+    reserve_out += out
+    if reserve_in > UINT64_MAX or total_supply + minted > UINT64_MAX:
+        return None
+    reserve_a, reserve_b = (reserve_in, reserve_out) if a_in else (reserve_out, reserve_in)
+    return ZapPreview(swap_amount, out, minted, reserve_a, reserve_b)
+
+
+def test_zap_swap_amount_matches_closed_form():
+    rng = random.Random(7)
+    for _ in range(2_000):
+        reserve_in = int(10 ** rng.uniform(0, 19))
+        amount = int(10 ** rng.uniform(0, 19))
+        fee_rate = rng.choice([0, 1, 3, 30, 999])
+        if reserve_in > UINT64_MAX or amount > UINT64_MAX:
+            continue
+        assert zap_swap_amount(amount, reserve_in, fee_rate) == reference_zap_swap_amount(
+            amount, reserve_in, fee_rate
+        )
+
+
+def test_zap_swap_leaves_only_dust():
+    pool = PoolReserves(10**12, 3 * 10**12)
+    preview = preview_zap_in(pool, 10**12, 10**9)
+    deposit_a = 10**9 - preview.swap_amount
+    # What is left matches the post-swap ratio to within a unit or two of each token
+    post_swap_a = pool.reserve_a + preview.swap_amount
+    post_swap_b = pool.reserve_b - preview.amount_out
+    assert abs(deposit_a * post_swap_b - preview.amount_out * post_swap_a) <= 2 * (post_swap_a + post_swap_b)
+
+
+def test_preview_zap_in_matches_contract_reference():
+    rng = random.Random(11)
+    for _ in range(2_000):
+        pool = PoolReserves(
+            int(10 ** rng.uniform(0, 19)), int(10 ** rng.uniform(0, 19)), rng.choice([0, 3, 30])
+        )
+        total_supply = int(10 ** rng.uniform(0, 19.2))
+        amount = int(10 ** rng.uniform(0, 19))
+        a_in = rng.random() < 0.5
+        if max(pool.reserve_a, pool.reserve_b, total_supply, amount) > UINT64_MAX:
+            continue
+        assert preview_zap_in(pool, total_supply, amount, a_in) == reference_zap_in(
+            pool, total_supply, amount, a_in
+        )
+
+
+def test_preview_zap_in_rejects_either_share_candidate_overflowing():
+    # The B side mints within uint64 but the A side's mul_div would not fit
+    pool = PoolReserves(5, 6)
+    total_supply, amount = 660914600123389440, 117590
+    swap_amount = zap_swap_amount(amount, pool.reserve_a, pool.fee_rate)
+    out = reference_amount_out(swap_amount, pool.reserve_a, pool.reserve_b, pool.fee_rate)
+    minted_in = (amount - swap_amount) * total_supply // (pool.reserve_a + swap_amount)
+    minted_out = out * total_supply // (pool.reserve_b - out)
+    assert minted_out <= UINT64_MAX < minted_in
+    assert preview_zap_in(pool, total_supply, amount) is None
+
+
+def test_preview_zap_in_rejects_total_supply_overflow():
+    pool = PoolReserves(10**6, 10**6)
+    assert preview_zap_in(pool, UINT64_MAX - 1, 10**6) is None
+    assert preview_zap_in(pool, 10**6, 10**6) is not None
@@ -0,0 +1,110 @@
+import dataclasses
+import random
+import struct
+
+import pytest
+
+pytest.importorskip("algosdk")
+
+from smart_contracts.offchain.rewards import (
+    REWARD_PRECISION,
+    SECONDS_PER_YEAR,
+    StakingSnapshot,
+    project,
+)
+
+UINT64_MAX = 2**64 - 1
+NOW = 1_750_000_000
+LAST_UPDATE = NOW - 86_400
+
+
+def snapshot(records: list[tuple[int, int, int, int, int]], **state) -> StakingSnapshot:
+    """Snapshot decoded from packed 40-byte box values, as read from chain"""
+    state = {"reward_rate": 10, "last_update_time": LAST_UPDATE, **state}
+    packed = b"".join(struct.pack(">QQQQQ", *record) for record in records)
+    return StakingSnapshot.from_records(state, [""] * len(records), packed)
+
+
+def reference_reward_per_token(stored: int, rate: int, last_update: int, now: int) -> int:
+    """StakingRewards._reward_per_token in plain integers"""
+    if last_update > 0 and now > last_update:
+        stored += rate * (now - last_update) * REWARD_PRECISION // (100 * SECONDS_PER_YEAR)
+    return stored
+
+
+def reference_earned(record: tuple[int, int, int, int, int], reward_per_token: int) -> int:
+    """StakingRewards._earned in plain integers"""
+    staked, reward_debt, accrued, _last_claim, compounded = record
+    return accrued + (staked + compounded) * reward_per_token // REWARD_PRECISION - reward_debt
+
+
+def random_records(rng: random.Random, count: int, reward_per_token: int) -> list[tuple[int, ...]]:
+    records = []
+    for _ in range(count):
+        staked = int(10 ** rng.uniform(0, 15))
+        compounded = rng.choice([0, int(10 ** rng.uniform(0, 12))])
+        entry = rng.randrange(reward_per_token + 1)
+        debt = (staked + compounded) * entry // REWARD_PRECISION
+        records.append((staked, debt, rng.randrange(10**9), LAST_UPDATE, compounded))
+    return records
+
+
+def test_random_lanes_match_integer_reference():
+    rng = random.Random(0)
+    stored = 3 * REWARD_PRECISION // 10 + 123_456_789
+    records = random_records(rng, 2_000, stored)
+    rates = (10, 0, 37)
+    result = project(snapshot(records, reward_per_token_stored=stored), NOW, 86_400, rates)
+
+    now_rpt = reference_reward_per_token(stored, 10, LAST_UPDATE, NOW)
+    assert result.pending.tolist() == [reference_earned(record, now_rpt) for record in records]
+    for k, rate in enumerate(rates):
+        later = now_rpt + rate * 86_400 * REWARD_PRECISION // (100 * SECONDS_PER_YEAR)
+        assert result.projected[k].tolist() == [reference_earned(r, later) for r in records]
+        assert result.annual_yield[k].tolist() == [
+            (r[0] + r[4]) * (rate * REWARD_PRECISION // 100) // REWARD_PRECISION for r in records
+        ]
+
+
+def test_zero_total_staked():
+    empty = snapshot([], total_staked=0)
+    result = project(empty, NOW)
+    assert result.pending.shape == (0,) and result.projected.shape == (1, 0)
+
+    # Stakers who fully unstaked keep only their settled rewards
+    idle = snapshot([(0, 0, 500, 0, 0), (0, 0, 0, 0, 0)], total_staked=0)
+    assert project(idle, NOW).pending.tolist() == [500, 0]
+
+
+@pytest.mark.parametrize("reward_per_token", [REWARD_PRECISION, REWARD_PRECISION - 1, 1, 2**40 - 1])
+def test_stakes_near_uint64_max(reward_per_token):
+    records = [
+        (staked, 0, 0, 0, 0)
+        for staked in (UINT64_MAX, UINT64_MAX - 1, UINT64_MAX - REWARD_PRECISION, 2**63 + 2**20 - 1)
+    ]
+    records = [r for r in records if reference_earned(r, reward_per_token) <= UINT64_MAX]
+    result = project(snapshot(records, reward_per_token_stored=reward_per_token, last_update_time=0), NOW)
+    assert result.pending.tolist() == [reference_earned(r, reward_per_token) for r in records]
+
+
+def test_rate_change_mid_window():
+    # set_reward_rate settles the accumulator at the old rate before switching
+    rng = random.Random(1)
+    stored = REWARD_PRECISION // 7
+    records = random_records(rng, 200, stored)
+    before = snapshot(records, reward_per_token_stored=stored, reward_rate=10)
+    switch = LAST_UPDATE + 3_600
+    after = dataclasses.replace(
+        before,
+        reward_rate=25,
+        reward_per_token_stored=before.reward_per_token_at(switch),
+        last_update_time=switch,
+    )
+
+    expected_rpt = reference_reward_per_token(
+        reference_reward_per_token(stored, 10, LAST_UPDATE, switch), 25, switch, NOW
+    )
+    assert after.reward_per_token_at(NOW) == expected_rpt
+    assert project(after, NOW).pending.tolist() == [reference_earned(r, expected_rpt) for r in records]
+    # Projecting the old snapshot at the new rate would overpay the first hour
+    assert before.reward_per_token_at(NOW, reward_rate=25) > expected_rpt
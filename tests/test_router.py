@@ -0,0 +1,95 @@
+import pytest
+
+pytest.importorskip("algokit_utils")
+
+from smart_contracts.offchain.quote import amount_out
+from smart_contracts.offchain.router import (
+    SWAP_A_FOR_B,
+    SWAP_B_FOR_A,
+    Pool,
+    PoolGraph,
+    build_route_group,
+    min_amount_out,
+)
+
+ALGO, HAPPY, SAD, CALM, ORPHAN = 0, 11, 12, 13, 99
+
+
+def graph() -> PoolGraph:
+    return PoolGraph(
+        [
+            # Shallow direct pair at a poor price
+            Pool(1, HAPPY, SAD, reserve_a=10**6, reserve_b=5 * 10**5),
+            # Deep pools through ALGO quote close to 1:1
+            Pool(2, HAPPY, ALGO, reserve_a=10**12, reserve_b=10**12),
+            Pool(3, ALGO, SAD, reserve_a=10**12, reserve_b=10**12),
+            # CALM is only reachable through SAD
+            Pool(4, CALM, SAD, reserve_a=10**12, reserve_b=10**12),
+            Pool(5, ORPHAN, 98, reserve_a=10**9, reserve_b=10**9),
+        ]
+    )
+
+
+def test_two_hop_route_beats_the_direct_pair():
+    route = graph().best_route(HAPPY, SAD, 10**5)
+    assert route.assets == [HAPPY, ALGO, SAD]
+    assert [(hop.app_id, hop.a_for_b) for hop in route.hops] == [(2, True), (3, True)]
+
+    direct = amount_out(10**5, 10**6, 5 * 10**5, 3)
+    assert route.amount_out > direct
+    # Each hop's output is exactly the contract's integer result and feeds the next hop
+    first = amount_out(10**5, 10**12, 10**12, 3)
+    assert route.hops[0].amount_out == route.hops[1].amount_in == first
+    assert route.amount_out == amount_out(first, 10**12, 10**12, 3)
+
+
+def test_hop_limit_is_respected():
+    pools = graph()
+    assert [hop.app_id for hop in pools.best_route(HAPPY, SAD, 10**5, max_hops=1).hops] == [1]
+    # CALM sits three hops away through the deep pools
+    assert len(pools.best_route(HAPPY, CALM, 10**5).hops) == 3
+    assert pools.best_route(HAPPY, CALM, 10**5, max_hops=2).assets == [HAPPY, SAD, CALM]
+    pools.remove_pool(1)
+    assert pools.best_route(HAPPY, CALM, 10**5, max_hops=2) is None
+
+
+def test_unreachable_and_degenerate_requests():
+    pools = graph()
+    assert pools.best_route(HAPPY, ORPHAN, 10**5) is None
+    assert pools.best_route(HAPPY, 12345, 10**5) is None
+    assert pools.best_route(HAPPY, HAPPY, 10**5) is None
+    assert pools.best_route(HAPPY, SAD, 0) is None
+
+
+def test_min_amount_out_rounds_down_within_tolerance():
+    assert min_amount_out(10_000, 50) == 9_950
+    assert min_amount_out(999, 1) == 998
+    assert min_amount_out(12_345, 0) == 12_345
+    route = graph().best_route(HAPPY, SAD, 10**5)
+    assert route.min_amount_out(100) == route.amount_out * 9_900 // 10_000
+    with pytest.raises(ValueError):
+        min_amount_out(100, 10_001)
+
+
+class RecordingComposer:
+    def __init__(self):
+        self.calls = []
+
+    def add_app_call_method_call(self, params):
+        self.calls.append(params)
+        return self
+
+
+class RecordingAlgorand:
+    def new_group(self) -> RecordingComposer:
+        return RecordingComposer()
+
+
+def test_route_group_passes_each_hop_minimum():
+    route = graph().best_route(HAPPY, SAD, 10**5)
+    composer = build_route_group(RecordingAlgorand(), route, "SENDER", slippage_bps=30)
+    assert [call.method for call in composer.calls] == [SWAP_A_FOR_B, SWAP_A_FOR_B]
+    assert [call.args for call in composer.calls] == [
+        [hop.amount_in, hop.amount_out * 9_970 // 10_000] for hop in route.hops
+    ]
+    assert SWAP_B_FOR_A not in [call.method for call in composer.calls]
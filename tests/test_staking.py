@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("algosdk")
+
+from smart_contracts.offchain.staking import (
+    MAX_STAKE_CHECKPOINTS,
+    min_balance_for_stakers,
+    stake_history_min_balance,
+    stake_payment,
+    staker_min_balance,
+)
+
+
+def test_full_history_is_counted_in_the_staker_min_balance():
+    # "k" + address key, 8-byte header and 63 16-byte checkpoints
+    assert stake_history_min_balance() == 2_500 + 400 * (33 + 8 + 63 * 16) == 422_100
+    assert staker_min_balance() == 31_700 + 422_100
+    assert min_balance_for_stakers(3) == 3 * 453_800
+
+
+def test_stake_payments_add_up_to_the_staker_min_balance():
+    # One stake per round until the history is full, then it stops growing
+    paid = stake_payment(has_record=False, checkpoints=0)
+    for checkpoints in range(1, MAX_STAKE_CHECKPOINTS + 1):
+        paid += stake_payment(has_record=True, checkpoints=checkpoints)
+    assert paid == staker_min_balance()
+    assert stake_payment(has_record=True, checkpoints=MAX_STAKE_CHECKPOINTS) == 0
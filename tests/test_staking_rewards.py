@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("algopy_testing")
+
+from algopy import Bytes, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.emoswapalgo.staking_rewards import (
+    SECONDS_PER_YEAR,
+    STAKE_HISTORY_PREFIX,
+    StakerRecord,
+    StakingRewards,
+)
+
+START = 1_700_000_000
+STAKED = 1_000_000
+
+
+@pytest.fixture()
+def context():
+    with algopy_testing_context() as context:
+        yield context
+
+
+def _record(staked: int) -> StakerRecord:
+    return StakerRecord(
+        arc4.UInt64(staked), arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0)
+    )
+
+
+@pytest.fixture()
+def setup(context: AlgopyTestContext):
+    contract = StakingRewards()
+    stakers = [context.any.account() for _ in range(2)]
+    for staker in stakers:
+        contract.stakers[staker] = _record(STAKED)
+    contract.total_staked.set(UInt64(len(stakers) * STAKED))
+    contract.last_update_time.set(UInt64(START))
+    return contract, stakers
+
+
+def _after_years(context: AlgopyTestContext, years: int) -> None:
+    context.ledger.patch_global_fields(latest_timestamp=START + years * SECONDS_PER_YEAR)
+
+
+def _addresses(stakers) -> arc4.DynamicArray[arc4.Address]:
+    return arc4.DynamicArray[arc4.Address](*(arc4.Address(staker) for staker in stakers))
+
+
+def test_compounded_rewards_stay_out_of_lp_stake(context, setup):
+    contract, stakers = setup
+    _after_years(context, 1)  # 10% a year
+
+    assert contract.compound_many(_addresses(stakers)) == 2 * STAKED // 10
+    for staker in stakers:
+        record = contract.stakers[staker]
+        assert record.staked.native == STAKED
+        assert record.compounded_rewards.native == STAKED // 10
+        assert record.accrued_rewards.native == 0
+        assert contract.get_pending_rewards(staker) == 0
+        # No stake history checkpoint is written, so no box grows
+        assert not context.ledger.box_exists(contract, Bytes(STAKE_HISTORY_PREFIX) + staker.bytes)
+    assert contract.total_staked.get() == 2 * STAKED
+
+
+def test_compounded_rewards_earn_like_stake(context, setup):
+    contract, stakers = setup
+    _after_years(context, 1)
+    contract.compound_many(_addresses(stakers[:1]))
+    _after_years(context, 2)
+
+    assert contract.get_pending_rewards(stakers[0]) == (STAKED + STAKED // 10) // 10
+    # The staker who never compounded keeps earning on their LP stake only
+    assert contract.get_pending_rewards(stakers[1]) == 2 * STAKED // 10
+
+
+def test_only_admin_compounds(context, setup):
+    contract, stakers = setup
+    with context.txn.create_group(active_txn_overrides={"sender": context.any.account()}):
+        with pytest.raises(AssertionError):
+            contract.compound_many(_addresses(stakers))
@@ -0,0 +1,56 @@
+import base64
+
+import pytest
+
+pytest.importorskip("algokit_utils")
+
+from smart_contracts.offchain.state import EmoswapalgoGlobalState, RegistryResolver
+
+REGISTRY = {
+    "admin": bytes(32),
+    "mood_token_id": 746157034,
+    "emotion_factory_id": 746159123,
+    "governance_id": 0,
+    "liquidity_pool_id": 0,
+    "staking_rewards_id": 1002,
+    "swap_pool_id": 1001,
+}
+
+
+class FakeAlgod:
+    """Serves a fixed registry global state at a fixed round"""
+
+    algod_address = "fake"
+
+    def __init__(self, state: dict[str, bytes | int]):
+        self.global_state = [
+            {
+                "key": base64.b64encode(key.encode()).decode(),
+                "value": {"type": 1, "bytes": base64.b64encode(value).decode()}
+                if isinstance(value, bytes)
+                else {"type": 2, "uint": value},
+            }
+            for key, value in state.items()
+        ]
+
+    def status(self) -> dict:
+        return {"last-round": 10}
+
+    def application_info(self, app_id: int) -> dict:
+        return {"params": {"global-state": self.global_state}}
+
+
+def test_from_raw_rejects_missing_keys():
+    state = dict(REGISTRY)
+    del state["swap_pool_id"]
+    with pytest.raises(KeyError, match="swap_pool_id"):
+        EmoswapalgoGlobalState.from_raw(state)
+
+
+def test_resolve_rejects_unknown_names_and_unset_ids():
+    resolver = RegistryResolver(FakeAlgod(REGISTRY), 1)
+    assert resolver.resolve("swap_pool_id") == 1001
+    with pytest.raises(KeyError):
+        resolver.resolve("lending_pool_id")
+    with pytest.raises(ValueError, match="governance_id"):
+        resolver.resolve("governance_id")
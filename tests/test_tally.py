@@ -0,0 +1,145 @@
+import base64
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("algosdk")
+
+from smart_contracts.offchain import tally
+from smart_contracts.offchain.tally import (
+    CREATE_PROPOSAL,
+    VOTE,
+    VOTE_MANY,
+    VOTE_NO,
+    VOTE_YES,
+    FileSource,
+    ProposalTally,
+    TallyAggregator,
+)
+
+APP_ID = 77
+ROUTER_ID = 78
+_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+def call(round: int, method, args: list, returned, app_id: int = APP_ID) -> dict:
+    """Indexer-shaped app call with ARC-4 encoded args and return log"""
+    encoded = [method.get_selector()] + [arg.type.encode(value) for arg, value in zip(method.args, args)]
+    return {
+        "confirmed-round": round,
+        "application-transaction": {
+            "application-id": app_id,
+            "application-args": [base64.b64encode(arg).decode() for arg in encoded],
+        },
+        "logs": [base64.b64encode(_RETURN_PREFIX + method.returns.type.encode(returned)).decode()],
+    }
+
+
+def create(round: int, proposal_id: int) -> dict:
+    return call(round, CREATE_PROPOSAL, [proposal_id], proposal_id)
+
+
+def vote(round: int, proposal_id: int, choice: int, weight: int) -> dict:
+    return call(round, VOTE, [proposal_id, choice], weight)
+
+
+def write_source(tmp_path: Path, txns: list[dict]) -> FileSource:
+    path = tmp_path / "txns.jsonl"
+    path.write_text("".join(json.dumps(txn) + "\n" for txn in txns))
+    return FileSource(path)
+
+
+TXNS = [
+    create(10, 1),
+    vote(11, 1, VOTE_YES, 100),
+    vote(11, 1, VOTE_NO, 30),
+    call(12, VOTE_MANY, [[(1, VOTE_YES), (2, VOTE_NO)]], [5, 7]),
+    vote(13, 1, VOTE_NO, 1),
+]
+
+
+def test_open_ended_stream_leaves_the_last_round_pending(tmp_path):
+    aggregator = TallyAggregator(APP_ID, tmp_path / "tally.json")
+    assert aggregator.refresh(write_source(tmp_path, TXNS)) == 4
+
+    assert aggregator.processed_round == 12
+    assert aggregator.tallies == {
+        1: ProposalTally(yes_votes=105, no_votes=30, voters=3),
+        2: ProposalTally(no_votes=7, voters=1),
+    }
+
+
+def test_through_round_flushes_the_last_round(tmp_path):
+    aggregator = TallyAggregator(APP_ID, tmp_path / "tally.json")
+    assert aggregator.refresh(write_source(tmp_path, TXNS), through_round=20) == 5
+
+    assert aggregator.processed_round == 20
+    assert aggregator.tallies[1] == ProposalTally(yes_votes=105, no_votes=31, voters=4)
+
+
+def test_overlapping_replay_does_not_double_count(tmp_path):
+    aggregator = TallyAggregator(APP_ID, tmp_path / "tally.json")
+    aggregator.consume(TXNS[:3], through_round=11)
+    aggregator.consume(TXNS, through_round=13)
+
+    assert aggregator.tallies[1] == ProposalTally(yes_votes=105, no_votes=31, voters=4)
+    assert aggregator.tallies[2] == ProposalTally(no_votes=7, voters=1)
+
+
+def test_inner_calls_and_other_apps_are_handled(tmp_path):
+    # A router's top-level call whose inner transaction votes on the app
+    routed = call(11, VOTE, [1, VOTE_YES], 40, app_id=ROUTER_ID)
+    inner = vote(0, 1, VOTE_YES, 40)
+    del inner["confirmed-round"]
+    routed["inner-txns"] = [inner]
+    other_app = vote(11, 1, VOTE_YES, 999) | {"application-transaction": {"application-id": ROUTER_ID}}
+
+    aggregator = TallyAggregator(APP_ID, tmp_path / "tally.json")
+    aggregator.refresh(write_source(tmp_path, [create(10, 1), routed, other_app]), through_round=11)
+    assert aggregator.tallies[1] == ProposalTally(yes_votes=40, voters=1)
+
+
+def test_resume_restores_totals(tmp_path):
+    path = tmp_path / "tally.json"
+    aggregator = TallyAggregator(APP_ID, path)
+    aggregator.consume(TXNS[:3], through_round=11)
+    aggregator.checkpoint()
+
+    resumed = TallyAggregator.resume(APP_ID, path)
+    assert resumed.processed_round == 11
+    assert resumed.tallies == aggregator.tallies
+    # Only later rounds are fetched and applied
+    assert resumed.refresh(write_source(tmp_path, TXNS), through_round=13) == 2
+    assert resumed.tallies[1] == ProposalTally(yes_votes=105, no_votes=31, voters=4)
+
+
+def test_resume_rejects_another_apps_checkpoint(tmp_path):
+    path = tmp_path / "tally.json"
+    TallyAggregator(APP_ID, path).checkpoint()
+    with pytest.raises(ValueError):
+        TallyAggregator.resume(APP_ID + 1, path)
+
+
+def test_resume_without_checkpoint_starts_from_scratch(tmp_path):
+    resumed = TallyAggregator.resume(APP_ID, tmp_path / "missing.json")
+    assert (resumed.processed_round, resumed.tallies) == (0, {})
+
+
+def test_checkpoint_is_replaced_every_checkpoint_every_rounds(tmp_path, monkeypatch):
+    replaced = []
+    real_replace = os.replace
+
+    def record_replace(source, destination):
+        real_replace(source, destination)
+        replaced.append(json.loads(Path(destination).read_text())["processed_round"])
+
+    monkeypatch.setattr(tally.os, "replace", record_replace)
+    path = tmp_path / "tally.json"
+    aggregator = TallyAggregator(APP_ID, path, checkpoint_every=2)
+    aggregator.consume([vote(round, 1, VOTE_YES, 1) for round in range(1, 8)], through_round=7)
+
+    assert replaced == [2, 4, 6]
+    assert not path.with_suffix(".json.tmp").exists()
+    assert TallyAggregator.resume(APP_ID, path).tallies[1].voters == 6
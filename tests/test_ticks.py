@@ -0,0 +1,181 @@
+import bisect
+import random
+
+import pytest
+
+pytest.importorskip("algosdk")
+pytest.importorskip("algokit_utils")
+
+from smart_contracts.offchain.ticks import (
+    MAX_TICK_INDEX,
+    TICK_BITMAP_WORDS,
+    TICK_OFFSET,
+    TICK_SPACING,
+    ConcentratedPoolSim,
+    PoolError,
+    TickBitmap,
+    amount_a_delta,
+    amount_b_delta,
+    tick_to_sqrt_price,
+)
+
+LIQUIDITY = 10**12
+OWNERS = ("alice", "bob", "carol")
+
+
+def random_tick(rng: random.Random, low: int = 0, high: int = MAX_TICK_INDEX) -> int:
+    return rng.randrange(low // TICK_SPACING, high // TICK_SPACING + 1) * TICK_SPACING
+
+
+def test_bitmap_search_matches_brute_force():
+    rng = random.Random(25)
+    for _ in range(50):
+        # Clustered layouts put several ticks in one word, spread ones leave empty words between
+        spread = rng.choice((640, 64 * 640, MAX_TICK_INDEX))
+        center = random_tick(rng)
+        ticks = sorted(
+            {
+                min(max(random_tick(rng, center - spread, center + spread), 0), MAX_TICK_INDEX)
+                for _ in range(rng.randrange(0, 40))
+            }
+            | set(rng.sample((0, 630, 640, MAX_TICK_INDEX), rng.randrange(0, 3)))
+        )
+        bitmap = TickBitmap()
+        for tick in ticks:
+            bitmap.set(tick, True)
+
+        queries = [random_tick(rng) + rng.randrange(TICK_SPACING) for _ in range(100)]
+        queries = [min(query, MAX_TICK_INDEX) for query in queries]
+        queries += [0, MAX_TICK_INDEX] + [edge + delta for edge in ticks for delta in (-1, 0, 1)]
+        for query in queries:
+            if not 0 <= query <= MAX_TICK_INDEX:
+                continue
+            position = bisect.bisect_right(ticks, query)
+            assert bitmap.next_above(query) == (ticks[position] if position < len(ticks) else None)
+            assert bitmap.next_at_or_below(query) == (ticks[position - 1] if position else None)
+
+
+def test_bitmap_round_trips_through_the_box_layout():
+    bitmap = TickBitmap()
+    for tick in (0, 630, 640, 12_340, MAX_TICK_INDEX):
+        bitmap.set(tick, True)
+    bitmap.set(630, False)
+    value = b"".join(word.to_bytes(8, "big") for word in bitmap.words)
+    assert len(value) == TICK_BITMAP_WORDS * 8 == 3456
+    decoded = TickBitmap.from_bytes(value)
+    assert decoded == bitmap
+    assert decoded.next_above(0) == 640
+    assert decoded.next_at_or_below(639) == 0
+
+
+def test_swaps_cross_every_boundary_both_ways():
+    pool = ConcentratedPoolSim.at_tick(TICK_OFFSET)
+    bounds = [TICK_OFFSET + TICK_SPACING + i * 64 * TICK_SPACING for i in range(5)]
+    for lower, upper in zip(bounds, bounds[1:]):
+        pool.mint("alice", lower, upper, LIQUIDITY)
+    assert pool.liquidity == 0  # Every range sits above the price
+
+    # Enough B, after the 0.3% fee, to buy out all but the last range, so the swap stops inside it
+    amount_b = (
+        amount_b_delta(LIQUIDITY, tick_to_sqrt_price(bounds[0]), tick_to_sqrt_price(bounds[-2]), True)
+        + 10**6
+    ) * 1000 // 997
+    amount_a = pool.swap(amount_b, a_for_b=False)
+    assert bounds[-2] <= pool.tick < bounds[-1]
+    assert tick_to_sqrt_price(bounds[-2]) < pool.sqrt_price < tick_to_sqrt_price(bounds[-1])
+    # Adjacent ranges hand the same liquidity over at each shared boundary
+    assert pool.liquidity == LIQUIDITY
+
+    # Selling the A back crosses the boundaries again; fees on both legs leave it in the first range
+    pool.swap(amount_a, a_for_b=True)
+    assert bounds[0] <= pool.tick < bounds[1]
+    assert pool.liquidity == LIQUIDITY
+
+    # Selling exactly the A left in range lands on the lower boundary and crosses out of it
+    needed = amount_a_delta(LIQUIDITY, tick_to_sqrt_price(bounds[0]), pool.sqrt_price, True)
+    amount_in = next(x for x in range(needed, 2 * needed) if x - x * 3 // 1000 == needed)
+    pool.swap(amount_in, a_for_b=True)
+    assert pool.sqrt_price == tick_to_sqrt_price(bounds[0])
+    assert pool.tick == bounds[0] - 1
+    assert pool.liquidity == 0
+
+    # Past the last range there is nothing to trade against, and the failure changes nothing
+    before = pool.copy()
+    with pytest.raises(PoolError):
+        pool.swap(1_000, a_for_b=True)
+    assert pool == before
+
+
+def assert_invariants(pool: ConcentratedPoolSim) -> None:
+    # The bitmap marks exactly the ticks some position starts or ends at
+    marked = {
+        (word_index * 64 + bit) * TICK_SPACING
+        for word_index, word in enumerate(pool.bitmap.words)
+        if word
+        for bit in range(64)
+        if word >> bit & 1
+    }
+    assert marked == set(pool.ticks)
+    for tick, info in pool.ticks.items():
+        assert info.liquidity_lower == sum(l for (_, lower, _), l in pool.positions.items() if lower == tick)
+        assert info.liquidity_upper == sum(l for (_, _, upper), l in pool.positions.items() if upper == tick)
+
+    # Active liquidity is that of the positions whose range holds `tick`
+    assert pool.liquidity == sum(
+        liquidity
+        for (_, lower, upper), liquidity in pool.positions.items()
+        if lower <= pool.tick < upper
+    )
+    # The lagging tick still orders every initialized tick against the price
+    for tick in pool.ticks:
+        if tick <= pool.tick:
+            assert tick_to_sqrt_price(tick) <= pool.sqrt_price
+        else:
+            assert tick_to_sqrt_price(tick) >= pool.sqrt_price
+
+    # Reserves cover every position's share, rounded in the positions' disfavour
+    owed_a = owed_b = 0
+    for (_, lower, upper), liquidity in pool.positions.items():
+        amount_a, amount_b, _in_range = pool.position_amounts(lower, upper, liquidity)
+        owed_a += amount_a
+        owed_b += amount_b
+    assert pool.reserve_a >= owed_a and pool.reserve_b >= owed_b
+
+
+def test_random_operations_keep_the_invariants():
+    rng = random.Random(2025)
+    pool = ConcentratedPoolSim.at_tick(TICK_OFFSET)
+    for _ in range(600):
+        before = pool.copy()
+        action = rng.random()
+        try:
+            if action < 0.4:
+                lower = random_tick(rng, TICK_OFFSET - 3000, TICK_OFFSET + 3000)
+                upper = lower + random_tick(rng, TICK_SPACING, 2000)
+                pool.mint(rng.choice(OWNERS), lower, upper, rng.randrange(1, LIQUIDITY))
+            elif action < 0.6 and pool.positions:
+                key = rng.choice(sorted(pool.positions))
+                pool.burn(*key, rng.randrange(1, pool.positions[key] + 1))
+            else:
+                pool.swap(rng.randrange(1, 10 ** rng.randrange(3, 13)), a_for_b=rng.random() < 0.5)
+        except PoolError:
+            # A rejected call leaves the pool exactly as it was
+            assert pool == before
+        assert_invariants(pool)
+
+
+def test_round_trip_swaps_never_profit():
+    rng = random.Random(7)
+    pool = ConcentratedPoolSim.at_tick(TICK_OFFSET)
+    for lower in range(TICK_OFFSET - 2000, TICK_OFFSET + 2000, 500):
+        pool.mint("alice", lower, lower + 1000, LIQUIDITY)
+    for _ in range(200):
+        amount_in = rng.randrange(1, 10**10)
+        a_for_b = rng.random() < 0.5
+        trial = pool.copy()
+        try:
+            amount_out = trial.swap(amount_in, a_for_b)
+            back = trial.swap(amount_out, not a_for_b)
+        except PoolError:
+            continue
+        assert back <= amount_in
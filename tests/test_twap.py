@@ -0,0 +1,59 @@
+import pytest
+
+from smart_contracts.offchain.twap import PRICE_SCALE, PriceObservation, twap
+
+_WORD = 2**64
+_MAX_PRICE = _WORD - 1
+
+
+def accumulate_words(
+    high: int, low: int, numerator: int, denominator: int, elapsed: int
+) -> tuple[int, int]:
+    """SwapPool._accumulate_price with explicit 64-bit words"""
+    price = numerator * PRICE_SCALE // denominator
+    if price >= _WORD:
+        price = _MAX_PRICE
+    term = price * elapsed
+    low_sum = low + term % _WORD
+    return (high + term // _WORD + low_sum // _WORD) % _WORD, low_sum % _WORD
+
+
+def test_from_abi_return_joins_high_and_low_words():
+    observation = PriceObservation.from_abi_return((1, 2, 3, 4, 5))
+    assert observation == PriceObservation(_WORD + 2, 3 * _WORD + 4, 5)
+
+
+def test_low_word_carry_reaches_the_high_word():
+    a_high, a_low = accumulate_words(0, _WORD - 5, 2, 1, 3600)
+    b_high, b_low = accumulate_words(0, _WORD - 7, 1, 2, 3600)
+    assert (a_high, b_high) == (1, 1)
+
+    start = PriceObservation.from_abi_return((0, _WORD - 5, 0, _WORD - 7, 1_000))
+    end = PriceObservation.from_abi_return((a_high, a_low, b_high, b_low, 4_600))
+    assert twap(start, end) == (2.0, 0.5)
+
+
+def test_long_window_at_high_price_is_exact():
+    # price * seconds far beyond 2**32: the old 64-bit accumulator wrapped here
+    reserve_a, reserve_b, window = 1, 10**6, 365 * 24 * 3600
+    high, low = accumulate_words(0, 0, reserve_b, reserve_a, window)
+    inverse_high, inverse_low = accumulate_words(0, 0, reserve_a, reserve_b, window)
+    assert high > 0
+
+    start = PriceObservation(0, 0, 0)
+    end = PriceObservation.from_abi_return((high, low, inverse_high, inverse_low, window))
+    price_a, price_b = twap(start, end)
+    assert price_a == pytest.approx(10**6)
+    assert price_b == pytest.approx(1e-6, rel=1e-3)
+
+
+def test_price_above_range_saturates():
+    high, low = accumulate_words(0, 0, 2**40, 1, 10)
+    end = PriceObservation.from_abi_return((high, low, 0, 0, 10))
+    assert twap(PriceObservation(0, 0, 0), end)[0] == pytest.approx(_MAX_PRICE / PRICE_SCALE)
+
+
+def test_end_must_follow_start():
+    observation = PriceObservation(0, 0, 100)
+    with pytest.raises(ValueError):
+        twap(observation, observation)
@@ -0,0 +1,71 @@
+import pytest
+
+pytest.importorskip("algopy_testing")
+
+from algopy import Bytes, UInt64
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.emoswapalgo.contract import Emoswapalgo
+
+AMOUNT_A = 1_000_000
+
+
+@pytest.fixture()
+def context():
+    with algopy_testing_context() as context:
+        yield context
+
+
+@pytest.fixture()
+def setup(context: AlgopyTestContext):
+    asset_a = context.any.asset()
+    swap_pool = context.any.application()
+    staking = context.any.application()
+    context.ledger.set_global_state(swap_pool, Bytes(b"asset_a"), asset_a.id)
+
+    contract = Emoswapalgo()
+    contract.set_swap_pool_id(swap_pool.id)
+    contract.set_staking_rewards_id(staking.id)
+    mbr_payment = context.any.txn.payment(
+        sender=context.default_sender, receiver=staking.address, amount=UInt64(57_000)
+    )
+    return contract, asset_a, swap_pool, mbr_payment
+
+
+def _deposit(context: AlgopyTestContext, asset, receiver, sender=None, amount=AMOUNT_A):
+    return context.any.txn.asset_transfer(
+        sender=sender or context.default_sender,
+        asset_receiver=receiver,
+        xfer_asset=asset,
+        asset_amount=UInt64(amount),
+    )
+
+
+def test_deposit_from_another_account_fails(context, setup):
+    contract, asset_a, swap_pool, mbr_payment = setup
+    # Someone else's transfer cannot fund the caller's zap
+    deposit = _deposit(context, asset_a, swap_pool.address, sender=context.any.account())
+    with pytest.raises(AssertionError):
+        contract.zap_into_farm(deposit, mbr_payment, UInt64(AMOUNT_A // 2))
+
+
+def test_deposit_that_skips_the_pool_fails(context, setup):
+    contract, asset_a, _swap_pool, mbr_payment = setup
+    deposit = _deposit(context, asset_a, context.any.account())
+    with pytest.raises(AssertionError):
+        contract.zap_into_farm(deposit, mbr_payment, UInt64(AMOUNT_A // 2))
+
+
+def test_deposit_of_another_asset_fails(context, setup):
+    contract, _asset_a, swap_pool, mbr_payment = setup
+    deposit = _deposit(context, context.any.asset(), swap_pool.address)
+    with pytest.raises(AssertionError):
+        contract.zap_into_farm(deposit, mbr_payment, UInt64(AMOUNT_A // 2))
+
+
+def test_swap_amount_is_bounded_by_what_was_deposited(context, setup):
+    contract, asset_a, swap_pool, mbr_payment = setup
+    # The old signature trusted a caller-supplied amount; only the deposit counts now
+    deposit = _deposit(context, asset_a, swap_pool.address, amount=10)
+    with pytest.raises(AssertionError):
+        contract.zap_into_farm(deposit, mbr_payment, UInt64(AMOUNT_A // 2))